@@ -4,6 +4,13 @@
 # Caso: Encontrar ruta de A a D
 # ================================================================
 
+import heapq
+
+from fronteras import Cola, Pila
+from grafo_csr import como_csr
+from red_social_busqueda import reconstruir_ruta
+from trazas import TrazaConsola
+
 # ==================================================
 # DEFINICIÓN DEL GRAFO (Red Social)
 # ==================================================
@@ -13,6 +20,7 @@ def crear_grafo():
     Crea el grafo de la red social con las conexiones y costos.
     Estructura: diccionario donde cada nodo tiene lista de tuplas (vecino, costo).
     Los vecinos están ordenados alfabéticamente según las especificaciones.
+    Los algoritmos también aceptan la versión CSR (como_csr(crear_grafo())).
     """
     grafo = {
         'A': [('B', 2), ('C', 4), ('D', 6)],
@@ -32,7 +40,7 @@ def crear_grafo():
 # ALGORITMO 1: BÚSQUEDA PRIMERO EN ANCHURA (BPA)
 # ==================================================
 
-def bpa(grafo, inicio, objetivo):
+def bpa(grafo, inicio, objetivo, traza=None):
     """
     Búsqueda Primero en Anchura (Breadth-First Search)
     
@@ -44,80 +52,65 @@ def bpa(grafo, inicio, objetivo):
     - Optimalidad: Sí (si costos unitarios)
     - Complejidad tiempo: O(b^d)
     - Complejidad espacio: O(b^d)
+    
+    `traza` recibe los eventos de la búsqueda (ver trazas.py); con
+    TrazaConsola() se muestra el proceso paso a paso.
     """
-    print("\n" + "="*70)
-    print("ALGORITMO: BÚSQUEDA PRIMERO EN ANCHURA (BPA)")
-    print("="*70)
-    print("\nCARACTERÍSTICAS:")
-    print("- Estructura: Cola FIFO (First In, First Out)")
-    print("- Estrategia: Expandir el nodo MENOS profundo")
-    print("- Orden de encolado: Lexicográfico (A, B, C, ...)")
-    print("\n" + "-"*70)
-    
-    # Cola FIFO: cada elemento es (nodo_actual, camino_recorrido, costo_acumulado)
-    cola = [(inicio, [inicio], 0)]
+    g = como_csr(grafo)
+    etq = g.etiquetas
+    origen = g.id_de(inicio)
+    if traza is not None:
+        traza.on_start('BPA', g, inicio, objetivo)
+    
+    # Cola FIFO de nodos (IDs enteros del grafo CSR) con pertenencia O(1).
+    # Un nodo ya encolado no se vuelve a encolar: el primero en entrar es
+    # el primero en salir, así que el orden de visita no cambia.
+    # En vez de copiar el camino en cada entrada se guarda solo el padre
+    # y la ruta se reconstruye al final (reconstruir_ruta).
+    cola = Cola([origen])
+    parent = {origen: None}
     visitados = set()
     orden_visita = []
-    paso = 0
-    
-    print("\nPROCESO DE BÚSQUEDA:\n")
     
     while cola:
-        paso += 1
-        # Mostrar estado de la cola antes de decolar
-        print(f"Paso {paso}:")
-        print(f"  Cola: {[nodo for nodo, _, _ in cola]}")
-        
         # DECOLAR: Extraer el primer elemento (FIFO)
-        nodo_actual, camino, costo_acum = cola.pop(0)
-        
-        print(f"  → Decolando: {nodo_actual}")
-        print(f"  → Camino hasta {nodo_actual}: {' → '.join(camino)}")
+        nodo_actual = cola.decolar()
         
         # Registrar visita
-        if nodo_actual not in visitados:
-            orden_visita.append(nodo_actual)
-            print(f"  → Nodo visitado: {nodo_actual}")
-            
-            # ¿Es el objetivo?
-            if nodo_actual == objetivo:
-                print(f"\n  ✓ ¡OBJETIVO ENCONTRADO EN {nodo_actual}!")
-                print("-"*70)
-                print("\nRESULTADO:")
-                print(f"  Orden de visita: {' → '.join(orden_visita)}")
-                print(f"  Ruta más corta: {' → '.join(camino)}")
-                print(f"  Número de pasos: {len(camino) - 1}")
-                print(f"  Costo total (unitario): {len(camino) - 1}")
-                return camino, orden_visita
-            
-            # Marcar como visitado
-            visitados.add(nodo_actual)
-            
-            # ENCOLAR vecinos (en orden lexicográfico)
-            vecinos_agregados = []
-            for vecino, costo in grafo[nodo_actual]:
-                if vecino not in visitados:
-                    nuevo_camino = camino + [vecino]
-                    nuevo_costo = costo_acum + costo
-                    cola.append((vecino, nuevo_camino, nuevo_costo))
-                    vecinos_agregados.append(vecino)
-            
-            if vecinos_agregados:
-                print(f"  → Encolando vecinos: {vecinos_agregados}")
-        else:
-            print(f"  → Nodo {nodo_actual} ya visitado, se omite")
+        orden_visita.append(etq[nodo_actual])
+        if traza is not None:
+            traza.on_dequeue(nodo_actual, None, cola, parent)
+        
+        # ¿Es el objetivo?
+        if etq[nodo_actual] == objetivo:
+            ruta = reconstruir_ruta(parent, nodo_actual)
+            if traza is not None:
+                traza.on_goal(nodo_actual, len(ruta) - 1, ruta, orden_visita)
+            return g.etiquetar(ruta), orden_visita
+        
+        # Marcar como visitado
+        visitados.add(nodo_actual)
+        
+        # ENCOLAR vecinos (en orden lexicográfico)
+        for vecino in g.vecinos(nodo_actual):
+            if vecino not in visitados and vecino not in cola:
+                parent[vecino] = nodo_actual
+                cola.encolar(vecino)
+                if traza is not None:
+                    traza.on_enqueue(vecino, None, nodo_actual)
         
-        print()
+        if traza is not None:
+            traza.on_expand(nodo_actual)
     
-    print("\n✗ No se encontró camino al objetivo")
-    print("-"*70)
+    if traza is not None:
+        traza.on_fail(orden_visita)
     return None, orden_visita
 
 # ==================================================
 # ALGORITMO 2: BÚSQUEDA PRIMERO EN PROFUNDIDAD (BPP)
 # ==================================================
 
-def bpp(grafo, inicio, objetivo):
+def bpp(grafo, inicio, objetivo, traza=None):
     """
     Búsqueda Primero en Profundidad (Depth-First Search)
     
@@ -129,84 +122,61 @@ def bpp(grafo, inicio, objetivo):
     - Optimalidad: No
     - Complejidad tiempo: O(b^m)
     - Complejidad espacio: O(bm) - lineal
+    
+    `traza` recibe los eventos de la búsqueda (ver trazas.py).
     """
-    print("\n" + "="*70)
-    print("ALGORITMO: BÚSQUEDA PRIMERO EN PROFUNDIDAD (BPP)")
-    print("="*70)
-    print("\nCARACTERÍSTICAS:")
-    print("- Estructura: Pila LIFO (Last In, First Out)")
-    print("- Estrategia: Expandir el nodo MÁS profundo")
-    print("- Orden de apilado: Lexicográfico INVERSO (para que salgan en orden)")
-    print("\n" + "-"*70)
-    
-    # Pila LIFO: solo nodos (simplificado)
-    pila = [inicio]
+    g = como_csr(grafo)
+    etq = g.etiquetas
+    origen = g.id_de(inicio)
+    if traza is not None:
+        traza.on_start('BPP', g, inicio, objetivo)
+    
+    # Pila LIFO: solo nodos (IDs enteros del grafo CSR) con pertenencia O(1).
+    # Se guarda el padre de cada nodo en vez de una copia del camino.
+    pila = Pila([origen])
     visitados_lista = []
     visitados_set = set()
-    camino_dict = {inicio: [inicio]}
-    paso = 0
-    
-    print("\nPROCESO DE BÚSQUEDA:\n")
+    parent = {origen: None}
     
     while pila:
-        paso += 1
-        # Mostrar estado de la pila antes de desapilar
-        print(f"Paso {paso}:")
-        print(f"  Pila: {pila}")
-        
         # DESAPILAR: Extraer el último elemento (LIFO)
-        nodo_actual = pila.pop()
-        
-        # Verificar si ya fue visitado
-        if nodo_actual in visitados_set:
-            print(f"  → {nodo_actual} ya visitado, se omite\n")
-            continue
+        # (un nodo entra a la pila una sola vez, así que nunca está visitado)
+        nodo_actual = pila.desapilar()
         
         # Marcar como visitado
-        visitados_lista.append(nodo_actual)
+        visitados_lista.append(etq[nodo_actual])
         visitados_set.add(nodo_actual)
-        camino = camino_dict[nodo_actual]
-        
-        print(f"  → Desapilando y visitando: {nodo_actual}")
-        print(f"  → Camino hasta {nodo_actual}: {' → '.join(camino)}")
-        print(f"  → Nodo visitado: {nodo_actual}")
+        if traza is not None:
+            traza.on_dequeue(nodo_actual, None, pila, parent)
         
         # ¿Es el objetivo?
-        if nodo_actual == objetivo:
-            print(f"\n  ✓ ¡OBJETIVO ENCONTRADO EN {nodo_actual}!")
-            print("-"*70)
-            print("\nRESULTADO:")
-            print(f"  Orden de visita: {' → '.join(visitados_lista)}")
-            print(f"  Ruta encontrada: {' → '.join(camino)}")
-            print(f"  Número de pasos: {len(camino) - 1}")
-            print(f"  NOTA: Esta NO es necesariamente la ruta más corta")
-            return camino, visitados_lista
+        if etq[nodo_actual] == objetivo:
+            ruta = reconstruir_ruta(parent, nodo_actual)
+            if traza is not None:
+                traza.on_goal(nodo_actual, len(ruta) - 1, ruta, visitados_lista)
+            return g.etiquetar(ruta), visitados_lista
         
-        # APILAR vecinos en orden INVERSO (para que salgan en orden alfabético)
-        vecinos = grafo[nodo_actual]
-        vecinos_agregados = []
-        
-        # Obtener vecinos no visitados y no en pila
-        for vecino, costo in reversed(vecinos):
+        # APILAR vecinos no visitados y no en pila, en orden INVERSO
+        # (para que salgan en orden alfabético)
+        for vecino in g.vecinos_inverso(nodo_actual):
             if vecino not in visitados_set and vecino not in pila:
-                pila.append(vecino)
-                camino_dict[vecino] = camino + [vecino]
-                vecinos_agregados.append(vecino)
-        
-        if vecinos_agregados:
-            print(f"  → Apilando vecinos (orden inverso): {list(reversed(vecinos_agregados))}")
+                pila.apilar(vecino)
+                parent[vecino] = nodo_actual
+                if traza is not None:
+                    traza.on_enqueue(vecino, None, nodo_actual)
         
-        print()
+        if traza is not None:
+            traza.on_expand(nodo_actual)
     
-    print("\n✗ No se encontró camino al objetivo")
-    print("-"*70)
+    if traza is not None:
+        traza.on_fail(visitados_lista)
     return None, visitados_lista
 
 # ==================================================
 # ALGORITMO 3: BÚSQUEDA DE COSTO UNIFORME (CU)
 # ==================================================
 
-def cu(grafo, inicio, objetivo):
+def cu(grafo, inicio, objetivo, traza=None):
     """
     Búsqueda de Costo Uniforme (Uniform Cost Search)
     
@@ -218,96 +188,66 @@ def cu(grafo, inicio, objetivo):
     - Optimalidad: Sí
     - Complejidad tiempo: O(b^(C*/ε))
     - Complejidad espacio: O(b^(C*/ε))
+    
+    `traza` recibe los eventos de la búsqueda (ver trazas.py).
     """
-    print("\n" + "="*70)
-    print("ALGORITMO: BÚSQUEDA DE COSTO UNIFORME (CU)")
-    print("="*70)
-    print("\nCARACTERÍSTICAS:")
-    print("- Estructura: Cola de prioridad ordenada por COSTO g(n)")
-    print("- Estrategia: Expandir el nodo de MENOR COSTO acumulado")
-    print("- Orden: Por costo acumulado (desempate lexicográfico)")
-    print("\n" + "-"*70)
-    
-    # Cola de prioridad: lista de (costo_acumulado, nodo_actual, camino_recorrido)
-    cola_prioridad = [(0, inicio, [inicio])]
+    g = como_csr(grafo)
+    etq = g.etiquetas
+    origen = g.id_de(inicio)
+    if traza is not None:
+        traza.on_start('CU', g, inicio, objetivo)
+    
+    # Cola de prioridad: heap binario de (costo_acumulado, nodo).
+    # Los nodos son IDs del CSR, cuyo orden es el lexicográfico de las
+    # etiquetas, así que el desempate sigue siendo (costo, nombre).
+    # - mejor_costo: nodos en la frontera y su mejor g(n) (decrease-key
+    #   perezoso, igual que frontier_best en uniform_cost_search)
+    # - parent: padre de cada nodo para reconstruir la ruta al final
+    cola_prioridad = [(0, origen)]
+    mejor_costo = {origen: 0}
+    parent = {origen: None}
     visitados = set()
     orden_visita = []
-    paso = 0
-    
-    print("\nPROCESO DE BÚSQUEDA:\n")
     
-    while cola_prioridad:
-        paso += 1
-        # Ordenar por costo acumulado (y alfabéticamente en caso de empate)
-        cola_prioridad.sort(key=lambda x: (x[0], x[1]))
+    while mejor_costo:
+        # Extraer nodo con menor costo (deleteMin), saltando las entradas
+        # que quedaron obsoletas por un decrease-key
+        costo_actual, nodo_actual = heapq.heappop(cola_prioridad)
+        while mejor_costo.get(nodo_actual) != costo_actual:
+            costo_actual, nodo_actual = heapq.heappop(cola_prioridad)
+        del mejor_costo[nodo_actual]
         
-        # Mostrar estado de la cola de prioridad
-        print(f"Paso {paso}:")
-        print(f"  Cola de prioridad:")
-        for costo, nodo, _ in cola_prioridad[:5]:  # Mostrar primeros 5
-            print(f"    {nodo}({costo})", end=" ")
-        if len(cola_prioridad) > 5:
-            print(f"... ({len(cola_prioridad)-5} más)")
-        else:
-            print()
+        orden_visita.append(etq[nodo_actual])
+        if traza is not None:
+            traza.on_dequeue(nodo_actual, costo_actual, mejor_costo, parent)
         
-        # Extraer nodo con menor costo
-        costo_actual, nodo_actual, camino = cola_prioridad.pop(0)
+        # ¿Es el objetivo?
+        if etq[nodo_actual] == objetivo:
+            ruta = reconstruir_ruta(parent, nodo_actual)
+            if traza is not None:
+                traza.on_goal(nodo_actual, costo_actual, ruta, orden_visita)
+            return g.etiquetar(ruta), costo_actual, orden_visita
         
-        print(f"  → Expandiendo: {nodo_actual} con costo acumulado g({nodo_actual})={costo_actual}")
-        print(f"  → Camino: {' → '.join(camino)}")
+        # Marcar como visitado
+        visitados.add(nodo_actual)
         
-        # Verificar si ya fue visitado
-        if nodo_actual not in visitados:
-            orden_visita.append(nodo_actual)
-            print(f"  → Nodo visitado: {nodo_actual}")
-            
-            # ¿Es el objetivo?
-            if nodo_actual == objetivo:
-                print(f"\n  ✓ ¡OBJETIVO ENCONTRADO EN {nodo_actual}!")
-                print("-"*70)
-                print("\nRESULTADO:")
-                print(f"  Orden de visita: {' → '.join(orden_visita)}")
-                print(f"  Ruta de menor costo: {' → '.join(camino)}")
-                print(f"  Número de pasos: {len(camino) - 1}")
-                print(f"  Costo total óptimo: {costo_actual}")
-                
-                # Mostrar desglose de costos
-                print(f"\n  Desglose de costos:")
-                costo_parcial = 0
-                for i in range(len(camino) - 1):
-                    nodo_origen = camino[i]
-                    nodo_destino = camino[i+1]
-                    # Buscar el costo de la arista
-                    for vecino, costo in grafo[nodo_origen]:
-                        if vecino == nodo_destino:
-                            costo_parcial += costo
-                            print(f"    {nodo_origen} → {nodo_destino}: {costo} (acumulado: {costo_parcial})")
-                            break
-                
-                return camino, costo_actual, orden_visita
-            
-            # Marcar como visitado
-            visitados.add(nodo_actual)
-            
-            # Agregar vecinos con su costo acumulado
-            vecinos_agregados = []
-            for vecino, costo_arista in grafo[nodo_actual]:
-                if vecino not in visitados:
-                    nuevo_costo = costo_actual + costo_arista
-                    nuevo_camino = camino + [vecino]
-                    cola_prioridad.append((nuevo_costo, vecino, nuevo_camino))
-                    vecinos_agregados.append(f"{vecino}({nuevo_costo})")
-            
-            if vecinos_agregados:
-                print(f"  → Agregando vecinos: {', '.join(vecinos_agregados)}")
-        else:
-            print(f"  → Nodo {nodo_actual} ya visitado, se omite")
+        # Agregar vecinos con su costo acumulado (o mejorar su costo)
+        for vecino, costo_arista in g.aristas(nodo_actual):
+            if vecino in visitados:
+                continue
+            nuevo_costo = costo_actual + costo_arista
+            if vecino not in mejor_costo or nuevo_costo < mejor_costo[vecino]:
+                mejor_costo[vecino] = nuevo_costo
+                parent[vecino] = nodo_actual
+                heapq.heappush(cola_prioridad, (nuevo_costo, vecino))
+                if traza is not None:
+                    traza.on_enqueue(vecino, nuevo_costo, nodo_actual)
         
-        print()
+        if traza is not None:
+            traza.on_expand(nodo_actual)
     
-    print("\n✗ No se encontró camino al objetivo")
-    print("-"*70)
+    if traza is not None:
+        traza.on_fail(orden_visita)
     return None, float('inf'), orden_visita
 
 # ==================================================
@@ -369,8 +309,9 @@ def main():
     for linea in conexiones:
         print(f"  {linea}")
     
-    # Crear el grafo
+    # Crear el grafo (y su versión CSR, construida una sola vez)
     grafo = crear_grafo()
+    red = como_csr(grafo)
     
     # Verificar si se pasaron argumentos de línea de comandos
     if len(sys.argv) >= 3:
@@ -430,7 +371,7 @@ def main():
     print("   (Cada conexión cuenta como 1 paso)")
     
     input("\n⏸️  Presiona ENTER para ejecutar BPA...")
-    camino_bpa, orden_bpa = bpa(grafo, inicio, objetivo)
+    camino_bpa, orden_bpa = bpa(red, inicio, objetivo, TrazaConsola())
     
     # ==================================================
     # PREGUNTA 2: BPP - Exploración en profundidad
@@ -441,7 +382,7 @@ def main():
     print("\n❓ ¿Qué ocurre si exploro en profundidad antes de considerar costos?")
     
     input("\n⏸️  Presiona ENTER para ejecutar BPP...")
-    camino_bpp, orden_bpp = bpp(grafo, inicio, objetivo)
+    camino_bpp, orden_bpp = bpp(red, inicio, objetivo, TrazaConsola())
     
     # ==================================================
     # PREGUNTA 3: CU - Ruta de menor costo
@@ -453,7 +394,7 @@ def main():
     print("   (Considerando el número de interacciones entre amigos)")
     
     input("\n⏸️  Presiona ENTER para ejecutar CU...")
-    camino_cu, costo_cu, orden_cu = cu(grafo, inicio, objetivo)
+    camino_cu, costo_cu, orden_cu = cu(red, inicio, objetivo, TrazaConsola())
     
     # ==================================================
     # RESUMEN COMPARATIVO FINAL
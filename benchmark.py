@@ -0,0 +1,206 @@
+# ------------------------------------------------------------
+# Benchmark de las búsquedas sobre redes sociales sintéticas
+# - Genera grafos reproducibles (BA / ER / WS, ver generadores_grafos)
+#   de 1e3 a 1e7 aristas y mide, para un conjunto fijo de consultas:
+#     breadth_first_search, depth_first_search, uniform_cost_search
+#     Opcion2.bpa, Opcion2.bpp, Opcion2.cu  (sin traza)
+#   tiempo, pico de memoria (tracemalloc, en una corrida aparte para no
+#   inflar el tiempo) y nodos expandidos (largo del orden de visita).
+# - Escribe un JSON con el entorno, cada medición y un resumen
+#   (mediana por modelo / tamaño / algoritmo). Con --comparar se
+#   contrasta contra un JSON anterior y se marcan las regresiones.
+#
+# Uso: python benchmark.py [-o resultados.json] [--tamanos 1e3,1e4,1e5]
+#                          [--modelos BA,ER,WS] [--consultas 5] [--repeticiones 3]
+#                          [--semilla 0]
+#                          [--sin-memoria] [--comparar base.json]
+# ------------------------------------------------------------
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import Opcion2
+from generadores_grafos import generar
+from red_social_busqueda import breadth_first_search, depth_first_search, uniform_cost_search
+
+
+def _objetivo(t):
+    return lambda s: s == t
+
+
+# Cada algoritmo: (g, inicio, objetivo) -> (ok, expandidos)
+ALGORITMOS_BENCHMARK = {
+    "breadth_first_search": lambda g, s, t: _original(breadth_first_search(s, _objetivo(t), g)),
+    "depth_first_search": lambda g, s, t: _original(depth_first_search(s, _objetivo(t), g)),
+    "uniform_cost_search": lambda g, s, t: _original(uniform_cost_search(s, _objetivo(t), g)),
+    "Opcion2.bpa": lambda g, s, t: _opcion2(Opcion2.bpa(g, s, t)),
+    "Opcion2.bpp": lambda g, s, t: _opcion2(Opcion2.bpp(g, s, t)),
+    "Opcion2.cu": lambda g, s, t: _opcion2(Opcion2.cu(g, s, t)),
+}
+
+
+def _original(resultado):
+    return resultado[0], len(resultado[1])
+
+
+def _opcion2(resultado):
+    return resultado[0] is not None, len(resultado[-1])
+
+
+def medir(algoritmo, g, inicio, objetivo, memoria=True, repeticiones=3):
+    """
+    Una medición: dict con tiempo_s (el mejor de `repeticiones` corridas),
+    memoria_pico_bytes, expandidos y ok.
+    """
+    correr = ALGORITMOS_BENCHMARK[algoritmo]
+    tiempo = float("inf")
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        ok, expandidos = correr(g, inicio, objetivo)
+        tiempo = min(tiempo, time.perf_counter() - t0)
+
+    pico = None
+    if memoria:
+        tracemalloc.start()
+        try:
+            correr(g, inicio, objetivo)
+            pico = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return {"tiempo_s": tiempo, "memoria_pico_bytes": pico, "expandidos": expandidos, "ok": ok}
+
+
+def correr_benchmark(tamanos=(1000, 10000, 100000), modelos=("BA", "ER", "WS"),
+                     algoritmos=None, consultas=5, semilla=0, memoria=True, repeticiones=3,
+                     progreso=None):
+    """Corre todas las combinaciones y devuelve el dict de resultados."""
+    algoritmos = list(algoritmos or ALGORITMOS_BENCHMARK)
+    mediciones = []
+    grafos = []
+    for modelo in modelos:
+        for aristas in tamanos:
+            t0 = time.perf_counter()
+            g = generar(modelo, aristas, semilla)
+            generacion = time.perf_counter() - t0
+            grafos.append({"modelo": modelo, "aristas": aristas, "nodos": g.num_nodos,
+                           "arcos": g.num_arcos, "generacion_s": generacion})
+
+            rng = random.Random(semilla)
+            pares = [(g.etiquetas[rng.randrange(g.num_nodos)], g.etiquetas[rng.randrange(g.num_nodos)])
+                     for _ in range(consultas)]
+            for algoritmo in algoritmos:
+                for k, (inicio, objetivo) in enumerate(pares):
+                    medicion = medir(algoritmo, g, inicio, objetivo, memoria, repeticiones)
+                    medicion.update(modelo=modelo, aristas=aristas, algoritmo=algoritmo,
+                                    consulta=k, inicio=inicio, objetivo=objetivo)
+                    mediciones.append(medicion)
+                if progreso is not None:
+                    progreso(f"{modelo} {aristas:>9} {algoritmo:<22} listo")
+
+    return {
+        "entorno": {
+            "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "semilla": semilla,
+            "consultas": consultas,
+            "repeticiones": repeticiones,
+        },
+        "grafos": grafos,
+        "mediciones": mediciones,
+        "resumen": resumir(mediciones),
+    }
+
+
+def resumir(mediciones):
+    """Medianas por (modelo, aristas, algoritmo)."""
+    grupos = {}
+    for m in mediciones:
+        grupos.setdefault((m["modelo"], m["aristas"], m["algoritmo"]), []).append(m)
+    resumen = []
+    for (modelo, aristas, algoritmo), grupo in grupos.items():
+        picos = [m["memoria_pico_bytes"] for m in grupo if m["memoria_pico_bytes"] is not None]
+        resumen.append({
+            "modelo": modelo,
+            "aristas": aristas,
+            "algoritmo": algoritmo,
+            "tiempo_mediana_s": statistics.median(m["tiempo_s"] for m in grupo),
+            "memoria_mediana_bytes": statistics.median(picos) if picos else None,
+            "expandidos_mediana": statistics.median(m["expandidos"] for m in grupo),
+        })
+    return resumen
+
+
+def comparar(base, nuevo, tolerancia=0.10):
+    """
+    Compara los resúmenes de dos corridas. Devuelve una fila por
+    combinación presente en ambas, con la razón nuevo/base del tiempo y
+    de la memoria, y `regresion` = True si alguna empeoró más que `tolerancia`.
+    """
+    anteriores = {(r["modelo"], r["aristas"], r["algoritmo"]): r for r in base["resumen"]}
+    filas = []
+    for r in nuevo["resumen"]:
+        b = anteriores.get((r["modelo"], r["aristas"], r["algoritmo"]))
+        if b is None:
+            continue
+        razon_tiempo = r["tiempo_mediana_s"] / b["tiempo_mediana_s"] if b["tiempo_mediana_s"] else None
+        razon_memoria = None
+        if r["memoria_mediana_bytes"] and b["memoria_mediana_bytes"]:
+            razon_memoria = r["memoria_mediana_bytes"] / b["memoria_mediana_bytes"]
+        regresion = any(razon is not None and razon > 1 + tolerancia
+                        for razon in (razon_tiempo, razon_memoria))
+        filas.append({"modelo": r["modelo"], "aristas": r["aristas"], "algoritmo": r["algoritmo"],
+                      "razon_tiempo": razon_tiempo, "razon_memoria": razon_memoria,
+                      "regresion": regresion})
+    return filas
+
+
+def _numeros(texto):
+    return [int(float(x)) for x in texto.split(",") if x]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de BPA / BPP / CU sobre grafos sintéticos.")
+    parser.add_argument("-o", "--salida", default="benchmark.json", help="archivo JSON de resultados")
+    parser.add_argument("--tamanos", type=_numeros, default=[1000, 10000, 100000],
+                        help="aristas por grafo, separadas por coma (p. ej. 1e3,1e5,1e7)")
+    parser.add_argument("--modelos", default="BA,ER,WS", help="modelos separados por coma")
+    parser.add_argument("--consultas", type=int, default=5, help="consultas por grafo")
+    parser.add_argument("--repeticiones", type=int, default=3, help="corridas por medición (se toma la mejor)")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--sin-memoria", action="store_true", help="no medir el pico de memoria")
+    parser.add_argument("--comparar", help="JSON de una corrida anterior")
+    parser.add_argument("--tolerancia", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    resultados = correr_benchmark(args.tamanos, args.modelos.split(","), consultas=args.consultas,
+                                  semilla=args.semilla, memoria=not args.sin_memoria,
+                                  repeticiones=args.repeticiones,
+                                  progreso=lambda texto: print(texto, file=sys.stderr))
+    with open(args.salida, "w", encoding="utf-8") as archivo:
+        json.dump(resultados, archivo, indent=1, ensure_ascii=False)
+    print(f"Resultados en {args.salida}")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+        regresiones = 0
+        for fila in comparar(base, resultados, args.tolerancia):
+            marca = "REGRESIÓN" if fila["regresion"] else ""
+            memoria = "-" if fila["razon_memoria"] is None else f"{fila['razon_memoria']:.2f}x"
+            tiempo = "-" if fila["razon_tiempo"] is None else f"{fila['razon_tiempo']:.2f}x"
+            print(f"{fila['modelo']} {fila['aristas']:>9} {fila['algoritmo']:<22} "
+                  f"tiempo {tiempo:>7}  memoria {memoria:>7}  {marca}")
+            regresiones += fila["regresion"]
+        sys.exit(1 if regresiones else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+# ------------------------------------------------------------
+# Búsquedas bidireccionales (consultas punto a punto inicio -> objetivo)
+# - BPA bidireccional: expande por niveles desde el inicio y desde el
+#   objetivo (siempre el lado con frontera más chica) hasta que se
+#   tocan. En redes de "mundo pequeño" explora dos bolas de radio ~d/2
+#   en vez de una de radio d.
+# - CU bidireccional: dos Dijkstra alternados. Se guarda mu = mejor
+#   costo de un camino completo visto hasta ahora y se para cuando
+#   min(frontera_ida) + min(frontera_vuelta) >= mu, lo que garantiza
+#   que mu es el costo óptimo.
+# - Devuelven la misma forma que breadth_first_search /
+#   uniform_cost_search: (ok, orden_visita, ruta[, costo]).
+#   La ruta tiene el mismo largo / costo, pero ante empates puede ser
+#   otra ruta óptima distinta de la de la búsqueda unidireccional.
+# - El lado "vuelta" recorre `red_inversa` (por defecto la misma red,
+#   porque la red social es no dirigida).
+# ------------------------------------------------------------
+
+import heapq
+
+from red_social_busqueda import resolver_red, reconstruir_ruta
+
+
+def _unir_rutas(g, parent_ida, parent_vuelta, encuentro):
+    ida = reconstruir_ruta(parent_ida, encuentro)
+    vuelta = reconstruir_ruta(parent_vuelta, encuentro)
+    vuelta.reverse()
+    return g.etiquetar(ida + vuelta[1:])
+
+
+# ============================================================
+# BPA bidireccional (por niveles)
+# ============================================================
+def bidirectional_breadth_first_search(initial_state, goal_state, red=None, red_inversa=None):
+    g = resolver_red(red)
+    g_inv = g if red_inversa is None else resolver_red(red_inversa)
+    etiquetas = g.etiquetas
+    inicio = g.id_de(initial_state)
+    objetivo = g.id_de(goal_state)
+
+    orden_visita = []
+    if inicio == objetivo:
+        orden_visita.append(etiquetas[inicio])
+        return True, orden_visita, [etiquetas[inicio]]
+
+    # Por cada lado: nivel actual (frontera), padres y profundidad
+    frontera_ida, frontera_vuelta = [inicio], [objetivo]
+    parent_ida, parent_vuelta = {inicio: None}, {objetivo: None}
+    prof_ida, prof_vuelta = {inicio: 0}, {objetivo: 0}
+
+    while frontera_ida and frontera_vuelta:
+        # Expandir el nivel completo del lado con menos nodos
+        if len(frontera_ida) <= len(frontera_vuelta):
+            grafo_lado, frontera = g, frontera_ida
+            parent, prof = parent_ida, prof_ida
+            prof_otro = prof_vuelta
+        else:
+            grafo_lado, frontera = g_inv, frontera_vuelta
+            parent, prof = parent_vuelta, prof_vuelta
+            prof_otro = prof_ida
+
+        siguiente = []
+        mejor, encuentro = None, None
+        for state in frontera:
+            orden_visita.append(etiquetas[state])
+            d = prof[state] + 1
+            for neighbor in grafo_lado.vecinos(state):
+                if neighbor in prof:
+                    continue
+                parent[neighbor] = state
+                prof[neighbor] = d
+                siguiente.append(neighbor)
+                # ¿El otro lado ya llegó aquí? Se revisa el nivel completo
+                # para quedarse con el encuentro de menor largo total
+                if neighbor in prof_otro:
+                    total = d + prof_otro[neighbor]
+                    if mejor is None or total < mejor:
+                        mejor, encuentro = total, neighbor
+
+        if encuentro is not None:
+            return True, orden_visita, _unir_rutas(g, parent_ida, parent_vuelta, encuentro)
+
+        if frontera is frontera_ida:
+            frontera_ida = siguiente
+        else:
+            frontera_vuelta = siguiente
+
+    return False, orden_visita, None
+
+
+# ============================================================
+# CU bidireccional (Dijkstra desde ambos extremos)
+# ============================================================
+def bidirectional_uniform_cost_search(initial_state, goal_state, red=None, red_inversa=None):
+    g = resolver_red(red)
+    g_inv = g if red_inversa is None else resolver_red(red_inversa)
+    etiquetas = g.etiquetas
+    inicio = g.id_de(initial_state)
+    objetivo = g.id_de(goal_state)
+
+    orden_visita = []
+    if inicio == objetivo:
+        orden_visita.append(etiquetas[inicio])
+        return True, orden_visita, [etiquetas[inicio]], 0
+
+    # Estado por lado: heap (lazy deletion), mejor costo conocido, padres, explorados
+    heap_ida, heap_vuelta = [(0, inicio)], [(0, objetivo)]
+    costo_ida, costo_vuelta = {inicio: 0}, {objetivo: 0}
+    parent_ida, parent_vuelta = {inicio: None}, {objetivo: None}
+    explored_ida, explored_vuelta = set(), set()
+
+    mu, encuentro = None, None   # mejor camino completo inicio -> objetivo
+
+    while heap_ida and heap_vuelta:
+        # Criterio de parada: ningún camino sin ver puede costar menos que mu
+        if mu is not None and heap_ida[0][0] + heap_vuelta[0][0] >= mu:
+            break
+
+        # Avanzar el lado con menor clave mínima
+        if heap_ida[0][0] <= heap_vuelta[0][0]:
+            grafo_lado, heap = g, heap_ida
+            g_cost, parent, explored = costo_ida, parent_ida, explored_ida
+            g_otro = costo_vuelta
+        else:
+            grafo_lado, heap = g_inv, heap_vuelta
+            g_cost, parent, explored = costo_vuelta, parent_vuelta, explored_vuelta
+            g_otro = costo_ida
+
+        cost, state = heapq.heappop(heap)  # deleteMin()
+        if state in explored or cost != g_cost[state]:
+            continue                       # entrada obsoleta
+        explored.add(state)
+        orden_visita.append(etiquetas[state])
+
+        for neighbor, step in grafo_lado.aristas(state):
+            if neighbor in explored:
+                continue
+            new_cost = cost + step
+            if neighbor not in g_cost or new_cost < g_cost[neighbor]:
+                g_cost[neighbor] = new_cost
+                parent[neighbor] = state
+                heapq.heappush(heap, (new_cost, neighbor))
+            # Camino completo a través de la arista (state, neighbor)
+            if neighbor in g_otro:
+                total = g_cost[neighbor] + g_otro[neighbor]
+                if mu is None or total < mu:
+                    mu, encuentro = total, neighbor
+
+    if encuentro is None:
+        return False, orden_visita, None, None
+    return True, orden_visita, _unir_rutas(g, parent_ida, parent_vuelta, encuentro), mu
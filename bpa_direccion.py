@@ -0,0 +1,107 @@
+# ------------------------------------------------------------
+# BPA con optimización de dirección (arriba-abajo / abajo-arriba)
+# - Arriba-abajo (breadth_first_search): cada nodo de la frontera
+#   revisa TODAS sus aristas. Cuando la frontera incluye "famosos" de la
+#   red social, casi todas esas aristas llegan a nodos ya visitados.
+# - Abajo-arriba: cada nodo NO visitado busca en sus vecinos alguno que
+#   esté en la frontera y se detiene en el primero. Con una frontera
+#   enorme casi todos lo encuentran enseguida.
+# - Cambio de dirección (heurística de Beamer et al.):
+#     arriba-abajo -> abajo-arriba   si m_f > m_u / alpha
+#     abajo-arriba -> arriba-abajo   si n_f < n / beta
+#   con m_f = aristas de la frontera, m_u = aristas de los no visitados
+#   y n_f = tamaño de la frontera.
+# - Las distancias (saltos) son las de breadth_first_search. En los
+#   niveles arriba-abajo el padre es el mismo; en los abajo-arriba es el
+#   primer vecino (orden lexicográfico) que estaba en la frontera, que
+#   también da una ruta de largo mínimo.
+# ------------------------------------------------------------
+
+from array import array
+
+from red_social_busqueda import resolver_red
+
+ALPHA = 14
+BETA = 24
+
+
+def direction_optimizing_breadth_first_search(initial_state, red=None, red_inversa=None,
+                                              alpha=ALPHA, beta=BETA, goal_state=None):
+    """
+    BPA desde `initial_state` (todo el grafo, o hasta visitar `goal_state`).
+    alpha=None desactiva abajo-arriba (BPA arriba-abajo puro, para comparar).
+    `red_inversa` solo hace falta si el grafo es dirigido.
+
+    Devuelve (distancia, parent, estadisticas):
+      distancia     arreglo por ID de nodo (-1 = no alcanzado)
+      parent        dict ID -> ID del padre (None en el inicio), sirve
+                    con reconstruir_ruta
+      estadisticas  dict con aristas revisadas y niveles por dirección
+    """
+    g = resolver_red(red)
+    g_inv = g if red_inversa is None else resolver_red(red_inversa)
+    n = g.num_nodos
+    offsets = g.offsets
+    inicio = g.id_de(initial_state)
+    objetivo = None if goal_state is None else g.id_de(goal_state)
+
+    distancia = array("i", [-1]) * n
+    distancia[inicio] = 0
+    parent = {inicio: None}
+    frontera = [inicio]
+    m_f = offsets[inicio + 1] - offsets[inicio]
+    m_u = g.num_arcos - m_f
+
+    abajo_arriba = False
+    pendientes = None          # nodos no visitados (solo en abajo-arriba)
+    estadisticas = {"aristas_revisadas": 0, "niveles_arriba_abajo": 0,
+                    "niveles_abajo_arriba": 0, "cambios": 0}
+    revisadas = 0
+    nivel = 0
+
+    while frontera and (objetivo is None or distancia[objetivo] < 0):
+        if alpha is not None:
+            if not abajo_arriba and m_f > m_u / alpha:
+                abajo_arriba = True
+                estadisticas["cambios"] += 1
+                pendientes = [v for v in range(n) if distancia[v] < 0]
+            elif abajo_arriba and len(frontera) < n / beta:
+                abajo_arriba = False
+                estadisticas["cambios"] += 1
+                pendientes = None
+        nivel += 1
+        siguiente = []
+
+        if not abajo_arriba:
+            estadisticas["niveles_arriba_abajo"] += 1
+            for state in frontera:
+                revisadas += offsets[state + 1] - offsets[state]
+                for neighbor in g.vecinos(state):
+                    if distancia[neighbor] < 0:
+                        distancia[neighbor] = nivel
+                        parent[neighbor] = state
+                        siguiente.append(neighbor)
+        else:
+            estadisticas["niveles_abajo_arriba"] += 1
+            en_frontera = bytearray(n)
+            for state in frontera:
+                en_frontera[state] = 1
+            quedan = []
+            for state in pendientes:
+                for neighbor in g_inv.vecinos(state):
+                    revisadas += 1
+                    if en_frontera[neighbor]:
+                        distancia[state] = nivel
+                        parent[state] = neighbor
+                        siguiente.append(state)
+                        break
+                else:
+                    quedan.append(state)
+            pendientes = quedan
+
+        m_f = sum(offsets[v + 1] - offsets[v] for v in siguiente)
+        m_u -= m_f
+        frontera = siguiente
+
+    estadisticas["aristas_revisadas"] = revisadas
+    return distancia, parent, estadisticas
@@ -0,0 +1,100 @@
+# ------------------------------------------------------------
+# BPA por niveles vectorizado con NumPy (distancias en saltos a todo el grafo)
+# - breadth_first_search saca un nodo por vuelta del intérprete. Para
+#   "saltos desde A a todos" sobre un grafo grande conviene expandir un
+#   NIVEL entero por vuelta con operaciones de arreglos sobre el CSR:
+#     1. gather: vecinos de toda la frontera, concatenados en el orden
+#        de la frontera (y cada fila en orden lexicográfico)
+#     2. filtro: se descartan los ya visitados
+#     3. se deja la PRIMERA aparición de cada vecino: ese es exactamente
+#        el padre que le asigna breadth_first_search (el primero en
+#        encolarlo), y el orden de las primeras apariciones es el orden
+#        de la cola para el nivel siguiente
+# - Así las distancias y los padres (y por lo tanto las rutas) coinciden
+#   con breadth_first_search.
+# NumPy es opcional: solo hace falta para usar este módulo.
+# ------------------------------------------------------------
+
+try:
+    import numpy as np
+except ImportError:   # pragma: no cover - depende del entorno
+    np = None
+
+from red_social_busqueda import resolver_red
+
+SIN_PADRE = -1   # nodo inalcanzable (la raíz es su propio padre)
+INALCANZABLE = -1
+
+
+def _arreglos_csr(g):
+    """offsets / destinos del GrafoCSR como arreglos NumPy (sin copiar)."""
+    offsets = np.frombuffer(g.offsets, dtype=np.int64)
+    destinos = np.frombuffer(g.destinos, dtype=np.int32)
+    return offsets, destinos
+
+
+def level_synchronous_breadth_first_search(initial_state, red=None):
+    """
+    BPA completo desde `initial_state`, un nivel por iteración.
+    Devuelve (distancia, parent): arreglos NumPy indexados por ID de nodo
+    (g.indice), con INALCANZABLE / SIN_PADRE donde no hay camino.
+    """
+    if np is None:
+        raise ImportError("level_synchronous_breadth_first_search requiere NumPy (pip install numpy)")
+    g = resolver_red(red)
+    n = g.num_nodos
+    offsets, destinos = _arreglos_csr(g)
+    inicio = g.id_de(initial_state)
+
+    distancia = np.full(n, INALCANZABLE, dtype=np.int64)
+    parent = np.full(n, SIN_PADRE, dtype=np.int64)
+    visitado = np.zeros(n, dtype=bool)
+
+    frontera = np.array([inicio], dtype=np.int64)
+    distancia[inicio] = 0
+    parent[inicio] = inicio
+    visitado[inicio] = True
+    nivel = 0
+
+    while frontera.size:
+        nivel += 1
+        # 1. Gather de las filas de la frontera, en orden de cola
+        inicios = offsets[frontera]
+        grados = offsets[frontera + 1] - inicios
+        total = int(grados.sum())
+        if total == 0:
+            break
+        fin_previo = np.cumsum(grados) - grados
+        posiciones = np.repeat(inicios - fin_previo, grados) + np.arange(total)
+        vecinos = destinos[posiciones]
+        padres = np.repeat(frontera, grados)
+
+        # 2. Filtrar visitados
+        nuevos = ~visitado[vecinos]
+        vecinos, padres = vecinos[nuevos], padres[nuevos]
+        if vecinos.size == 0:
+            break
+
+        # 3. Primera aparición de cada vecino, en orden de aparición
+        _, primera = np.unique(vecinos, return_index=True)
+        primera.sort()
+        frontera = vecinos[primera].astype(np.int64)
+        parent[frontera] = padres[primera]
+        distancia[frontera] = nivel
+        visitado[frontera] = True
+
+    return distancia, parent
+
+
+def ruta_vectorizada(g, parent, goal_state):
+    """Ruta (etiquetas) desde la raíz hasta `goal_state`, o None si no hay camino."""
+    g = resolver_red(g)
+    nodo = g.id_de(goal_state)
+    if parent[nodo] == SIN_PADRE:
+        return None
+    ruta = [nodo]
+    while parent[nodo] != nodo:
+        nodo = int(parent[nodo])
+        ruta.append(nodo)
+    ruta.reverse()
+    return g.etiquetar(ruta)
@@ -0,0 +1,142 @@
+# ------------------------------------------------------------
+# A* con heurística ALT (A*, Landmarks, desigualdad Triangular)
+# - Preproceso (una vez por grafo): se eligen `num_landmarks` nodos
+#   "lejanos" y se guardan las distancias de cada landmark L a todos
+#   los nodos (y de todos los nodos a L, si el grafo es dirigido).
+# - Consulta: A* ordenado por f(n) = g(n) + h(n) con
+#       h(v) = max_L max(d(L,t) - d(L,v), d(v,L) - d(t,L))
+#   que nunca sobreestima (desigualdad triangular) y es consistente,
+#   así que el costo es el mismo de uniform_cost_search pero se
+#   expanden muchos menos nodos.
+# ------------------------------------------------------------
+
+import heapq
+from array import array
+
+from red_social_busqueda import reconstruir_ruta, resolver_red
+
+INF = float("inf")
+
+
+def distancias_desde(g, origen):
+    """Dijkstra completo desde `origen`: arreglo de distancias (INF = inalcanzable)."""
+    dist = array("d", [INF]) * g.num_nodos
+    dist[origen] = 0
+    heap = [(0, origen)]
+    while heap:
+        cost, state = heapq.heappop(heap)
+        if cost != dist[state]:
+            continue                    # entrada obsoleta (lazy deletion)
+        for neighbor, step in g.aristas(state):
+            new_cost = cost + step
+            if new_cost < dist[neighbor]:
+                dist[neighbor] = new_cost
+                heapq.heappush(heap, (new_cost, neighbor))
+    return dist
+
+
+class LandmarksALT:
+    """
+    Tablas de distancias a/desde landmarks para un grafo.
+    desde[i][v] = d(L_i, v)   y   hacia[i][v] = d(v, L_i)
+    (en un grafo no dirigido ambas tablas son la misma).
+    """
+
+    __slots__ = ("grafo", "landmarks", "desde", "hacia")
+
+    def __init__(self, grafo, landmarks, desde, hacia):
+        self.grafo = grafo
+        self.landmarks = landmarks
+        self.desde = desde
+        self.hacia = hacia
+
+
+def preprocesar_landmarks(red=None, num_landmarks=8, red_inversa=None):
+    """
+    Elige landmarks por "el más lejano" (cada nuevo landmark maximiza su
+    distancia mínima a los ya elegidos; los nodos inalcanzables se eligen
+    primero, así cada componente conexa recibe uno) y calcula sus tablas.
+    `red_inversa` solo hace falta si el grafo es dirigido.
+    """
+    g = resolver_red(red)
+    g_inv = None if red_inversa is None else resolver_red(red_inversa)
+    n = g.num_nodos
+    num_landmarks = min(num_landmarks, n)
+
+    landmarks, desde, hacia = [], [], []
+    if num_landmarks == 0:
+        return LandmarksALT(g, landmarks, desde, hacia)
+
+    # Primer landmark: el nodo más lejano al nodo 0
+    minima = distancias_desde(g, 0)
+    for _ in range(num_landmarks):
+        candidato = max(range(n), key=minima.__getitem__)
+        if candidato in landmarks:
+            break                      # ya no quedan nodos nuevos que cubrir
+        landmarks.append(candidato)
+        dist = distancias_desde(g, candidato)
+        desde.append(dist)
+        hacia.append(dist if g_inv is None else distancias_desde(g_inv, candidato))
+        if len(landmarks) == 1:
+            minima = array("d", dist)
+        else:
+            for v in range(n):
+                if dist[v] < minima[v]:
+                    minima[v] = dist[v]
+        for l in landmarks:
+            minima[l] = -1             # nunca repetir un landmark
+
+    return LandmarksALT(g, landmarks, desde, hacia)
+
+
+# ============================================================
+# A* (Priority Queue por f(n) = g(n) + h(n))
+# ============================================================
+def a_star_search(initial_state, goal_state, landmarks):
+    g = landmarks.grafo
+    etiquetas = g.etiquetas
+    inicio = g.id_de(initial_state)
+    objetivo = g.id_de(goal_state)
+
+    # Valores del objetivo en cada tabla (fijos durante la consulta)
+    tablas = [(desde, desde[objetivo], hacia, hacia[objetivo])
+              for desde, hacia in zip(landmarks.desde, landmarks.hacia)]
+
+    def h(v):
+        mejor = 0
+        for desde, desde_t, hacia, hacia_t in tablas:
+            a = desde_t - desde[v]
+            b = hacia[v] - hacia_t
+            if a > mejor and a != INF:
+                mejor = a
+            if b > mejor and b != INF:
+                mejor = b
+        return mejor
+
+    explored = set()
+    parent = {inicio: None}
+    g_cost = {inicio: 0}
+    heap = [(h(inicio), inicio)]
+    orden_visita = []
+
+    while heap:
+        f, state = heapq.heappop(heap)
+        if state in explored:
+            continue                    # entrada obsoleta (lazy deletion)
+        explored.add(state)
+        orden_visita.append(etiquetas[state])
+
+        cost = g_cost[state]
+        if state == objetivo:
+            return True, orden_visita, g.etiquetar(reconstruir_ruta(parent, state)), cost
+
+        for neighbor, step in g.aristas(state):
+            if neighbor in explored:
+                continue
+            new_cost = cost + step
+            if neighbor not in g_cost or new_cost < g_cost[neighbor]:
+                g_cost[neighbor] = new_cost
+                parent[neighbor] = state
+                heapq.heappush(heap, (new_cost + h(neighbor), neighbor))
+
+    return False, orden_visita, None, None
@@ -0,0 +1,103 @@
+# ------------------------------------------------------------
+# Cache LRU de resultados de búsqueda
+# - Clave: (algoritmo, inicio, objetivo), con algoritmo "BPA", "BPP"
+#   o "CU" (ver ALGORITMOS en red_social_busqueda).
+# - Tamaño acotado: al pasar la capacidad se descarta el resultado
+#   usado hace más tiempo (OrderedDict como lista LRU).
+# - Versión del grafo: el cache recuerda la `version` del GrafoCSR con
+#   que calculó sus entradas. Si la red cambia (p. ej. con
+#   cambiar_arista) la versión es otra y el cache se vacía solo en la
+#   siguiente consulta: nunca devuelve una ruta de un grafo viejo.
+# - Memoria: cada resultado trae el orden de visita (hasta |V|
+#   etiquetas). compacto=True guarda solo su largo y `max_elementos`
+#   acota la suma de los órdenes guardados (desaloja por LRU).
+# ------------------------------------------------------------
+
+from collections import OrderedDict
+
+from grafo_csr import como_csr
+from red_social_busqueda import ALGORITMOS, resolver_red
+
+
+class CacheBusquedas:
+    """
+    Cache LRU delante de breadth_first_search, depth_first_search y
+    uniform_cost_search. `red` es la red a consultar (None = la red
+    global, que puede cambiar con cambiar_arista). compacto=True guarda el
+    largo del orden de visita en vez de la lista; `max_elementos` acota
+    cuántas etiquetas de orden guarda el cache en total.
+    """
+
+    def __init__(self, capacidad=1024, red=None, compacto=False, max_elementos=None):
+        if capacidad < 1:
+            raise ValueError("La capacidad del cache debe ser al menos 1")
+        self.capacidad = capacidad
+        self.red = None if red is None else como_csr(red)
+        self.compacto = compacto
+        self.max_elementos = max_elementos
+        self._entradas = OrderedDict()
+        self._elementos = 0             # suma de los largos de orden guardados
+        self._version = None
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.invalidaciones = 0
+
+    def buscar(self, algoritmo, inicio, objetivo):
+        """
+        Mismo resultado que ALGORITMOS[algoritmo](inicio, == objetivo); con
+        compacto=True el orden de visita se reemplaza por su largo.
+        """
+        g = resolver_red(self.red)
+        if g.version != self._version:
+            if self._entradas:
+                self.invalidaciones += 1
+                self.limpiar()
+            self._version = g.version
+
+        clave = (algoritmo, inicio, objetivo)
+        resultado = self._entradas.get(clave)
+        if resultado is not None:
+            self._entradas.move_to_end(clave)
+            self.aciertos += 1
+            return _copiar(resultado)
+
+        self.fallos += 1
+        busqueda = ALGORITMOS[algoritmo]
+        resultado = busqueda(inicio, lambda s: s == objetivo, red=g)
+        if self.compacto:
+            resultado = (resultado[0], len(resultado[1])) + resultado[2:]
+        else:
+            self._elementos += len(resultado[1])
+        self._entradas[clave] = resultado
+        while len(self._entradas) > self.capacidad or (
+                self.max_elementos is not None and self._elementos > self.max_elementos
+                and len(self._entradas) > 1):
+            _, desalojado = self._entradas.popitem(last=False)
+            if not self.compacto:
+                self._elementos -= len(desalojado[1])
+            self.desalojos += 1
+        return _copiar(resultado)
+
+    def estadisticas(self):
+        return {
+            "capacidad": self.capacidad,
+            "entradas": len(self._entradas),
+            "elementos": self._elementos,
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "desalojos": self.desalojos,
+            "invalidaciones": self.invalidaciones,
+        }
+
+    def limpiar(self):
+        self._entradas.clear()
+        self._elementos = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+
+def _copiar(resultado):
+    # Las listas (orden, ruta) se copian para que quien llama no altere el cache
+    return tuple(list(x) if isinstance(x, list) else x for x in resultado)
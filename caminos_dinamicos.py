@@ -0,0 +1,164 @@
+# ------------------------------------------------------------
+# Árboles de caminos mínimos que se reparan con cada cambio de arista
+# - Las amistades y sus costos cambian todo el tiempo. En vez de volver
+#   a correr uniform_cost_search desde cada cuenta importante, la
+#   RedDinamica guarda el grafo en forma mutable y un árbol de caminos
+#   mínimos (distancia + padre) por cada origen registrado.
+# - Al cambiar una arista u-v (agregar, quitar o cambiar el costo):
+#     * si el camino por la arista queda MÁS BARATO, se relaja y se
+#       propaga la mejora con Dijkstra desde los nodos mejorados
+#     * si una arista del árbol queda MÁS CARA o desaparece, se invalida
+#       SOLO el subárbol que colgaba de ella, cada nodo de ese subárbol
+#       toma su mejor candidato entre vecinos no afectados y se vuelve a
+#       asentar con Dijkstra
+#     * cualquier otro cambio no altera el árbol
+# - Las distancias son siempre las de uniform_cost_search. Ante empates
+#   el padre puede ser otro, con una ruta del mismo costo.
+# Se asume grafo no dirigido (como la red social y cambiar_arista).
+# ------------------------------------------------------------
+
+import heapq
+
+from red_social_busqueda import reconstruir_ruta, resolver_red
+
+INF = float("inf")
+
+
+class ArbolCaminosMinimos:
+    """Distancias y padres desde `origen` (etiquetas) sobre una RedDinamica."""
+
+    def __init__(self, red, origen):
+        self.red = red
+        self.origen = origen
+        self.dist = {origen: 0}
+        self.parent = {origen: None}
+        self.hijos = {}
+        self.resentados = 0    # nodos asentados de nuevo por reparaciones
+        self._propagar([(0, origen)])
+        self.resentados = 0
+
+    def distancia(self, nodo):
+        """Costo mínimo desde el origen (None si no hay camino)."""
+        return self.dist.get(nodo)
+
+    def ruta(self, nodo):
+        """Ruta desde el origen hasta `nodo` (None si no hay camino)."""
+        if nodo not in self.dist:
+            return None
+        return reconstruir_ruta(self.parent, nodo)
+
+    # --------------------------------------------------------
+    # Mantenimiento interno
+    # --------------------------------------------------------
+    def _enlazar(self, nodo, padre):
+        anterior = self.parent.get(nodo)
+        if anterior is not None:
+            self.hijos[anterior].discard(nodo)
+        self.parent[nodo] = padre
+        self.hijos.setdefault(padre, set()).add(nodo)
+
+    def _propagar(self, heap):
+        """Dijkstra (lazy deletion) a partir de las entradas de `heap`."""
+        ady, dist = self.red.ady, self.dist
+        heapq.heapify(heap)
+        while heap:
+            cost, state = heapq.heappop(heap)
+            if cost != dist.get(state):
+                continue
+            self.resentados += 1
+            for neighbor, step in ady[state].items():
+                new_cost = cost + step
+                if new_cost < dist.get(neighbor, INF):
+                    dist[neighbor] = new_cost
+                    self._enlazar(neighbor, state)
+                    heapq.heappush(heap, (new_cost, neighbor))
+
+    def _arista_cambiada(self, a, b, anterior, costo):
+        """Repara el árbol tras cambiar el costo de a -> b de `anterior` a `costo`."""
+        dist = self.dist
+        if costo is not None and (anterior is None or costo < anterior):
+            # Más barata (o nueva): relajar y propagar
+            if a in dist and dist[a] + costo < dist.get(b, INF):
+                dist[b] = dist[a] + costo
+                self._enlazar(b, a)
+                self._propagar([(dist[b], b)])
+        elif anterior is not None and self.parent.get(b) == a:
+            # Arista del árbol más cara o eliminada: reparar el subárbol de b
+            self._reparar_subarbol(b)
+
+    def _reparar_subarbol(self, raiz):
+        dist, parent, hijos, ady = self.dist, self.parent, self.hijos, self.red.ady
+
+        afectados = []
+        pila = [raiz]
+        while pila:
+            nodo = pila.pop()
+            afectados.append(nodo)
+            pila.extend(hijos.pop(nodo, ()))
+        hijos[parent[raiz]].discard(raiz)
+        for nodo in afectados:
+            del dist[nodo]
+            del parent[nodo]
+
+        # Mejor candidato de cada afectado entre los vecinos no afectados
+        heap = []
+        for nodo in afectados:
+            mejor, padre = INF, None
+            for vecino, paso in ady[nodo].items():
+                d = dist.get(vecino, INF) + paso
+                if d < mejor:
+                    mejor, padre = d, vecino
+            if padre is not None:
+                dist[nodo] = mejor
+                parent[nodo] = padre
+                hijos.setdefault(padre, set()).add(nodo)
+                heap.append((mejor, nodo))
+        self._propagar(heap)
+
+
+class RedDinamica:
+    """
+    Grafo mutable (dict de dicts, como `grafo`) con árboles de caminos
+    mínimos registrados que se reparan en cada cambiar_arista.
+    """
+
+    def __init__(self, red=None):
+        g = resolver_red(red)
+        self.ady = {
+            g.etiquetas[u]: {g.etiquetas[v]: w for v, w in g.aristas(u)}
+            for u in range(g.num_nodos)
+        }
+        self.arboles = {}
+
+    def arbol(self, origen):
+        """Árbol de caminos mínimos desde `origen` (se crea y registra la primera vez)."""
+        if origen not in self.arboles:
+            if origen not in self.ady:
+                raise KeyError(origen)
+            self.arboles[origen] = ArbolCaminosMinimos(self, origen)
+        return self.arboles[origen]
+
+    def cambiar_arista(self, u, v, costo=None):
+        """
+        Agrega o actualiza la arista u-v con `costo`, o la elimina si costo
+        es None, y repara los árboles registrados. Devuelve cuántos nodos
+        se volvieron a asentar (sumando todos los árboles).
+        """
+        ady = self.ady
+        ady.setdefault(u, {})
+        ady.setdefault(v, {})
+        anterior = ady[u].get(v)
+        if costo is None:
+            ady[u].pop(v, None)
+            ady[v].pop(u, None)
+        else:
+            ady[u][v] = costo
+            ady[v][u] = costo
+
+        resentados = 0
+        for arbol in self.arboles.values():
+            antes = arbol.resentados
+            arbol._arista_cambiada(u, v, anterior, costo)
+            arbol._arista_cambiada(v, u, anterior, costo)
+            resentados += arbol.resentados - antes
+        return resentados
@@ -0,0 +1,359 @@
+# ------------------------------------------------------------
+# Carga de grafos grandes
+# - cargar_lista_aristas: lee un CSV/TSV "origen,destino,costo" línea
+#   por línea y va llenando arreglos compactos (array) de IDs y pesos;
+#   nunca guarda una tupla de Python por arista. Por defecto el grafo
+#   es no dirigido, como los datos del taller ("A-B: 2").
+# - guardar_binario / cargar_binario: formato binario del GrafoCSR que
+#   se abre con mmap. Cargar no parsea nada: los arreglos son vistas
+#   (memoryview) sobre el archivo y las etiquetas se decodifican solo
+#   cuando se piden, así que se puede buscar en milisegundos.
+#
+# Uso: python cargador_grafo.py aristas.csv grafo.gcsr
+# ------------------------------------------------------------
+
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+
+from grafo_csr import GrafoCSR
+
+
+# ==================================================
+# Lista de aristas (CSV / TSV)
+# ==================================================
+
+# Nombres de columna que delatan un encabezado ("src,dst", "origen\tdestino\tcosto")
+_COLUMNAS_ENCABEZADO = {
+    "src", "dst", "source", "target", "from", "to", "origen", "destino",
+    "weight", "cost", "costo", "peso",
+}
+
+
+def _es_encabezado(partes):
+    columnas = [p.strip().lower() for p in partes]
+    if all(c in _COLUMNAS_ENCABEZADO for c in columnas):
+        return True
+    if len(columnas) > 2:              # costo que no es número: "a,b,weight"
+        try:
+            float(columnas[2])
+        except ValueError:
+            return True
+    return False
+
+
+def cargar_lista_aristas(origen, separador=None, dirigido=False, encabezado=None):
+    """
+    Lee una lista de aristas y devuelve un GrafoCSR.
+
+    `origen` es una ruta o un archivo de texto ya abierto (p. ej. sys.stdin).
+    Cada línea es "origen<sep>destino[<sep>costo]" (costo 1 si falta); se
+    ignoran líneas vacías y comentarios (#). Si no se indica `separador`, se
+    usa tabulador cuando la primera línea lo tiene y coma en otro caso. Una
+    arista repetida conserva el último costo.
+    `encabezado`: True descarta la primera línea de datos, False nunca la
+    descarta y None (por defecto) la descarta si parece encabezado: todas
+    sus columnas son nombres conocidos (src, dst, source, target, origen,
+    destino, weight, costo, ...) o el costo no es un número.
+    """
+    if isinstance(origen, str):
+        with open(origen, encoding="utf-8") as archivo:
+            return cargar_lista_aristas(archivo, separador, dirigido, encabezado)
+
+    indice = {}                      # etiqueta -> ID (orden de aparición)
+    origenes = array("i")
+    destinos = array("i")
+    pesos = array("q")
+    primera = True
+
+    for linea in origen:
+        linea = linea.strip()
+        if not linea or linea[0] == "#":
+            continue
+        if separador is None:
+            separador = "\t" if "\t" in linea else ","
+        partes = linea.split(separador)
+        if primera:
+            primera = False
+            if encabezado or (encabezado is None and _es_encabezado(partes)):
+                continue
+
+        if len(partes) > 2:
+            texto_peso = partes[2].strip()
+            try:
+                peso = int(texto_peso)
+            except ValueError:
+                try:
+                    peso = float(texto_peso)
+                except ValueError:
+                    raise ValueError(f"Costo inválido en la línea: {linea!r}") from None
+                if pesos.typecode == "q":
+                    pesos = array("d", pesos)
+        else:
+            peso = 1
+
+        u = indice.setdefault(partes[0].strip(), len(indice))
+        v = indice.setdefault(partes[1].strip(), len(indice))
+        origenes.append(u)
+        destinos.append(v)
+        pesos.append(peso)
+        if not dirigido and u != v:
+            origenes.append(v)
+            destinos.append(u)
+            pesos.append(peso)
+
+    return csr_desde_arcos(indice, origenes, destinos, pesos)
+
+
+def csr_desde_arcos(indice, origenes, destinos, pesos):
+    """
+    Arma el CSR a partir de arcos en arreglos paralelos, sin tuplas:
+    1) renumera los IDs en orden lexicográfico de las etiquetas
+    2) ordena por destino y luego (estable) por origen con counting sort,
+       así cada fila queda ordenada alfabéticamente
+    3) compacta aristas repetidas (gana la última que apareció)
+    `indice` (etiqueta -> ID) y los arreglos se reescriben en su lugar.
+    """
+    n = len(indice)
+    m = len(origenes)
+
+    etiquetas = sorted(indice)
+    nuevo = array("i", bytes(4 * n))
+    for i, etiqueta in enumerate(etiquetas):
+        nuevo[indice[etiqueta]] = i
+        indice[etiqueta] = i
+    for k in range(m):
+        origenes[k] = nuevo[origenes[k]]
+        destinos[k] = nuevo[destinos[k]]
+    del nuevo
+
+    # Pasada 1: índices de arcos ordenados (estable) por destino
+    posicion = _prefijos(destinos, n)
+    orden = array("q", bytes(8 * m))
+    for k in range(m):
+        d = destinos[k]
+        orden[posicion[d]] = k
+        posicion[d] += 1
+    del posicion
+
+    # Pasada 2: distribuir por origen respetando el orden anterior
+    offsets = _prefijos(origenes, n)
+    cursor = array("q", offsets)
+    destinos_csr = array("i", bytes(4 * m))
+    pesos_csr = array(pesos.typecode, bytes(pesos.itemsize * m))
+    repetidos = 0
+    for k in orden:
+        u = origenes[k]
+        j = cursor[u]
+        if j > offsets[u] and destinos_csr[j - 1] == destinos[k]:
+            pesos_csr[j - 1] = pesos[k]
+            repetidos += 1
+            continue
+        destinos_csr[j] = destinos[k]
+        pesos_csr[j] = pesos[k]
+        cursor[u] = j + 1
+    del orden
+
+    if repetidos:
+        # Cerrar los huecos que dejaron las aristas repetidas
+        escritura = 0
+        for u in range(n):
+            inicio, fin = offsets[u], cursor[u]
+            offsets[u] = escritura
+            for j in range(inicio, fin):
+                destinos_csr[escritura] = destinos_csr[j]
+                pesos_csr[escritura] = pesos_csr[j]
+                escritura += 1
+        offsets[n] = escritura
+        del destinos_csr[escritura:]
+        del pesos_csr[escritura:]
+
+    return GrafoCSR(etiquetas, offsets, destinos_csr, pesos_csr, indice=indice)
+
+
+def _prefijos(ids, n):
+    """Offsets de counting sort: posición inicial de cada ID (n+1 valores)."""
+    cuenta = array("q", bytes(8 * (n + 1)))
+    for i in ids:
+        cuenta[i + 1] += 1
+    for i in range(n):
+        cuenta[i + 1] += cuenta[i]
+    return cuenta
+
+
+# ==================================================
+# Formato binario (mmap)
+# ==================================================
+# Cabecera: magia, n nodos, m arcos, bytes de etiquetas, tipo de peso.
+# Luego, cada sección alineada a 8 bytes (little-endian):
+#   offsets (n+1 int64) | destinos (m int32) | pesos (m int64 o float64)
+#   | posiciones de etiquetas (n+1 int64) | etiquetas UTF-8 concatenadas
+# Las etiquetas van en orden lexicográfico (= orden de los IDs).
+
+_MAGIA = b"GCSR0001"
+_CABECERA = struct.Struct("<8sqqq1s7x")
+
+
+def guardar_binario(grafo, ruta):
+    """Escribe `grafo` (GrafoCSR) en el formato binario."""
+    with open(ruta, "wb") as archivo:
+        volcar_binario(grafo, archivo)
+
+
+def volcar_binario(grafo, archivo):
+    """
+    Escribe `grafo` en el formato binario sobre `archivo` (cualquier
+    objeto con write / tell) y devuelve la cantidad de bytes escritos.
+    """
+    if sys.byteorder != "little":
+        raise NotImplementedError("El formato binario es little-endian")
+
+    posiciones = array("q", [0])
+    for etiqueta in grafo.etiquetas:
+        posiciones.append(posiciones[-1] + len(etiqueta.encode("utf-8")))
+
+    tipo_peso = "d" if _tipo(grafo.pesos) == "d" else "q"
+    archivo.write(_CABECERA.pack(
+        _MAGIA, grafo.num_nodos, grafo.num_arcos, posiciones[-1],
+        tipo_peso.encode(),
+    ))
+    _escribir(archivo, array("q", grafo.offsets))
+    _escribir(archivo, array("i", grafo.destinos))
+    _escribir(archivo, array(tipo_peso, grafo.pesos))
+    _escribir(archivo, posiciones)
+    for etiqueta in grafo.etiquetas:
+        archivo.write(etiqueta.encode("utf-8"))
+    return archivo.tell()
+
+
+def _tipo(arreglo):
+    return getattr(arreglo, "typecode", None) or getattr(arreglo, "format", "q")
+
+
+def _escribir(archivo, arreglo):
+    archivo.write(arreglo.tobytes())
+    relleno = -archivo.tell() % 8
+    if relleno:
+        archivo.write(bytes(relleno))
+
+
+def cargar_binario(ruta):
+    """
+    Abre un grafo binario con mmap y devuelve un GrafoCSR de solo lectura
+    cuyos arreglos apuntan directamente al archivo (sin copias).
+    """
+    with open(ruta, "rb") as archivo:
+        mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+    grafo, _ = grafo_desde_buffer(mapa, ruta)
+    return grafo
+
+
+def grafo_desde_buffer(buffer, origen="buffer"):
+    """
+    GrafoCSR sobre un buffer con el formato binario (mmap, memoria
+    compartida, bytes...). Devuelve (grafo, vistas): las memoryview que
+    apuntan al buffer, por si hay que liberarlas antes de cerrarlo.
+    """
+    if sys.byteorder != "little":
+        raise NotImplementedError("El formato binario es little-endian")
+
+    magia, n, m, bytes_etiquetas, tipo_peso = _CABECERA.unpack_from(buffer, 0)
+    if magia != _MAGIA:
+        raise ValueError(f"{origen} no es un grafo binario GCSR")
+
+    vista = memoryview(buffer)
+    vistas = [vista]
+    cursor = _CABECERA.size
+
+    def seccion(formato, cantidad, tam):
+        nonlocal cursor
+        inicio = cursor
+        cursor += cantidad * tam
+        cursor += -cursor % 8
+        parte = vista[inicio:inicio + cantidad * tam]
+        vistas.append(parte)
+        vistas.append(parte.cast(formato))
+        return vistas[-1]
+
+    offsets = seccion("q", n + 1, 8)
+    destinos = seccion("i", m, 4)
+    pesos = seccion(tipo_peso.decode(), m, 8)
+    posiciones = seccion("q", n + 1, 8)
+    datos = vista[cursor:cursor + bytes_etiquetas]
+    vistas.append(datos)
+
+    etiquetas = TablaEtiquetas(posiciones, datos)
+    grafo = GrafoCSR(etiquetas, offsets, destinos, pesos,
+                     indice=IndiceEtiquetas(etiquetas))
+    return grafo, vistas
+
+
+class TablaEtiquetas(Sequence):
+    """Etiquetas guardadas en el archivo; se decodifican al pedirlas."""
+
+    def __init__(self, posiciones, datos):
+        self._posiciones = posiciones
+        self._datos = datos
+
+    def __len__(self):
+        return len(self._posiciones) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return str(self._datos[self._posiciones[i]:self._posiciones[i + 1]], "utf-8")
+
+    def bytes_de(self, i):
+        return bytes(self._datos[self._posiciones[i]:self._posiciones[i + 1]])
+
+
+class IndiceEtiquetas(Mapping):
+    """
+    Etiqueta -> ID por búsqueda binaria sobre la tabla ordenada (el orden
+    de bytes UTF-8 coincide con el orden de str), sin armar un dict.
+    """
+
+    def __init__(self, etiquetas):
+        self._etiquetas = etiquetas
+        self._claves = _ClavesBytes(etiquetas)
+
+    def __getitem__(self, etiqueta):
+        if not isinstance(etiqueta, str):
+            raise KeyError(etiqueta)
+        clave = etiqueta.encode("utf-8")
+        i = bisect_left(self._claves, clave)
+        if i == len(self._etiquetas) or self._claves[i] != clave:
+            raise KeyError(etiqueta)
+        return i
+
+    def __iter__(self):
+        return iter(self._etiquetas)
+
+    def __len__(self):
+        return len(self._etiquetas)
+
+
+class _ClavesBytes(Sequence):
+    # Vista de la tabla como bytes, para que bisect compare sin decodificar
+    def __init__(self, etiquetas):
+        self._etiquetas = etiquetas
+
+    def __len__(self):
+        return len(self._etiquetas)
+
+    def __getitem__(self, i):
+        return self._etiquetas.bytes_de(i)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Uso: python cargador_grafo.py aristas.csv grafo.gcsr")
+        sys.exit(1)
+    guardar_binario(cargar_lista_aristas(sys.argv[1]), sys.argv[2])
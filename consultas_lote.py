@@ -0,0 +1,157 @@
+# ------------------------------------------------------------
+# Consultas en lote con árboles compartidos por origen
+# - N consultas (inicio, objetivo) con el mismo inicio repiten la
+#   misma búsqueda N veces. Aquí se agrupan por inicio y se corre UNA
+#   búsqueda (BPA, BPP o CU) que sigue hasta haber visitado todos los
+#   objetivos de ese inicio (modo uno-a-muchos) o todo el grafo.
+# - Las búsquedas son deterministas, así que el árbol responde cada
+#   objetivo exactamente igual que breadth_first_search /
+#   depth_first_search / uniform_cost_search con goal_test == objetivo:
+#   el orden de visita es el prefijo hasta el objetivo y el padre de un
+#   nodo ya no cambia después de visitarlo.
+# ------------------------------------------------------------
+
+import heapq
+
+from fronteras import Cola, Pila
+from red_social_busqueda import reconstruir_ruta, resolver_red
+
+
+class ArbolBusqueda:
+    """
+    Árbol de una búsqueda desde `origen`. Para cada nodo visitado guarda
+    su posición en el orden de visita, su padre y (en CU) su costo.
+    """
+
+    __slots__ = ("grafo", "algoritmo", "origen", "orden", "posicion", "parent", "costo")
+
+    def __init__(self, grafo, algoritmo, origen, orden, parent, costo):
+        self.grafo = grafo
+        self.algoritmo = algoritmo
+        self.origen = origen
+        self.orden = orden
+        # Primera visita de cada nodo (uniform_cost_search puede repetir
+        # en el orden un nodo que sale dos veces del heap)
+        self.posicion = {}
+        for i, nodo in enumerate(orden):
+            self.posicion.setdefault(nodo, i)
+        self.parent = parent
+        self.costo = costo
+
+    def respuesta(self, goal_state):
+        """
+        Resultado para `goal_state`, con la forma de la búsqueda original:
+        (ok, orden, ruta) en BPA/BPP y (ok, orden, ruta, costo) en CU.
+        """
+        g = self.grafo
+        objetivo = g.indice.get(goal_state)
+        pos = self.posicion.get(objetivo)
+        if pos is None:
+            # No alcanzado: la búsqueda original recorre todo lo alcanzable
+            orden = g.etiquetar(self.orden)
+            return (False, orden, None, None) if self.algoritmo == "CU" else (False, orden, None)
+
+        orden = g.etiquetar(self.orden[:pos + 1])
+        ruta = g.etiquetar(reconstruir_ruta(self.parent, objetivo))
+        if self.algoritmo == "CU":
+            return True, orden, ruta, self.costo[objetivo]
+        return True, orden, ruta
+
+
+def construir_arbol(initial_state, algoritmo="CU", red=None, objetivos=None):
+    """
+    Corre una búsqueda completa desde `initial_state`. Si se da `objetivos`
+    (conjunto de etiquetas), se detiene apenas todos fueron visitados.
+    """
+    g = resolver_red(red)
+    inicio = g.id_de(initial_state)
+    pendientes = None
+    # Un objetivo que no está en el grafo obliga a recorrer todo (así
+    # responde la búsqueda original), igual que uno inalcanzable
+    if objetivos is not None and all(o in g.indice for o in objetivos):
+        pendientes = {g.indice[o] for o in objetivos}
+
+    if algoritmo == "CU":
+        orden, parent, costo = _arbol_costo_uniforme(g, inicio, pendientes)
+    elif algoritmo in ("BPA", "BPP"):
+        orden, parent = _arbol_anchura_profundidad(g, inicio, pendientes, algoritmo == "BPA")
+        costo = None
+    else:
+        raise ValueError(f"Algoritmo desconocido: {algoritmo!r} (use BPA, BPP o CU)")
+    return ArbolBusqueda(g, algoritmo, inicio, orden, parent, costo)
+
+
+def _arbol_anchura_profundidad(g, inicio, pendientes, anchura):
+    # Mismo recorrido que breadth_first_search / depth_first_search
+    if anchura:
+        frontier = Cola([inicio])
+        sacar, meter, vecinos = frontier.decolar, frontier.encolar, g.vecinos
+    else:
+        frontier = Pila([inicio])
+        sacar, meter, vecinos = frontier.desapilar, frontier.apilar, g.vecinos_inverso
+    explored = set()
+    parent = {inicio: None}
+    orden = []
+
+    while len(frontier) > 0:
+        state = sacar()
+        explored.add(state)
+        orden.append(state)
+        if pendientes is not None:
+            pendientes.discard(state)
+            if not pendientes:
+                break
+        for neighbor in vecinos(state):
+            if (neighbor not in frontier) and (neighbor not in explored):
+                parent[neighbor] = state
+                meter(neighbor)
+    return orden, parent
+
+
+def _arbol_costo_uniforme(g, inicio, pendientes):
+    # Mismo recorrido que uniform_cost_search
+    explored = set()
+    parent = {inicio: None}
+    g_cost = {inicio: 0}
+    heap = [(0, inicio)]
+    frontier_best = {inicio: 0}
+    orden = []
+
+    while heap:
+        cost, state = heapq.heappop(heap)
+        if state in frontier_best and cost != frontier_best[state]:
+            continue
+        frontier_best.pop(state, None)
+        explored.add(state)
+        orden.append(state)
+        if pendientes is not None:
+            pendientes.discard(state)
+            if not pendientes:
+                break
+        for neighbor, step in g.aristas(state):
+            new_cost = cost + step
+            if neighbor in explored:
+                continue
+            if neighbor not in frontier_best or new_cost < frontier_best[neighbor]:
+                parent[neighbor] = state
+                g_cost[neighbor] = new_cost
+                frontier_best[neighbor] = new_cost
+                heapq.heappush(heap, (new_cost, neighbor))
+    return orden, parent, g_cost
+
+
+def busqueda_lote(consultas, algoritmo="CU", red=None):
+    """
+    Resuelve una lista de consultas (inicio, objetivo) con un árbol por
+    cada inicio distinto. Devuelve los resultados en el orden de entrada,
+    con las mismas tuplas que la búsqueda individual.
+    """
+    objetivos_por_inicio = {}
+    for inicio, objetivo in consultas:
+        objetivos_por_inicio.setdefault(inicio, set()).add(objetivo)
+
+    arboles = {
+        inicio: construir_arbol(inicio, algoritmo, red, objetivos)
+        for inicio, objetivos in objetivos_por_inicio.items()
+    }
+    return [arboles[inicio].respuesta(objetivo) for inicio, objetivo in consultas]
@@ -0,0 +1,165 @@
+# ------------------------------------------------------------
+# Métricas de las búsquedas (instrumentación)
+# - breadth_first_search, depth_first_search y uniform_cost_search
+#   reciben un `estadisticas=EstadisticasBusqueda()` opcional y lo
+#   llenan al terminar (registrar_recorrido). Las tuplas de resultado
+#   no cambian.
+# - El mismo objeto se puede pasar a muchas consultas: los contadores
+#   se suman (y frontera_maxima se queda con el máximo), así se obtiene
+#   el agregado de un lote. También se suman con `+` / `+=`.
+# - Con estadisticas=None el costo es nulo: BPA / BPP calculan todo
+#   DESPUÉS de la búsqueda a partir del orden de visita y de `parent`,
+#   y CU corre su ciclo sin contadores (con estadisticas usa una copia
+#   del ciclo que sí los lleva).
+# - Las aristas del nodo objetivo no se cuentan como relajadas: la
+#   búsqueda para antes de revisarlas.
+# - Para Opcion2 (bpa / bpp / cu) el mismo objeto se llena con
+#   TrazaEstadisticas, usando los eventos de trazas.py.
+# ------------------------------------------------------------
+
+import time
+
+from trazas import Traza
+
+_CAMPOS = ("consultas", "expandidos", "aristas_relajadas", "frontera_maxima",
+           "inserciones", "entradas_obsoletas", "decrementos", "tiempo_s")
+
+
+class EstadisticasBusqueda:
+    """
+    Contadores de una o más búsquedas:
+      consultas           búsquedas registradas
+      expandidos          nodos sacados de la frontera y expandidos
+      aristas_relajadas   aristas revisadas al expandir
+      frontera_maxima     mayor tamaño de la frontera (en CU, entradas
+                          del heap contando las obsoletas)
+      inserciones         nodos agregados a la frontera (en CU, pushes al heap)
+      entradas_obsoletas  pops descartados por el chequeo de lazy deletion (CU)
+      decrementos         decrease-key (CU)
+      tiempo_s            tiempo de reloj de las búsquedas
+    """
+
+    __slots__ = _CAMPOS
+
+    def __init__(self):
+        for campo in _CAMPOS:
+            setattr(self, campo, 0)
+
+    def registrar(self, expandidos=0, aristas_relajadas=0, frontera_maxima=0, inserciones=0,
+                  entradas_obsoletas=0, decrementos=0, tiempo_s=0.0):
+        """Suma los contadores de UNA búsqueda."""
+        self.consultas += 1
+        self.expandidos += expandidos
+        self.aristas_relajadas += aristas_relajadas
+        self.frontera_maxima = max(self.frontera_maxima, frontera_maxima)
+        self.inserciones += inserciones
+        self.entradas_obsoletas += entradas_obsoletas
+        self.decrementos += decrementos
+        self.tiempo_s += tiempo_s
+
+    def registrar_recorrido(self, g, orden_visita, parent, explored, t0, objetivo=None,
+                            **contadores):
+        """
+        Registra una búsqueda terminada. `orden_visita` son etiquetas,
+        `parent`, `explored` y `objetivo` (el ID encontrado, si hubo) son
+        IDs; `contadores` trae lo que se midió en el ciclo. Lo que falta
+        se reconstruye (BPA / BPP):
+          aristas_relajadas  suma de grados de `explored` sin el objetivo
+          frontera_maxima    con `parent`: cada nodo entra a la frontera una
+                             sola vez, en el orden de inserción del dict,
+                             desde el padre que lo estaba expandiendo
+        """
+        tiempo = time.perf_counter() - t0
+        if "aristas_relajadas" not in contadores:
+            offsets = g.offsets
+            relajadas = sum(offsets[v + 1] - offsets[v] for v in explored)
+            if objetivo is not None:
+                relajadas -= offsets[objetivo + 1] - offsets[objetivo]
+            contadores["aristas_relajadas"] = relajadas
+
+        if "frontera_maxima" not in contadores:
+            etiquetas = g.etiquetas
+            posicion = {}
+            for k, nodo in enumerate(orden_visita):
+                posicion.setdefault(nodo, k)
+            entradas = [0] * len(orden_visita)
+            for padre in parent.values():
+                if padre is not None:
+                    entradas[posicion[etiquetas[padre]]] += 1
+            # Tamaño de la frontera antes de sacar el k-ésimo nodo
+            tam = maximo = 1
+            for k in range(len(orden_visita)):
+                tam += entradas[k] - 1
+                maximo = max(maximo, tam)
+            contadores["frontera_maxima"] = maximo
+            contadores["inserciones"] = len(parent) - 1
+
+        self.registrar(expandidos=len(orden_visita), tiempo_s=tiempo, **contadores)
+
+    def __iadd__(self, otra):
+        for campo in _CAMPOS:
+            if campo == "frontera_maxima":
+                self.frontera_maxima = max(self.frontera_maxima, otra.frontera_maxima)
+            else:
+                setattr(self, campo, getattr(self, campo) + getattr(otra, campo))
+        return self
+
+    def __add__(self, otra):
+        total = EstadisticasBusqueda()
+        total += self
+        total += otra
+        return total
+
+    def como_dict(self):
+        return {campo: getattr(self, campo) for campo in _CAMPOS}
+
+    def __repr__(self):
+        contenido = ", ".join(f"{campo}={getattr(self, campo)!r}" for campo in _CAMPOS)
+        return f"EstadisticasBusqueda({contenido})"
+
+
+# ============================================================
+# Opcion2: métricas a partir de los eventos de traza
+# ============================================================
+class TrazaEstadisticas(Traza):
+    """
+    Traza que llena un EstadisticasBusqueda con las búsquedas de Opcion2.
+    (Opcion2.cu descarta las entradas obsoletas sin emitir eventos, así
+    que `entradas_obsoletas` queda en 0, y su frontera_maxima cuenta
+    nodos distintos en la frontera, no entradas del heap.)
+    """
+
+    def __init__(self, estadisticas=None):
+        self.estadisticas = EstadisticasBusqueda() if estadisticas is None else estadisticas
+
+    def on_start(self, algoritmo, grafo, inicio, objetivo):
+        self._offsets = grafo.offsets
+        self._en_frontera = set()
+        self._t0 = time.perf_counter()
+        self._actual = dict(expandidos=0, aristas_relajadas=0, frontera_maxima=1,
+                            inserciones=0, decrementos=0)
+
+    def on_dequeue(self, nodo, costo, frontera, parent):
+        actual = self._actual
+        actual["expandidos"] += 1
+        actual["aristas_relajadas"] += self._offsets[nodo + 1] - self._offsets[nodo]
+        actual["frontera_maxima"] = max(actual["frontera_maxima"], len(frontera) + 1)
+        self._en_frontera.discard(nodo)
+
+    def on_enqueue(self, nodo, costo, padre):
+        actual = self._actual
+        actual["inserciones"] += 1
+        if nodo in self._en_frontera:
+            actual["decrementos"] += 1
+        self._en_frontera.add(nodo)
+
+    def on_goal(self, nodo, costo, ruta, orden_visita):
+        # on_dequeue ya contó las aristas del objetivo, que no se revisan
+        self._actual["aristas_relajadas"] -= self._offsets[nodo + 1] - self._offsets[nodo]
+        self._cerrar()
+
+    def on_fail(self, orden_visita):
+        self._cerrar()
+
+    def _cerrar(self):
+        self.estadisticas.registrar(tiempo_s=time.perf_counter() - self._t0, **self._actual)
@@ -0,0 +1,185 @@
+# ------------------------------------------------------------
+# Pruned Landmark Labeling (índice de distancias de 2 saltos)
+# - Cada nodo v guarda una etiqueta L(v) = [(hub, d(v, hub)), ...].
+#   La distancia exacta entre u y v (con pesos enteros) es
+#       min { d(u,h) + d(h,v) : h en L(u) y en L(v) }
+#   así que una consulta es un merge de dos listas cortas: sin búsqueda.
+# - Construcción: se recorren los nodos de mayor a menor grado (en una
+#   red social los "famosos" cubren casi todos los caminos) y desde
+#   cada uno se hace un BPA (saltos) o un Dijkstra (costos) PODADO:
+#   si las etiquetas ya construidas dan una distancia <= a la actual,
+#   ese nodo no recibe etiqueta ni se expande.
+# - Las etiquetas quedan en arreglos compactos tipo CSR (offsets, hubs,
+#   distancias), con los hubs de cada nodo ordenados por rango.
+# Se asume grafo no dirigido (como la red social).
+# ------------------------------------------------------------
+
+import heapq
+from array import array
+from collections import deque
+
+from red_social_busqueda import reconstruir_ruta, resolver_red
+
+INF = float("inf")
+
+
+class IndiceHubs:
+    """
+    Etiquetas de todos los nodos: para el nodo v, hubs[offsets[v]:offsets[v+1]]
+    (rangos de hub, crecientes) y sus distancias en la misma posición.
+    """
+
+    __slots__ = ("grafo", "ponderado", "offsets", "hubs", "distancias")
+
+    def __init__(self, grafo, ponderado, offsets, hubs, distancias):
+        self.grafo = grafo
+        self.ponderado = ponderado
+        self.offsets = offsets
+        self.hubs = hubs
+        self.distancias = distancias
+
+    @property
+    def tamano_promedio(self):
+        return len(self.hubs) / max(self.grafo.num_nodos, 1)
+
+    def _distancia_ids(self, u, v):
+        offsets, hubs, distancias = self.offsets, self.hubs, self.distancias
+        i, fin_u = offsets[u], offsets[u + 1]
+        j, fin_v = offsets[v], offsets[v + 1]
+        mejor = INF
+        # Merge de dos listas ordenadas por rango de hub
+        while i < fin_u and j < fin_v:
+            hu, hv = hubs[i], hubs[j]
+            if hu == hv:
+                total = distancias[i] + distancias[j]
+                if total < mejor:
+                    mejor = total
+                i += 1
+                j += 1
+            elif hu < hv:
+                i += 1
+            else:
+                j += 1
+        return mejor
+
+    def distance(self, u, v):
+        """
+        Distancia entre las etiquetas u y v (None si no hay camino).
+        Exacta con pesos enteros; con pesos float la suma sigue otro orden
+        que la de uniform_cost_search y puede diferir en el último decimal.
+        """
+        g = self.grafo
+        d = self._distancia_ids(g.id_de(u), g.id_de(v))
+        return None if d == INF else d
+
+    def ruta(self, u, v):
+        """
+        Ruta u -> v reconstruida con el índice. Solo se avanza por aristas
+        "justas": c(actual,x) + d(x,v) = d(actual,v), con tolerancia por
+        redondeo de floats. Primero se prueba el vecino de menor d(x,v)
+        (a igual d, el primero en orden lexicográfico); con aristas de
+        costo 0 un camino puede no llevar a v y se retrocede (BPP sobre
+        las aristas justas, sin repetir nodos). ValueError si ninguna lleva
+        a v (índice que no corresponde al grafo).
+        """
+        g = self.grafo
+        inicio, objetivo = g.id_de(u), g.id_de(v)
+        restante = self._distancia_ids(inicio, objetivo)
+        if restante == INF:
+            return None
+        parent = {inicio: None}
+        pila = [(inicio, restante)]
+        while pila:
+            actual, restante = pila.pop()
+            if actual == objetivo:
+                return g.etiquetar(reconstruir_ruta(parent, actual))
+            tolerancia = 1e-9 * max(1, abs(restante))
+            justos = []
+            for x, w in g.aristas(actual):
+                if x in parent:
+                    continue
+                paso = w if self.ponderado else 1
+                d = self._distancia_ids(x, objetivo)
+                if abs(paso + d - restante) <= tolerancia:
+                    justos.append((d, x))
+            # Se apilan al revés: sale primero el de menor (d, x)
+            for d, x in sorted(justos, reverse=True):
+                parent[x] = actual
+                pila.append((x, d))
+        raise ValueError(f"El índice no lleva de {u!r} a {v!r}")
+
+
+def construir_indice_hubs(red=None, ponderado=True):
+    """
+    Construye el índice. ponderado=False mide saltos (como breadth_first_search),
+    ponderado=True mide costos (como uniform_cost_search).
+    """
+    g = resolver_red(red)
+    n = g.num_nodos
+    offsets = g.offsets
+
+    # Orden de los hubs: mayor grado primero (desempate por ID)
+    orden = sorted(range(n), key=lambda v: (offsets[v] - offsets[v + 1], v))
+
+    etiq_hubs = [array("i") for _ in range(n)]
+    tipo = (getattr(g.pesos, "typecode", None) or g.pesos.format) if ponderado else "q"
+    etiq_dist = [array(tipo) for _ in range(n)]
+    tmp = array("d", [INF]) * n          # distancias de la raíz a sus hubs
+
+    for rango, raiz in enumerate(orden):
+        hubs_raiz, dist_raiz = etiq_hubs[raiz], etiq_dist[raiz]
+        for h, d in zip(hubs_raiz, dist_raiz):
+            tmp[h] = d
+
+        def podado(u, d):
+            # ¿Las etiquetas actuales ya dan d(raiz, u) <= d?
+            for h, du in zip(etiq_hubs[u], etiq_dist[u]):
+                if du + tmp[h] <= d:
+                    return True
+            return False
+
+        if ponderado:
+            dist = {raiz: 0}
+            heap = [(0, raiz)]
+            while heap:
+                d, u = heapq.heappop(heap)
+                if d != dist[u]:
+                    continue
+                if podado(u, d):
+                    continue
+                etiq_hubs[u].append(rango)
+                etiq_dist[u].append(d)
+                for v, w in g.aristas(u):
+                    nd = d + w
+                    if nd < dist.get(v, INF):
+                        dist[v] = nd
+                        heapq.heappush(heap, (nd, v))
+        else:
+            dist = {raiz: 0}
+            cola = deque([raiz])
+            while cola:
+                u = cola.popleft()
+                d = dist[u]
+                if podado(u, d):
+                    continue
+                etiq_hubs[u].append(rango)
+                etiq_dist[u].append(d)
+                for v in g.vecinos(u):
+                    if v not in dist:
+                        dist[v] = d + 1
+                        cola.append(v)
+
+        for h in hubs_raiz:
+            tmp[h] = INF
+
+    # Aplanar a CSR
+    indice_offsets = array("q", [0])
+    hubs = array("i")
+    distancias = array(tipo)
+    for v in range(n):
+        hubs.extend(etiq_hubs[v])
+        distancias.extend(etiq_dist[v])
+        indice_offsets.append(len(hubs))
+        etiq_hubs[v] = etiq_dist[v] = None
+
+    return IndiceHubs(g, ponderado, indice_offsets, hubs, distancias)
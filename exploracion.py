@@ -0,0 +1,82 @@
+# ------------------------------------------------------------
+# Exploración perezosa (generadores) con presupuestos
+# - breadth_first_search / uniform_cost_search arman todo el
+#   orden_visita y solo devuelven al final. Para "todos a costo <= 10
+#   de A" o "las primeras 100 personas alcanzadas" hacía falta inventar
+#   un objetivo o recorrer todo el grafo.
+# - Estos generadores entregan (nodo, costo, padre) a medida que cada
+#   nodo queda asentado, en el mismo orden que la búsqueda original
+#   (CU: sin repetir nodos). El que llama puede cortar cuando quiera y
+#   no se guarda ninguna lista intermedia.
+# - Presupuestos opcionales:
+#     max_saltos / max_costo  no se entregan nodos más lejos que eso
+#     max_nodos               se entregan a lo sumo tantos nodos
+# ------------------------------------------------------------
+
+import heapq
+
+from fronteras import Cola
+from red_social_busqueda import resolver_red
+
+
+def iter_breadth_first_search(initial_state, red=None, max_saltos=None, max_nodos=None):
+    """Genera (nodo, saltos, padre) en el orden de breadth_first_search."""
+    g = resolver_red(red)
+    etiquetas = g.etiquetas
+    inicio = g.id_de(initial_state)
+
+    frontier = Cola([inicio])
+    saltos = {inicio: 0}
+    parent = {inicio: None}
+    entregados = 0
+
+    while len(frontier) > 0 and (max_nodos is None or entregados < max_nodos):
+        state = frontier.decolar()
+        padre = parent.pop(state)
+        yield etiquetas[state], saltos[state], None if padre is None else etiquetas[padre]
+        entregados += 1
+
+        siguiente = saltos[state] + 1
+        if max_saltos is not None and siguiente > max_saltos:
+            continue
+        for neighbor in g.vecinos(state):
+            if neighbor not in saltos:
+                saltos[neighbor] = siguiente
+                parent[neighbor] = state
+                frontier.encolar(neighbor)
+
+
+def iter_uniform_cost_search(initial_state, red=None, max_costo=None, max_nodos=None):
+    """Genera (nodo, costo, padre) en orden de costo (desempate lexicográfico)."""
+    g = resolver_red(red)
+    etiquetas = g.etiquetas
+    inicio = g.id_de(initial_state)
+
+    explored = set()
+    parent = {inicio: None}
+    frontier_best = {inicio: 0}
+    heap = [(0, inicio)]
+    entregados = 0
+
+    while heap and (max_nodos is None or entregados < max_nodos):
+        cost, state = heapq.heappop(heap)
+        if state in explored or cost != frontier_best[state]:
+            continue                    # entrada obsoleta (lazy deletion)
+        if max_costo is not None and cost > max_costo:
+            break
+        del frontier_best[state]
+        explored.add(state)
+        padre = parent.pop(state)
+        yield etiquetas[state], cost, None if padre is None else etiquetas[padre]
+        entregados += 1
+
+        for neighbor, step in g.aristas(state):
+            if neighbor in explored:
+                continue
+            new_cost = cost + step
+            if max_costo is not None and new_cost > max_costo:
+                continue
+            if neighbor not in frontier_best or new_cost < frontier_best[neighbor]:
+                frontier_best[neighbor] = new_cost
+                parent[neighbor] = state
+                heapq.heappush(heap, (new_cost, neighbor))
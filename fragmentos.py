@@ -0,0 +1,384 @@
+# ------------------------------------------------------------
+# Grafo fragmentado: BPA y CU distribuidas entre procesos
+# - El grafo se parte en `num_fragmentos` fragmentos; cada uno lo
+#   atiende un proceso trabajador que solo guarda SUS nodos (filas del
+#   CSR con destinos en IDs globales). Cada trabajador abre el grafo
+#   binario (.gcsr, ver cargador_grafo) con mmap y copia solo sus filas;
+#   el coordinador se queda con la tabla de etiquetas. Así ningún
+#   proceso arma el grafo entero en su memoria. Particiones:
+#     "hash"    dueño(v) = v % k (reparte parejo, corta muchas aristas)
+#     "rangos"  rangos contiguos de IDs con la misma cantidad de arcos
+#               (corta pocas aristas si los IDs tienen localidad, p. ej.
+#               etiquetas por zona o el anillo de Watts–Strogatz)
+# - Un coordinador maneja las rondas y reenvía los lotes de frontera
+#   entre fragmentos por Pipes (topología estrella): cada mensaje a un
+#   fragmento es la lista de nodos/relajaciones que le tocan.
+# - BPA síncrona por niveles: en cada ronda los fragmentos asientan los
+#   candidatos del nivel que no conocían y devuelven los vecinos para el
+#   nivel siguiente, agrupados por dueño.
+# - CU con delta-stepping: las distancias tentativas caen en cubetas de
+#   ancho `delta`. Para la cubeta mínima se relajan las aristas livianas
+#   (w <= delta) en rondas hasta que nada cambia, luego una vez las
+#   pesadas, y se pasa a la siguiente cubeta. El objetivo está resuelto
+#   cuando su distancia queda debajo de la cubeta ya procesada.
+# - Los costos (saltos en BPA, costo en CU) coinciden con
+#   breadth_first_search / uniform_cost_search; ante empates la ruta
+#   puede ser otra del mismo costo.
+# Procesos locales hacen de nodos del cluster (multiprocessing).
+# ------------------------------------------------------------
+
+import multiprocessing
+import os
+import tempfile
+from array import array
+from bisect import bisect_right
+
+from cargador_grafo import cargar_binario, guardar_binario
+from red_social_busqueda import resolver_red
+
+INF = float("inf")
+
+
+# ============================================================
+# Partición y fragmentos
+# ============================================================
+class Particion:
+    """Dueño de cada nodo y su fila dentro del fragmento del dueño."""
+
+    __slots__ = ("tipo", "num", "limites")
+
+    def __init__(self, tipo, num, limites=None):
+        self.tipo = tipo
+        self.num = num
+        self.limites = limites     # solo "rangos": primer ID de cada fragmento (+ n)
+
+    @classmethod
+    def crear(cls, g, num, tipo="hash"):
+        if tipo == "hash":
+            return cls("hash", num)
+        if tipo == "rangos":
+            # Cortes donde el acumulado de arcos pasa por m*j/num (solo
+            # se leen los offsets)
+            offsets, n, m = g.offsets, g.num_nodos, g.num_arcos
+            limites = [0]
+            v = 0
+            for j in range(1, num):
+                meta = m * j // num
+                while v < n and offsets[v] < meta:
+                    v += 1
+                limites.append(max(v, limites[-1]))
+            limites.append(n)
+            return cls("rangos", num, limites)
+        raise ValueError(f"Partición desconocida: {tipo!r} (use hash o rangos)")
+
+    def dueno(self, v):
+        if self.tipo == "hash":
+            return v % self.num
+        return bisect_right(self.limites, v) - 1
+
+    def local(self, v):
+        if self.tipo == "hash":
+            return v // self.num
+        return v - self.limites[self.dueno(v)]
+
+    def nodos(self, j, n):
+        if self.tipo == "hash":
+            return range(j, n, self.num)
+        return range(self.limites[j], self.limites[j + 1])
+
+
+class Fragmento:
+    """Filas del CSR de los nodos de un fragmento (destinos en IDs globales)."""
+
+    __slots__ = ("numero", "particion", "offsets", "destinos", "pesos")
+
+    def __init__(self, numero, particion, offsets, destinos, pesos):
+        self.numero = numero
+        self.particion = particion
+        self.offsets = offsets
+        self.destinos = destinos
+        self.pesos = pesos
+
+    @classmethod
+    def desde_grafo(cls, g, particion, j):
+        offsets = array("q", [0])
+        destinos = array("i")
+        pesos = array(getattr(g.pesos, "typecode", None) or g.pesos.format)
+        for v in particion.nodos(j, g.num_nodos):
+            inicio, fin = g.offsets[v], g.offsets[v + 1]
+            destinos.extend(g.destinos[inicio:fin])
+            pesos.extend(g.pesos[inicio:fin])
+            offsets.append(len(destinos))
+        return cls(j, particion, offsets, destinos, pesos)
+
+    @classmethod
+    def desde_archivo(cls, ruta, particion, j):
+        # El mmap solo vive mientras se copian las filas propias
+        return cls.desde_grafo(cargar_binario(ruta), particion, j)
+
+    def aristas(self, v):
+        fila = self.particion.local(v)
+        inicio, fin = self.offsets[fila], self.offsets[fila + 1]
+        return zip(self.destinos[inicio:fin], self.pesos[inicio:fin])
+
+
+# ============================================================
+# Proceso trabajador
+# ============================================================
+def _trabajador(conexion, ruta, particion, numero):
+    fragmento = Fragmento.desde_archivo(ruta, particion, numero)
+    # Listo: suma y cantidad de pesos propios (para el delta por defecto)
+    conexion.send((sum(fragmento.pesos), len(fragmento.pesos)))
+    dueno = fragmento.particion.dueno
+    propio = fragmento.numero
+    dist, parent, cubetas, asentados = {}, {}, {}, set()
+    objetivo, delta = None, None
+
+    while True:
+        mensaje = conexion.recv()
+        op = mensaje[0]
+
+        if op == "fin":
+            break
+
+        elif op == "reiniciar":
+            _, objetivo, delta = mensaje
+            dist, parent, cubetas, asentados = {}, {}, {}, set()
+
+        elif op == "nivel":
+            # BPA: asentar candidatos nuevos y mandar sus vecinos al dueño
+            _, nivel, entrantes = mensaje
+            nuevos = []
+            for v, padre in entrantes:
+                if v not in dist:
+                    dist[v] = nivel
+                    parent[v] = padre
+                    nuevos.append(v)
+            salida = {}
+            for v in nuevos:
+                for u, _ in fragmento.aristas(v):
+                    j = dueno(u)
+                    if j == propio and u in dist:
+                        continue
+                    salida.setdefault(j, {}).setdefault(u, v)
+            conexion.send(({j: list(c.items()) for j, c in salida.items()},
+                           dist.get(objetivo)))
+
+        elif op == "paso":
+            # CU (delta-stepping): aplicar relajaciones y luego la fase pedida
+            _, fase, i, entrantes = mensaje
+            for u, costo, padre in entrantes:
+                anterior = dist.get(u, INF)
+                if costo < anterior:
+                    if anterior != INF:
+                        cubeta = cubetas.get(int(anterior // delta))
+                        if cubeta:
+                            cubeta.discard(u)
+                    dist[u] = costo
+                    parent[u] = padre
+                    cubetas.setdefault(int(costo // delta), set()).add(u)
+
+            if fase == "ligeras":
+                origenes = cubetas.pop(i, set())
+                asentados |= origenes
+                livianas = True
+            elif fase == "pesadas":
+                origenes, asentados = asentados, set()
+                livianas = False
+            else:
+                origenes = ()
+
+            salida = {}
+            for v in origenes:
+                base = dist[v]
+                for u, w in fragmento.aristas(v):
+                    if (w <= delta) != livianas:
+                        continue
+                    costo = base + w
+                    j = dueno(u)
+                    if j == propio and costo >= dist.get(u, INF):
+                        continue
+                    lote = salida.setdefault(j, {})
+                    if u not in lote or costo < lote[u][0]:
+                        lote[u] = (costo, v)
+            minima = min((k for k, c in cubetas.items() if c), default=None)
+            conexion.send(({j: [(u, c, v) for u, (c, v) in lote.items()] for j, lote in salida.items()},
+                           minima, dist.get(objetivo)))
+
+        elif op == "padre":
+            conexion.send(parent.get(mensaje[1]))
+
+
+# ============================================================
+# Coordinador
+# ============================================================
+class GrafoFragmentado:
+    """
+    Coordinador de `num_fragmentos` procesos, cada uno con un fragmento
+    de la red. `red` es la ruta de un grafo binario (.gcsr) o, para
+    redes que ya están en memoria, un GrafoCSR / dict / None (red
+    global), que se vuelca a un .gcsr temporal. Se usa como context
+    manager (o iniciar() / cerrar()). `estadisticas` guarda rondas y
+    mensajes de la última consulta.
+    """
+
+    def __init__(self, red=None, num_fragmentos=4, particion="hash", contexto=None):
+        self._temporal = None
+        if not isinstance(red, str):
+            descriptor, ruta = tempfile.mkstemp(suffix=".gcsr")
+            os.close(descriptor)
+            self._temporal = ruta
+            guardar_binario(resolver_red(red), ruta)
+            red = ruta
+        self.ruta = red
+        # Del grafo el coordinador solo usa la tabla de etiquetas (y los
+        # offsets para la partición por rangos), leídas por mmap
+        g = cargar_binario(red)
+        self.etiquetas = g.etiquetas
+        self.indice = g.indice
+        self.particion = Particion.crear(g, num_fragmentos, particion)
+        self.num_fragmentos = num_fragmentos
+        self._contexto = contexto or multiprocessing.get_context()
+        self._conexiones = []
+        self._procesos = []
+        self.delta = None
+        self.estadisticas = {}
+
+    def iniciar(self):
+        for j in range(self.num_fragmentos):
+            propia, remota = self._contexto.Pipe()
+            proceso = self._contexto.Process(
+                target=_trabajador, args=(remota, self.ruta, self.particion, j), daemon=True)
+            proceso.start()
+            remota.close()
+            self._conexiones.append(propia)
+            self._procesos.append(proceso)
+        # Cada trabajador avisa que cargó su fragmento: delta por defecto
+        # = peso promedio de todos los arcos
+        suma = arcos = 0
+        for conexion in self._conexiones:
+            suma_fragmento, arcos_fragmento = conexion.recv()
+            suma += suma_fragmento
+            arcos += arcos_fragmento
+        self.delta = max(1, suma / arcos) if arcos else 1
+        return self
+
+    def cerrar(self):
+        for conexion in self._conexiones:
+            try:
+                conexion.send(("fin",))
+            except (BrokenPipeError, OSError):
+                pass
+            conexion.close()
+        for proceso in self._procesos:
+            proceso.join()
+        self._conexiones, self._procesos = [], []
+        if self._temporal is not None:
+            self.etiquetas = self.indice = None     # sueltan el mmap del archivo
+            os.remove(self._temporal)
+            self._temporal = None
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    # --------------------------------------------------------
+    def _difundir(self, mensaje):
+        for conexion in self._conexiones:
+            conexion.send(mensaje)
+
+    def _ronda(self, mensajes):
+        """Manda a cada fragmento su mensaje y junta las respuestas."""
+        for conexion, mensaje in zip(self._conexiones, mensajes):
+            conexion.send(mensaje)
+        self.estadisticas["rondas"] += 1
+        return [conexion.recv() for conexion in self._conexiones]
+
+    def _juntar(self, salidas):
+        entrantes = [[] for _ in range(self.num_fragmentos)]
+        for salida in salidas:
+            for j, lote in salida.items():
+                entrantes[j].extend(lote)
+                self.estadisticas["mensajes"] += len(lote)
+        return entrantes
+
+    def _ruta(self, objetivo):
+        ruta = []
+        v = objetivo
+        while v is not None:
+            ruta.append(v)
+            conexion = self._conexiones[self.particion.dueno(v)]
+            conexion.send(("padre", v))
+            v = conexion.recv()
+        ruta.reverse()
+        etiquetas = self.etiquetas
+        return [etiquetas[v] for v in ruta]
+
+    def _preparar(self, initial_state, goal_state, delta):
+        self.estadisticas = {"rondas": 0, "mensajes": 0}
+        inicio = self.indice[initial_state]
+        objetivo = self.indice[goal_state]
+        self._difundir(("reiniciar", objetivo, delta))
+        return inicio, objetivo
+
+
+def distributed_breadth_first_search(initial_state, goal_state, fragmentado):
+    """
+    BPA síncrona por niveles sobre un GrafoFragmentado iniciado.
+    Devuelve (ok, ruta, saltos).
+    """
+    fr = fragmentado
+    inicio, objetivo = fr._preparar(initial_state, goal_state, None)
+    entrantes = [[] for _ in range(fr.num_fragmentos)]
+    entrantes[fr.particion.dueno(inicio)].append((inicio, None))
+
+    nivel = 0
+    while any(entrantes):
+        respuestas = fr._ronda([("nivel", nivel, lote) for lote in entrantes])
+        if any(saltos is not None for _, saltos in respuestas):
+            return True, fr._ruta(objetivo), nivel
+        entrantes = fr._juntar(salida for salida, _ in respuestas)
+        nivel += 1
+    return False, None, None
+
+
+def distributed_uniform_cost_search(initial_state, goal_state, fragmentado, delta=None):
+    """
+    CU con delta-stepping sobre un GrafoFragmentado iniciado.
+    `delta` es el ancho de las cubetas (por defecto, el peso promedio).
+    Devuelve (ok, ruta, costo).
+    """
+    fr = fragmentado
+    delta = delta or fr.delta
+    inicio, objetivo = fr._preparar(initial_state, goal_state, delta)
+    vacios = [[] for _ in range(fr.num_fragmentos)]
+
+    def paso(fase, i, entrantes):
+        respuestas = fr._ronda([("paso", fase, i, lote) for lote in entrantes])
+        minimas = [minima for _, minima, _ in respuestas if minima is not None]
+        costo = next((c for _, _, c in respuestas if c is not None), None)
+        return fr._juntar(salida for salida, _, _ in respuestas), minimas, costo
+
+    entrantes = [[] for _ in range(fr.num_fragmentos)]
+    entrantes[fr.particion.dueno(inicio)].append((inicio, 0, None))
+    _, minimas, costo = paso("aplicar", None, entrantes)
+
+    while minimas:
+        i = min(minimas)
+        # Aristas livianas de la cubeta i, hasta que no cambie nada
+        entrantes = vacios
+        while True:
+            entrantes, _, costo = paso("ligeras", i, entrantes)
+            if not any(entrantes):
+                break
+        if costo is not None and costo < (i + 1) * delta:
+            return True, fr._ruta(objetivo), costo
+        # Aristas pesadas de todo lo asentado en la cubeta i
+        entrantes, _, _ = paso("pesadas", i, vacios)
+        _, minimas, costo = paso("aplicar", None, entrantes)
+
+    if costo is not None:
+        return True, fr._ruta(objetivo), costo
+    return False, None, None
@@ -0,0 +1,73 @@
+# ------------------------------------------------------------
+# Fronteras para BPA / BPP
+# - Cola (Queue FIFO) y Pila (Stack LIFO) del pseudocódigo del profe
+# - Cada una guarda, junto al contenedor, un índice (set) de los
+#   nodos que están en la frontera: "neighbor in frontier" es O(1)
+#   en vez de recorrer la lista.
+# - Un nodo está a lo sumo una vez en la frontera: el llamador
+#   revisa `in` antes de insertar (regla del pseudocódigo).
+# ------------------------------------------------------------
+
+from collections import deque
+
+
+class Cola:
+    """Queue FIFO con pertenencia O(1): encolar/decolar/`in` en O(1)."""
+
+    __slots__ = ("_items", "_en_frontera")
+
+    def __init__(self, nodos=()):
+        self._items = deque()
+        self._en_frontera = set()
+        for nodo in nodos:
+            self.encolar(nodo)
+
+    def encolar(self, nodo):
+        self._items.append(nodo)
+        self._en_frontera.add(nodo)
+
+    def decolar(self):
+        nodo = self._items.popleft()
+        self._en_frontera.discard(nodo)
+        return nodo
+
+    def __contains__(self, nodo):
+        return nodo in self._en_frontera
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        # Del frente (próximo a salir) al final
+        return iter(self._items)
+
+
+class Pila:
+    """Stack LIFO con pertenencia O(1): apilar/desapilar/`in` en O(1)."""
+
+    __slots__ = ("_items", "_en_frontera")
+
+    def __init__(self, nodos=()):
+        self._items = []
+        self._en_frontera = set()
+        for nodo in nodos:
+            self.apilar(nodo)
+
+    def apilar(self, nodo):
+        self._items.append(nodo)
+        self._en_frontera.add(nodo)
+
+    def desapilar(self):
+        nodo = self._items.pop()
+        self._en_frontera.discard(nodo)
+        return nodo
+
+    def __contains__(self, nodo):
+        return nodo in self._en_frontera
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        # Del fondo al tope (como se imprime una lista usada como pila)
+        return iter(self._items)
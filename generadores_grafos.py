@@ -0,0 +1,109 @@
+# ------------------------------------------------------------
+# Generadores reproducibles de redes sociales sintéticas
+# - Barabási–Albert (BA): crecimiento con enlace preferencial, aparecen
+#   "famosos" con grado muy alto (como en una red social real).
+# - Erdős–Rényi (ER): G(n, m), m aristas al azar entre n nodos.
+# - Watts–Strogatz (WS): anillo de k vecinos con recableado p
+#   ("mundo pequeño": muy agrupado y con caminos cortos).
+# - Todas no dirigidas, con costos enteros en el mismo rango que
+#   `grafo` (2 a 7) y la misma semilla -> el mismo grafo.
+# - Las etiquetas son "n" + número con ceros a la izquierda, así el
+#   orden lexicográfico es el numérico. Los arcos se acumulan en
+#   arreglos y se arman con el mismo CSR que cargar_lista_aristas.
+# ------------------------------------------------------------
+
+import random
+from array import array
+
+from cargador_grafo import csr_desde_arcos
+
+COSTO_MIN = 2
+COSTO_MAX = 7
+
+
+class _Arcos:
+    """Arcos no dirigidos acumulados en arreglos paralelos."""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.origenes = array("i")
+        self.destinos = array("i")
+        self.pesos = array("q")
+
+    def agregar(self, u, v):
+        if u == v:
+            return
+        w = self.rng.randint(COSTO_MIN, COSTO_MAX)
+        self.origenes.append(u)
+        self.destinos.append(v)
+        self.pesos.append(w)
+        self.origenes.append(v)
+        self.destinos.append(u)
+        self.pesos.append(w)
+
+    def grafo(self, n):
+        ancho = len(str(max(n - 1, 0)))
+        indice = {f"n{i:0{ancho}d}": i for i in range(n)}
+        return csr_desde_arcos(indice, self.origenes, self.destinos, self.pesos)
+
+
+def barabasi_albert(n, m=5, semilla=0):
+    """n nodos; cada nodo nuevo se une a m nodos existentes, con probabilidad proporcional al grado."""
+    rng = random.Random(semilla)
+    arcos = _Arcos(rng)
+    m = max(1, min(m, n - 1))
+    # Cada nodo aparece en `extremos` tantas veces como su grado
+    extremos = array("i")
+    for v in range(1, m + 1):
+        arcos.agregar(0, v)
+        extremos.extend((0, v))
+    for v in range(m + 1, n):
+        elegidos = set()
+        while len(elegidos) < m:
+            elegidos.add(extremos[rng.randrange(len(extremos))])
+        for u in elegidos:
+            arcos.agregar(v, u)
+            extremos.extend((v, u))
+    return arcos.grafo(n)
+
+
+def erdos_renyi(n, m, semilla=0):
+    """G(n, m): m pares de nodos al azar (las repeticiones se compactan)."""
+    rng = random.Random(semilla)
+    arcos = _Arcos(rng)
+    if n > 1:
+        for _ in range(m):
+            arcos.agregar(rng.randrange(n), rng.randrange(n))
+    return arcos.grafo(n)
+
+
+def watts_strogatz(n, k=10, p=0.1, semilla=0):
+    """Anillo con cada nodo unido a sus k vecinos más cercanos; cada arista se recablea con probabilidad p."""
+    rng = random.Random(semilla)
+    arcos = _Arcos(rng)
+    if n > 1:
+        for u in range(n):
+            for salto in range(1, k // 2 + 1):
+                v = (u + salto) % n
+                if rng.random() < p:
+                    v = rng.randrange(n)
+                arcos.agregar(u, v)
+    return arcos.grafo(n)
+
+
+MODELOS = {"BA": barabasi_albert, "ER": erdos_renyi, "WS": watts_strogatz}
+
+
+def generar(modelo, aristas, semilla=0, grado=10):
+    """
+    Grafo del `modelo` ("BA", "ER" o "WS") con alrededor de `aristas`
+    aristas no dirigidas y grado promedio cercano a `grado`.
+    """
+    n = max(2, 2 * aristas // grado)
+    if modelo == "BA":
+        return barabasi_albert(n, grado // 2, semilla)
+    if modelo == "ER":
+        return erdos_renyi(n, aristas, semilla)
+    if modelo == "WS":
+        return watts_strogatz(n, grado, semilla=semilla)
+    raise ValueError(f"Modelo desconocido: {modelo!r} (use BA, ER o WS)")
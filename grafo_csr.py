@@ -0,0 +1,163 @@
+# ------------------------------------------------------------
+# Grafo CSR (Compressed Sparse Row) para la red social
+# - Las etiquetas ('A', 'B', ...) se internan a IDs enteros 0..n-1
+# - Adyacencia y pesos en arreglos compactos (array), no dicts
+# - Los IDs se asignan en orden lexicográfico de las etiquetas, así
+#   que una fila ordenada por ID ya está en orden alfabético y el
+#   orden inverso (para la pila de BPP) sale de recorrerla al revés:
+#   no hay que llamar sorted() en cada expansión.
+# ------------------------------------------------------------
+
+from array import array
+from bisect import bisect_left
+from itertools import count
+
+_versiones = count()
+
+
+class GrafoCSR:
+    """
+    Grafo congelado (inmutable) en formato CSR.
+
+    Para el nodo u, sus vecinos son destinos[offsets[u]:offsets[u+1]]
+    (en orden lexicográfico) y los costos de esas aristas están en la
+    misma posición de `pesos`.
+
+    Los arreglos pueden ser `array` o cualquier secuencia de enteros que
+    se pueda indexar y rebanar (p. ej. memoryview sobre un mmap, ver
+    cargador_grafo.py). `indice` (etiqueta -> ID) se arma a partir de
+    `etiquetas` si no se entrega.
+
+    Cada grafo construido recibe una `version` única y creciente: como el
+    grafo es inmutable, cambiar una arista implica un grafo (y una versión)
+    nuevo, y los caches usan eso para descartar resultados viejos.
+    """
+
+    __slots__ = ("etiquetas", "indice", "offsets", "destinos", "pesos", "version")
+
+    def __init__(self, etiquetas, offsets, destinos, pesos, indice=None):
+        if len(offsets) != len(etiquetas) + 1:
+            raise ValueError("offsets debe tener len(etiquetas) + 1 posiciones")
+        if len(destinos) != len(pesos) or offsets[-1] != len(destinos):
+            raise ValueError("destinos y pesos no coinciden con offsets")
+        if indice is None:
+            etiquetas = list(etiquetas)
+            indice = {etiqueta: i for i, etiqueta in enumerate(etiquetas)}
+        self.etiquetas = etiquetas
+        self.indice = indice
+        self.offsets = offsets
+        self.destinos = destinos
+        self.pesos = pesos
+        self.version = next(_versiones)
+
+    # ---------------------------
+    # Construcción
+    # ---------------------------
+    @classmethod
+    def desde_arcos(cls, arcos, nodos=()):
+        """
+        Construye el grafo a partir de arcos dirigidos (origen, destino, costo).
+        Para un grafo no dirigido deben venir ambos sentidos. `nodos` permite
+        incluir nodos aislados.
+        """
+        filas = {nodo: {} for nodo in nodos}
+        for origen, destino, costo in arcos:
+            filas.setdefault(origen, {})[destino] = costo
+            filas.setdefault(destino, {})
+
+        etiquetas = sorted(filas)
+        indice = {etiqueta: i for i, etiqueta in enumerate(etiquetas)}
+
+        offsets = array("q", [0])
+        destinos = array("i")
+        costos = []
+        for etiqueta in etiquetas:
+            fila = sorted((indice[v], c) for v, c in filas[etiqueta].items())
+            for v, c in fila:
+                destinos.append(v)
+                costos.append(c)
+            offsets.append(len(destinos))
+
+        return cls(etiquetas, offsets, destinos, _arreglo_pesos(costos))
+
+    @classmethod
+    def desde_dict(cls, grafo):
+        """Formato de red_social_busqueda: grafo[nodo] = {vecino: costo}."""
+        return cls.desde_arcos(
+            ((u, v, c) for u, vecinos in grafo.items() for v, c in vecinos.items()),
+            nodos=grafo,
+        )
+
+    @classmethod
+    def desde_listas(cls, grafo):
+        """Formato de Opcion2.crear_grafo: grafo[nodo] = [(vecino, costo), ...]."""
+        return cls.desde_arcos(
+            ((u, v, c) for u, vecinos in grafo.items() for v, c in vecinos),
+            nodos=grafo,
+        )
+
+    # ---------------------------
+    # Consultas
+    # ---------------------------
+    @property
+    def num_nodos(self):
+        return len(self.etiquetas)
+
+    @property
+    def num_arcos(self):
+        return len(self.destinos)
+
+    def __len__(self):
+        return len(self.etiquetas)
+
+    def __contains__(self, etiqueta):
+        return etiqueta in self.indice
+
+    def id_de(self, etiqueta):
+        return self.indice[etiqueta]
+
+    def etiquetar(self, ids):
+        etiquetas = self.etiquetas
+        return [etiquetas[i] for i in ids]
+
+    def vecinos(self, u):
+        """IDs vecinos de u en orden lexicográfico."""
+        return self.destinos[self.offsets[u]:self.offsets[u + 1]]
+
+    def vecinos_inverso(self, u):
+        """IDs vecinos de u en orden lexicográfico inverso."""
+        return self.destinos[self.offsets[u]:self.offsets[u + 1]][::-1]
+
+    def aristas(self, u):
+        """Pares (vecino, costo) de u en orden lexicográfico."""
+        inicio, fin = self.offsets[u], self.offsets[u + 1]
+        return zip(self.destinos[inicio:fin], self.pesos[inicio:fin])
+
+    def costo(self, u, v):
+        """Costo de la arista u -> v (búsqueda binaria en la fila de u)."""
+        inicio, fin = self.offsets[u], self.offsets[u + 1]
+        pos = bisect_left(self.destinos, v, inicio, fin)
+        if pos == fin or self.destinos[pos] != v:
+            raise KeyError((self.etiquetas[u], self.etiquetas[v]))
+        return self.pesos[pos]
+
+
+def _arreglo_pesos(costos):
+    # Enteros si todos lo son (así el costo total se imprime como 11 y no 11.0)
+    if all(isinstance(c, int) for c in costos):
+        return array("q", costos)
+    return array("d", costos)
+
+
+def como_csr(grafo):
+    """
+    Devuelve `grafo` como GrafoCSR. Acepta un GrafoCSR (sin copiar),
+    un dict-de-dicts (red_social_busqueda) o un dict-de-listas (Opcion2).
+    """
+    if isinstance(grafo, GrafoCSR):
+        return grafo
+    for vecinos in grafo.values():
+        if isinstance(vecinos, dict):
+            return GrafoCSR.desde_dict(grafo)
+        return GrafoCSR.desde_listas(grafo)
+    return GrafoCSR([], array("q", [0]), array("i"), array("q"))
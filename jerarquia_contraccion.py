@@ -0,0 +1,306 @@
+# ------------------------------------------------------------
+# Contraction Hierarchies (CH) para consultas de costo mínimo
+# - Preproceso (offline, una vez por grafo): se "contraen" los nodos
+#   uno a uno en orden de importancia. Al contraer v, si el único
+#   camino más barato entre dos vecinos u, w pasa por v, se agrega un
+#   atajo u-w con costo c(u,v) + c(v,w) que recuerda a v como nodo medio.
+#   El orden sale de la "diferencia de aristas" (atajos agregados -
+#   aristas eliminadas + vecinos ya contraídos), con actualización
+#   perezosa en un heap. La prioridad inicial es una estimación sin
+#   Dijkstras (solo testigos de un salto, y para los nodos de grado
+#   mayor a GRADO_ESTIMACION todos los pares): nunca es menor que la
+#   real, que se calcula recién al sacar el nodo del heap.
+# - Consulta: Dijkstra bidireccional que solo sube en la jerarquía
+#   (de un nodo a otro de mayor rango). Explora unos cientos de nodos
+#   en vez de una bola completa alrededor del inicio.
+# - Núcleo: en redes sociales (y aleatorias) los últimos nodos forman
+#   un núcleo muy denso donde contraer solo agrega atajos. Cuando el
+#   grado promedio de lo que queda supera `grado_nucleo` se deja de
+#   contraer; esos nodos comparten el rango más alto y guardan todas
+#   sus aristas entre sí, así la consulta los cruza como un Dijkstra
+#   bidireccional normal.
+# - Los atajos se desempacan recursivamente, así que la ruta devuelta
+#   es una lista de nodos del grafo original (como reconstruir_ruta).
+#
+# Se asume grafo no dirigido (como la red social): el mismo grafo
+# "hacia arriba" sirve para la búsqueda de ida y la de vuelta.
+# ------------------------------------------------------------
+
+import heapq
+from array import array
+from bisect import bisect_left
+
+from red_social_busqueda import resolver_red
+
+SIN_MEDIO = -1   # arista original (no es atajo)
+GRADO_ESTIMACION = 64   # hasta este grado la estimación inicial revisa pares
+
+
+class JerarquiaContraccion:
+    """
+    Resultado del preproceso. `rango[v]` es la posición de v en el orden
+    de contracción (los nodos del núcleo comparten el rango más alto) y,
+    en formato CSR, para cada nodo u sus aristas hacia nodos de mayor
+    rango (o, si u es del núcleo, hacia los demás nodos del núcleo):
+    destinos / pesos / medios (SIN_MEDIO si la arista es original).
+    Las filas están ordenadas por destino.
+    """
+
+    __slots__ = ("grafo", "rango", "offsets", "destinos", "pesos", "medios")
+
+    def __init__(self, grafo, rango, offsets, destinos, pesos, medios):
+        self.grafo = grafo
+        self.rango = rango
+        self.offsets = offsets
+        self.destinos = destinos
+        self.pesos = pesos
+        self.medios = medios
+
+    @property
+    def num_atajos(self):
+        return sum(1 for medio in self.medios if medio != SIN_MEDIO)
+
+    def arista(self, u, v):
+        """(costo, medio) de la arista entre u y v guardada en el nodo de menor rango."""
+        if self.rango[u] > self.rango[v]:
+            u, v = v, u
+        inicio, fin = self.offsets[u], self.offsets[u + 1]
+        pos = bisect_left(self.destinos, v, inicio, fin)
+        if pos == fin or self.destinos[pos] != v:
+            raise KeyError((u, v))
+        return self.pesos[pos], self.medios[pos]
+
+
+# ============================================================
+# Preproceso
+# ============================================================
+def construir_jerarquia(red=None, limite_testigos=50, grado_nucleo=20):
+    """
+    Contrae los nodos de la red y devuelve la JerarquiaContraccion.
+    `limite_testigos` acota cuántos nodos asienta cada búsqueda de testigo
+    (más alto = menos atajos innecesarios, preproceso más lento).
+    `grado_nucleo` es el grado promedio a partir del cual los nodos que
+    quedan se dejan como núcleo sin contraer (None = contraer todo).
+    """
+    g = resolver_red(red)
+    n = g.num_nodos
+
+    # Grafo de trabajo: ady[u][v] = (costo, medio) entre nodos sin contraer
+    ady = [dict() for _ in range(n)]
+    for u in range(n):
+        for v, w in g.aristas(u):
+            if u != v and (v not in ady[u] or w < ady[u][v][0]):
+                ady[u][v] = (w, SIN_MEDIO)
+
+    arcos_vivos = sum(len(vecinos) for vecinos in ady)
+    vecinos_contraidos = array("i", bytes(4 * n))
+    rango = array("i", bytes(4 * n))
+    arriba = [None] * n   # aristas de v hacia nodos de mayor rango
+
+    def prioridad(v):
+        atajos = _atajos(ady, v, limite_testigos)
+        return len(atajos) - len(ady[v]) + vecinos_contraidos[v], atajos
+
+    heap = [(_diferencia_estimada(ady, v), v) for v in range(n)]
+    heapq.heapify(heap)
+
+    siguiente_rango = 0
+    while heap:
+        if grado_nucleo is not None and arcos_vivos > grado_nucleo * (n - siguiente_rango):
+            break
+        _, v = heapq.heappop(heap)
+        # Actualización perezosa: si la prioridad real empeoró, reinsertar
+        actual, atajos = prioridad(v)
+        if heap and actual > heap[0][0]:
+            heapq.heappush(heap, (actual, v))
+            continue
+
+        rango[v] = siguiente_rango
+        siguiente_rango += 1
+        arriba[v] = sorted((u, w, medio) for u, (w, medio) in ady[v].items())
+
+        for u in ady[v]:
+            del ady[u][v]
+            vecinos_contraidos[u] += 1
+        arcos_vivos -= 2 * len(ady[v])
+        for u, x, w in atajos:
+            if x not in ady[u]:
+                arcos_vivos += 2
+            if x not in ady[u] or w < ady[u][x][0]:
+                ady[u][x] = (w, v)
+                ady[x][u] = (w, v)
+        ady[v] = None
+
+    # Núcleo: los nodos sin contraer quedan arriba de todo, con sus aristas
+    for _, v in heap:
+        if ady[v] is not None:
+            rango[v] = siguiente_rango
+            arriba[v] = sorted((u, w, medio) for u, (w, medio) in ady[v].items())
+            ady[v] = None
+
+    # Aplanar a CSR
+    offsets = array("q", [0])
+    destinos = array("i")
+    pesos = array(getattr(g.pesos, "typecode", None) or g.pesos.format)
+    medios = array("i")
+    for v in range(n):
+        for u, w, medio in arriba[v]:
+            destinos.append(u)
+            pesos.append(w)
+            medios.append(medio)
+        offsets.append(len(destinos))
+
+    return JerarquiaContraccion(g, rango, offsets, destinos, pesos, medios)
+
+
+def _atajos(ady, v, limite_testigos):
+    """
+    Atajos (u, w, costo) que harían falta al contraer v: para cada par de
+    vecinos u, w se busca un "testigo" (camino u -> w que no pase por v y
+    cueste <= c(u,v) + c(v,w)) con un Dijkstra acotado desde u.
+    """
+    vecinos = list(ady[v].items())
+    atajos = []
+    for i, (u, (w_uv, _)) in enumerate(vecinos):
+        restantes = vecinos[i + 1:]
+        if not restantes:
+            break
+        tope = w_uv + max(w_vx for _, (w_vx, _) in restantes)
+        dist = _dijkstra_testigo(ady, u, v, tope, limite_testigos)
+        for x, (w_vx, _) in restantes:
+            necesario = w_uv + w_vx
+            if dist.get(x, necesario + 1) > necesario:
+                atajos.append((u, x, necesario))
+    return atajos
+
+
+def _diferencia_estimada(ady, v):
+    """
+    Diferencia de aristas inicial de v con testigos de un solo salto (la
+    arista directa u-x): sobreestima los atajos pero cuesta O(grado²) sin
+    búsquedas, y O(1) en los hubs, donde se suponen todos los pares.
+    """
+    vecinos = list(ady[v].items())
+    grado = len(vecinos)
+    if grado > GRADO_ESTIMACION:
+        return grado * (grado - 1) // 2 - grado
+    atajos = 0
+    for i, (u, (w_uv, _)) in enumerate(vecinos):
+        ady_u = ady[u]
+        for x, (w_vx, _) in vecinos[i + 1:]:
+            directa = ady_u.get(x)
+            if directa is None or directa[0] > w_uv + w_vx:
+                atajos += 1
+    return atajos - grado
+
+
+def _dijkstra_testigo(ady, origen, excluido, tope, limite):
+    dist = {origen: 0}
+    heap = [(0, origen)]
+    asentados = 0
+    while heap and asentados < limite:
+        cost, state = heapq.heappop(heap)
+        if cost != dist[state]:
+            continue
+        asentados += 1
+        for neighbor, (step, _) in ady[state].items():
+            if neighbor == excluido:
+                continue
+            new_cost = cost + step
+            if new_cost <= tope and new_cost < dist.get(neighbor, new_cost + 1):
+                dist[neighbor] = new_cost
+                heapq.heappush(heap, (new_cost, neighbor))
+    return dist
+
+
+# ============================================================
+# Consulta
+# ============================================================
+def contraction_hierarchy_search(initial_state, goal_state, jerarquia):
+    """
+    Costo mínimo inicio -> objetivo con la jerarquía. Devuelve la misma
+    forma que uniform_cost_search: (ok, orden_visita, ruta, costo), donde
+    orden_visita son los nodos asentados por ambas búsquedas hacia arriba.
+    """
+    ch = jerarquia
+    g = ch.grafo
+    etiquetas = g.etiquetas
+    offsets, destinos, pesos = ch.offsets, ch.destinos, ch.pesos
+    inicio = g.id_de(initial_state)
+    objetivo = g.id_de(goal_state)
+
+    dist = ({inicio: 0}, {objetivo: 0})
+    parent = ({inicio: None}, {objetivo: None})
+    heaps = ([(0, inicio)], [(0, objetivo)])
+    asentados = (set(), set())
+    orden_visita = []
+    mu, encuentro = (0, inicio) if inicio == objetivo else (None, None)
+
+    while True:
+        # Cada lado sigue mientras su mínimo pueda mejorar mu
+        activos = [lado for lado in (0, 1)
+                   if heaps[lado] and (mu is None or heaps[lado][0][0] < mu)]
+        if not activos:
+            break
+        lado = min(activos, key=lambda l: heaps[l][0][0])
+        heap, d, p, hecho = heaps[lado], dist[lado], parent[lado], asentados[lado]
+        d_otro = dist[1 - lado]
+
+        cost, state = heapq.heappop(heap)
+        if state in hecho or cost != d[state]:
+            continue
+        hecho.add(state)
+        orden_visita.append(etiquetas[state])
+
+        for pos in range(offsets[state], offsets[state + 1]):
+            neighbor = destinos[pos]
+            new_cost = cost + pesos[pos]
+            if neighbor not in d or new_cost < d[neighbor]:
+                d[neighbor] = new_cost
+                p[neighbor] = state
+                heapq.heappush(heap, (new_cost, neighbor))
+            if neighbor in d_otro:
+                total = d[neighbor] + d_otro[neighbor]
+                if mu is None or total < mu:
+                    mu, encuentro = total, neighbor
+        if state in d_otro:
+            total = cost + d_otro[state]
+            if mu is None or total < mu:
+                mu, encuentro = total, state
+
+    if encuentro is None:
+        return False, orden_visita, None, None
+
+    # Cadena de aristas de la jerarquía: inicio -> encuentro <- objetivo
+    subida = _cadena(parent[0], encuentro)
+    bajada = _cadena(parent[1], encuentro)
+    bajada.reverse()
+    cadena = subida + bajada[1:]
+
+    ruta = [cadena[0]]
+    for a, b in zip(cadena, cadena[1:]):
+        _desempacar(ch, a, b, ruta)
+    return True, orden_visita, g.etiquetar(ruta), mu
+
+
+def _cadena(parent, nodo):
+    cadena = []
+    while nodo is not None:
+        cadena.append(nodo)
+        nodo = parent[nodo]
+    cadena.reverse()
+    return cadena
+
+
+def _desempacar(ch, a, b, ruta):
+    """Agrega a `ruta` los nodos originales de a (excluido) a b (incluido)."""
+    pendientes = [(a, b)]
+    while pendientes:
+        u, v = pendientes.pop()
+        _, medio = ch.arista(u, v)
+        if medio == SIN_MEDIO:
+            ruta.append(v)
+        else:
+            # u -> medio -> v  (se apila al revés para procesar u -> medio primero)
+            pendientes.append((medio, v))
+            pendientes.append((u, medio))
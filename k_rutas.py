@@ -0,0 +1,114 @@
+# ------------------------------------------------------------
+# K rutas más baratas sin ciclos (algoritmo de Yen)
+# - uniform_cost_search da UNA ruta de costo mínimo; para recomendar
+#   "otras formas de llegar a esta persona" se necesitan las k mejores.
+# - Yen: la ruta i+1 se desvía de alguna de las i ya halladas en un
+#   "nodo de desvío". Para cada nodo de desvío de la última ruta se
+#   prohíben los nodos de la raíz (prefijo) y las aristas que ya usaron
+#   las rutas con esa misma raíz, y se busca la mejor ruta de desvío.
+# - Reuso: las distancias AL objetivo (un Dijkstra desde el objetivo
+#   sobre el grafo completo) se calculan una sola vez y sirven de
+#   heurística A* para todas las búsquedas de desvío: prohibir nodos o
+#   aristas solo alarga caminos, así que sigue siendo admisible.
+# - Poda: de los candidatos solo se guardan los k - |A| mejores (heap
+#   acotado); un desvío cuya cota (costo de la raíz + distancia al
+#   objetivo) no mejora al peor candidato guardado ni se busca, y las
+#   búsquedas de desvío se cortan en ese mismo tope.
+# `red_inversa` solo hace falta si el grafo es dirigido.
+# ------------------------------------------------------------
+
+import heapq
+
+from busqueda_alt import INF, distancias_desde
+from red_social_busqueda import reconstruir_ruta, resolver_red
+
+
+def _ruta_desvio(g, origen, objetivo, h, prohibidos, aristas_prohibidas, tope):
+    """
+    A* de `origen` a `objetivo` sin pasar por `prohibidos` ni salir de
+    `origen` hacia `aristas_prohibidas`. Devuelve (ruta de IDs, costo) o
+    None si no hay ruta de costo menor que `tope`.
+    """
+    dist = {origen: 0}
+    parent = {origen: None}
+    heap = [(h[origen], 0, origen)]
+    while heap:
+        f, cost, state = heapq.heappop(heap)
+        if cost != dist[state]:
+            continue                    # entrada obsoleta (lazy deletion)
+        if f >= tope:
+            return None
+        if state == objetivo:
+            return reconstruir_ruta(parent, state), cost
+        for neighbor, step in g.aristas(state):
+            if neighbor in prohibidos or h[neighbor] == INF:
+                continue
+            if state == origen and neighbor in aristas_prohibidas:
+                continue
+            new_cost = cost + step
+            if new_cost < dist.get(neighbor, INF):
+                dist[neighbor] = new_cost
+                parent[neighbor] = state
+                heapq.heappush(heap, (new_cost + h[neighbor], new_cost, neighbor))
+    return None
+
+
+def k_shortest_paths(initial_state, goal_state, k, red=None, red_inversa=None):
+    """
+    Hasta `k` rutas sin ciclos de `initial_state` a `goal_state`, de menor
+    a mayor costo. Devuelve una lista de (ruta, costo) con la ruta como
+    lista de etiquetas (la forma de reconstruir_ruta).
+    """
+    g = resolver_red(red)
+    g_inv = g if red_inversa is None else resolver_red(red_inversa)
+    inicio = g.id_de(initial_state)
+    objetivo = g.id_de(goal_state)
+    if k <= 0:
+        return []
+
+    h = distancias_desde(g_inv, objetivo)     # d(v, objetivo), se reusa en cada desvío
+    primera = _ruta_desvio(g, inicio, objetivo, h, set(), set(), INF)
+    if primera is None:
+        return []
+
+    ruta, costo = primera
+    halladas = [(ruta, costo)]
+    vistas = {tuple(ruta)}
+    candidatos = []                            # heap de (costo, ruta), a lo sumo k - |halladas|
+
+    while len(halladas) < k:
+        anterior, _ = halladas[-1]
+        faltan = k - len(halladas)
+        # Costo acumulado de la raíz hasta cada nodo de desvío
+        acumulado = [0]
+        for u, v in zip(anterior, anterior[1:]):
+            acumulado.append(acumulado[-1] + g.costo(u, v))
+
+        for i in range(len(anterior) - 1):
+            desvio = anterior[i]
+            raiz = anterior[:i + 1]
+            tope = max(candidatos)[0] if len(candidatos) >= faltan else INF
+            if acumulado[i] + h[desvio] >= tope:
+                continue
+
+            aristas_prohibidas = {ruta[i + 1] for ruta, _ in halladas
+                                  if len(ruta) > i + 1 and ruta[:i + 1] == raiz}
+            encontrada = _ruta_desvio(g, desvio, objetivo, h, set(raiz[:-1]),
+                                      aristas_prohibidas, tope - acumulado[i])
+            if encontrada is None:
+                continue
+            ruta = raiz[:-1] + encontrada[0]
+            clave = tuple(ruta)
+            if clave in vistas:
+                continue
+            vistas.add(clave)
+            heapq.heappush(candidatos, (acumulado[i] + encontrada[1], ruta))
+            if len(candidatos) > faltan:
+                candidatos = heapq.nsmallest(faltan, candidatos)
+
+        if not candidatos:
+            break
+        costo, ruta = heapq.heappop(candidatos)
+        halladas.append((ruta, costo))
+
+    return [(g.etiquetar(ruta), costo) for ruta, costo in halladas]
@@ -0,0 +1,152 @@
+# ------------------------------------------------------------
+# Modo por lotes sin interacción: consultas JSONL -> resultados JSONL
+# - Lee consultas línea por línea (de un archivo o de stdin), corre el
+#   algoritmo pedido y escribe un resultado por línea apenas lo tiene:
+#   nunca guarda toda la entrada, así se pueden encadenar millones de
+#   consultas con pipes.
+# - Entrada (una por línea; "id" y "algoritmo" son opcionales, CU por defecto):
+#     {"id": 7, "algoritmo": "BPA", "inicio": "A", "objetivo": "G"}
+# - Salida:
+#     {"id": 7, "algoritmo": "BPA", "inicio": "A", "objetivo": "G",
+#      "ok": true, "ruta": [...], "costo": 14, "expandidos": 7,
+#      "tiempo_ms": 0.021}
+#   `costo` es el de la ruta encontrada (en BPA / BPP se suma sobre la
+#   ruta) y `expandidos` el largo del orden de visita. Una línea que no
+#   se puede resolver produce {"linea": n, "error": "..."}.
+# - Las consultas repetidas se responden desde un CacheBusquedas que
+#   solo guarda el largo del orden de visita (lo único que sale sin
+#   --orden). Con --orden el cache guardaría órdenes de hasta |V|
+#   etiquetas por entrada, así que es opcional: --cache-orden N lo
+#   activa con un tope de N etiquetas en total (entradas x nodos).
+#
+# Uso: python lote_jsonl.py [consultas.jsonl|-] [-o resultados.jsonl]
+#                           [--red grafo.gcsr|aristas.csv] [--orden]
+#                           [--cache-orden N]
+# ------------------------------------------------------------
+
+import argparse
+import json
+import sys
+import time
+
+from cache_busquedas import CacheBusquedas
+from cargador_grafo import cargar_binario, cargar_lista_aristas
+from red_social_busqueda import ALGORITMOS, resolver_red
+
+
+def costo_ruta(g, ruta):
+    """Suma de los costos de las aristas de `ruta` (lista de etiquetas)."""
+    ids = [g.id_de(nodo) for nodo in ruta]
+    return sum(g.costo(u, v) for u, v in zip(ids, ids[1:]))
+
+
+def resolver_linea(cache, g, pedido, con_orden=False):
+    """
+    Resultado (dict) de una consulta ya decodificada. `cache` puede ser
+    None (se busca directo) o un CacheBusquedas, compacto si no se pide
+    el orden.
+    """
+    algoritmo = pedido.get("algoritmo", "CU")
+    for campo in ("inicio", "objetivo"):
+        if campo not in pedido:
+            raise ValueError(f"Falta el campo {campo!r}")
+    inicio, objetivo = pedido["inicio"], pedido["objetivo"]
+    if algoritmo not in ALGORITMOS:
+        raise ValueError(f"Algoritmo desconocido: {algoritmo!r} (use BPA, BPP o CU)")
+    if inicio not in g:
+        raise ValueError(f"Nodo inválido: {inicio!r}")
+
+    t0 = time.perf_counter()
+    if cache is None:
+        resultado = ALGORITMOS[algoritmo](inicio, lambda s: s == objetivo, red=g)
+    else:
+        resultado = cache.buscar(algoritmo, inicio, objetivo)
+    tiempo = (time.perf_counter() - t0) * 1000
+
+    ok, orden, ruta = resultado[:3]
+    if algoritmo == "CU":
+        costo = resultado[3]
+    else:
+        costo = costo_ruta(g, ruta) if ok else None
+    respuesta = {
+        "id": pedido.get("id"),
+        "algoritmo": algoritmo,
+        "inicio": inicio,
+        "objetivo": objetivo,
+        "ok": ok,
+        "ruta": ruta,
+        "costo": costo,
+        "expandidos": orden if isinstance(orden, int) else len(orden),
+        "tiempo_ms": round(tiempo, 3),
+    }
+    if con_orden:
+        respuesta["orden"] = orden
+    return respuesta
+
+
+def procesar_flujo(entrada, salida, red=None, con_orden=False, capacidad_cache=4096,
+                   cache_orden=None):
+    """
+    Resuelve cada línea JSON de `entrada` y escribe su resultado en
+    `salida`. Devuelve (consultas resueltas, líneas con error).
+    Con `con_orden` solo se usa cache si `cache_orden` da el máximo de
+    etiquetas de orden a guardar.
+    """
+    g = resolver_red(red)
+    if not con_orden:
+        cache = CacheBusquedas(capacidad_cache, red=g, compacto=True)
+    elif cache_orden:
+        cache = CacheBusquedas(capacidad_cache, red=g, max_elementos=cache_orden)
+    else:
+        cache = None
+    resueltas = errores = 0
+    for numero, linea in enumerate(entrada, 1):
+        if not linea.strip():
+            continue
+        try:
+            respuesta = resolver_linea(cache, g, json.loads(linea), con_orden)
+            resueltas += 1
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            respuesta = {"linea": numero, "error": str(error)}
+            errores += 1
+        salida.write(json.dumps(respuesta, ensure_ascii=False))
+        salida.write("\n")
+    salida.flush()
+    return resueltas, errores
+
+
+def cargar_red(ruta):
+    """Grafo binario (.gcsr) o lista de aristas CSV/TSV."""
+    if ruta.endswith(".gcsr"):
+        return cargar_binario(ruta)
+    return cargar_lista_aristas(ruta)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Consultas de rutas por lotes (JSONL).")
+    parser.add_argument("entrada", nargs="?", default="-",
+                        help="archivo de consultas JSONL ('-' o nada = stdin)")
+    parser.add_argument("-o", "--salida", default="-",
+                        help="archivo de resultados JSONL ('-' = stdout)")
+    parser.add_argument("--red", help="grafo .gcsr o lista de aristas (por defecto, la red del curso)")
+    parser.add_argument("--orden", action="store_true", help="incluir el orden de visita")
+    parser.add_argument("--cache-orden", type=int, metavar="N",
+                        help="con --orden, cachear resultados hasta N etiquetas de orden en total")
+    args = parser.parse_args(argv)
+
+    red = cargar_red(args.red) if args.red else None
+    entrada = sys.stdin if args.entrada == "-" else open(args.entrada, encoding="utf-8")
+    salida = sys.stdout if args.salida == "-" else open(args.salida, "w", encoding="utf-8")
+    try:
+        resueltas, errores = procesar_flujo(entrada, salida, red, args.orden,
+                                            cache_orden=args.cache_orden)
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+    print(f"{resueltas} consultas resueltas, {errores} con error", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
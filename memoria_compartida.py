@@ -0,0 +1,145 @@
+# ------------------------------------------------------------
+# Grafo en memoria compartida (multiprocessing.shared_memory)
+# - Con un dict (o un GrafoCSR común) cada proceso trabajador vuelve a
+#   leer el grafo o recibe una copia por pickle: la RAM se multiplica
+#   por la cantidad de procesos.
+# - Aquí los arreglos del CSR (offsets, destinos, pesos y la tabla de
+#   etiquetas) se copian UNA vez a un bloque de memoria compartida con
+#   el mismo formato binario de cargador_grafo. Cada proceso se adjunta
+#   por nombre y arma un GrafoCSR cuyas memoryview apuntan al bloque
+#   (sin copias); las búsquedas BPA / BPP / CU funcionan igual.
+# - Ciclo de vida:
+#     compartido = GrafoCompartido.crear(red)       # proceso dueño
+#     otro = GrafoCompartido.adjuntar(compartido.nombre)  # trabajadores
+#     otro.liberar()          # trabajador: suelta su vista
+#     compartido.liberar()    # dueño: suelta y borra el bloque
+#   También sirve como context manager. Un GrafoCompartido viaja por
+#   pickle como su nombre: al desempaquetarlo el proceso se adjunta.
+# - Antes de 3.13 adjuntarse registra el bloque en el resource tracker,
+#   que lo borraría al terminar: un proceso independiente que se adjunta
+#   por nombre deshace su registro. Los procesos de multiprocessing
+#   comparten el tracker del dueño y reciben el GrafoCompartido por
+#   pickle, que conserva el registro (es el del dueño).
+# ------------------------------------------------------------
+
+import os
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+from cargador_grafo import grafo_desde_buffer, volcar_binario
+from red_social_busqueda import resolver_red
+
+# Antes de 3.13 SharedMemory registra los bloques en el resource tracker
+# (solo en POSIX, donde el nombre registrado lleva una "/" inicial)
+_TRACKER = sys.version_info < (3, 13) and os.name == "posix"
+
+
+def _nombre_tracker(memoria):
+    return "/" + memoria.name
+
+
+class _EscritorBuffer:
+    """write / tell sobre un buffer de tamaño fijo (o solo cuenta bytes)."""
+
+    def __init__(self, buffer=None):
+        self._buffer = buffer
+        self._cursor = 0
+
+    def write(self, datos):
+        fin = self._cursor + len(datos)
+        if self._buffer is not None:
+            self._buffer[self._cursor:fin] = datos
+        self._cursor = fin
+
+    def tell(self):
+        return self._cursor
+
+
+class GrafoCompartido:
+    """
+    Un bloque de memoria compartida con un grafo y el GrafoCSR que lo lee.
+    `grafo` deja de ser usable después de liberar().
+    """
+
+    def __init__(self, memoria, propietario):
+        self._memoria = memoria
+        self.propietario = propietario
+        self.grafo, self._vistas = grafo_desde_buffer(memoria.buf, memoria.name)
+
+    @classmethod
+    def crear(cls, red=None, nombre=None):
+        """Copia `red` (GrafoCSR / dict / None = red global) a un bloque nuevo."""
+        g = resolver_red(red)
+        tam = volcar_binario(g, _EscritorBuffer())
+        memoria = shared_memory.SharedMemory(name=nombre, create=True, size=max(tam, 1))
+        try:
+            volcar_binario(g, _EscritorBuffer(memoria.buf))
+            return cls(memoria, propietario=True)
+        except BaseException:
+            memoria.close()
+            memoria.unlink()
+            raise
+
+    @classmethod
+    def adjuntar(cls, nombre, tracker_compartido=False):
+        """
+        Se adjunta a un bloque creado por otro proceso. `tracker_compartido`
+        indica que este proceso usa el resource tracker del dueño (procesos
+        de multiprocessing); así lo hace el pickle de GrafoCompartido.
+
+        Antes de 3.13, con tracker_compartido=False se quita el registro
+        del bloque en el tracker de este proceso. Si ese tracker es el del
+        dueño (adjuntarse desde el mismo proceso, o desde un hijo de
+        multiprocessing sin pasar tracker_compartido=True), el registro
+        del dueño desaparece hasta su liberar(): si el dueño muere antes
+        sin liberar, el bloque queda en /dev/shm. En esos casos use
+        tracker_compartido=True.
+        """
+        if sys.version_info >= (3, 13):
+            memoria = shared_memory.SharedMemory(name=nombre, track=False)
+        else:
+            memoria = shared_memory.SharedMemory(name=nombre)
+            if _TRACKER and not tracker_compartido:
+                # Solo el dueño debe borrar el bloque: se deshace el
+                # registro que hizo este proceso al adjuntarse
+                resource_tracker.unregister(_nombre_tracker(memoria), "shared_memory")
+        return cls(memoria, propietario=False)
+
+    @property
+    def nombre(self):
+        return self._memoria.name
+
+    @property
+    def liberado(self):
+        return self.grafo is None
+
+    def liberar(self):
+        """Suelta las vistas y cierra el bloque; el dueño además lo borra."""
+        if self.grafo is None:
+            return
+        self.grafo = None
+        for vista in reversed(self._vistas):
+            vista.release()
+        self._vistas = []
+        self._memoria.close()
+        if self.propietario:
+            if _TRACKER:
+                # Un proceso con el mismo tracker que se adjuntó por nombre
+                # pudo quitar el registro; unlink() lo da por existente
+                resource_tracker.register(_nombre_tracker(self._memoria), "shared_memory")
+            self._memoria.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.liberar()
+
+    def __reduce__(self):
+        # Por pickle solo viaja el nombre: el otro proceso (de
+        # multiprocessing, con el tracker del dueño) se adjunta
+        return GrafoCompartido.adjuntar, (self.nombre, True)
+
+    def __repr__(self):
+        estado = "liberado" if self.liberado else f"{self.grafo.num_nodos} nodos"
+        return f"GrafoCompartido({self.nombre!r}, {estado})"
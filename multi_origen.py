@@ -0,0 +1,136 @@
+# ------------------------------------------------------------
+# Búsqueda desde varios orígenes y "el más cercano de un conjunto"
+# - "¿Cuál de estas N cuentas está más cerca de X?" o "distancia desde
+#   cualquiera de estas semillas" hoy son N búsquedas. Aquí la frontera
+#   arranca con TODOS los orígenes a costo 0 y cada nodo asentado queda
+#   etiquetado con su origen más cercano: un solo recorrido.
+# - Modo "objetivo más cercano": con `objetivos` la búsqueda se detiene
+#   en el primer nodo asentado que pertenece al conjunto.
+# - Empates: entre orígenes a la misma distancia gana el que aparece
+#   primero en el orden lexicográfico (como el desempate por nombre de
+#   las búsquedas del módulo principal).
+# - Para "¿cuál de N cuentas está más cerca de X?" basta con
+#   origenes=[X] y objetivos=las N cuentas (grafo no dirigido), o bien
+#   origenes=las N cuentas y leer origen[X].
+# ------------------------------------------------------------
+
+import heapq
+
+from fronteras import Cola
+from red_social_busqueda import reconstruir_ruta, resolver_red
+
+
+class ResultadoMultiOrigen:
+    """
+    Resultado de un recorrido multi-origen. Por ID de nodo asentado:
+    `distancia` (saltos en BPA, costo en CU), `origen` (ID del origen más
+    cercano) y `parent` (padre en el bosque de caminos mínimos; None en
+    los orígenes). `encontrado` es el primer objetivo asentado (o None).
+    """
+
+    __slots__ = ("grafo", "orden", "distancia", "origen", "parent", "encontrado")
+
+    def __init__(self, grafo, orden, distancia, origen, parent, encontrado):
+        self.grafo = grafo
+        self.orden = orden
+        self.distancia = distancia
+        self.origen = origen
+        self.parent = parent
+        self.encontrado = encontrado
+
+    def mas_cercano(self, nodo):
+        """(origen más cercano, distancia) para la etiqueta `nodo`, o None si no se alcanzó."""
+        g = self.grafo
+        v = g.indice.get(nodo)
+        if v not in self.distancia:
+            return None
+        return g.etiquetas[self.origen[v]], self.distancia[v]
+
+    def ruta(self, nodo):
+        """Ruta (etiquetas) desde el origen más cercano hasta `nodo`, o None."""
+        g = self.grafo
+        v = g.indice.get(nodo)
+        if v not in self.distancia:
+            return None
+        return g.etiquetar(reconstruir_ruta(self.parent, v))
+
+    def objetivo_encontrado(self):
+        """(objetivo, origen, distancia, ruta) del primer objetivo asentado, o None."""
+        if self.encontrado is None:
+            return None
+        objetivo = self.grafo.etiquetas[self.encontrado]
+        origen, distancia = self.mas_cercano(objetivo)
+        return objetivo, origen, distancia, self.ruta(objetivo)
+
+
+def _preparar(g, origenes, objetivos):
+    ids = sorted({g.id_de(o) for o in origenes})
+    if not ids:
+        raise ValueError("Se necesita al menos un origen")
+    metas = None if objetivos is None else {g.indice[o] for o in objetivos if o in g.indice}
+    return ids, metas
+
+
+def multi_source_breadth_first_search(origenes, red=None, objetivos=None):
+    """BPA desde todos los `origenes` a la vez (distancia en saltos)."""
+    g = resolver_red(red)
+    ids, metas = _preparar(g, origenes, objetivos)
+
+    frontier = Cola(ids)
+    distancia = {v: 0 for v in ids}
+    origen = {v: v for v in ids}
+    parent = {v: None for v in ids}
+    orden = []
+
+    while len(frontier) > 0:
+        state = frontier.decolar()
+        orden.append(state)
+        if metas is not None and state in metas:
+            return ResultadoMultiOrigen(g, orden, distancia, origen, parent, state)
+        d = distancia[state] + 1
+        for neighbor in g.vecinos(state):
+            if neighbor not in distancia:
+                distancia[neighbor] = d
+                origen[neighbor] = origen[state]
+                parent[neighbor] = state
+                frontier.encolar(neighbor)
+
+    return ResultadoMultiOrigen(g, orden, distancia, origen, parent, None)
+
+
+def multi_source_uniform_cost_search(origenes, red=None, objetivos=None):
+    """CU (Dijkstra) desde todos los `origenes` a la vez, todos a costo 0."""
+    g = resolver_red(red)
+    ids, metas = _preparar(g, origenes, objetivos)
+
+    # (costo, origen, nodo): a igual costo gana el origen menor
+    heap = [(0, v, v) for v in ids]
+    mejor = {v: (0, v) for v in ids}
+    parent = {v: None for v in ids}
+    distancia = {}
+    origen = {}
+    orden = []
+
+    while heap:
+        cost, fuente, state = heapq.heappop(heap)
+        if state in distancia or mejor[state] != (cost, fuente):
+            continue                    # entrada obsoleta (lazy deletion)
+        distancia[state] = cost
+        origen[state] = fuente
+        orden.append(state)
+        if metas is not None and state in metas:
+            break
+        for neighbor, step in g.aristas(state):
+            if neighbor in distancia:
+                continue
+            candidato = (cost + step, fuente)
+            if neighbor not in mejor or candidato < mejor[neighbor]:
+                mejor[neighbor] = candidato
+                parent[neighbor] = state
+                heapq.heappush(heap, (candidato[0], fuente, neighbor))
+    else:
+        state = None
+
+    # Los padres de nodos no asentados no forman parte del bosque
+    parent = {v: parent[v] for v in distancia}
+    return ResultadoMultiOrigen(g, orden, distancia, origen, parent, state)
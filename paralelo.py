@@ -0,0 +1,132 @@
+# ------------------------------------------------------------
+# Ejecución en paralelo de lotes grandes de consultas
+# - Las búsquedas son Python puro (CPU): un proceso usa un solo
+#   núcleo. Aquí se reparte un lote de consultas
+#   (algoritmo, inicio, objetivo) entre procesos con ProcessPoolExecutor.
+# - El grafo viaja UNA vez por proceso (initializer), no en cada
+#   tarea. Si la red es un archivo binario (.gcsr, ver cargador_grafo)
+#   cada proceso lo abre con mmap y el sistema comparte las páginas; si
+#   es un GrafoCompartido (memoria_compartida) cada proceso se adjunta
+#   al mismo bloque de memoria compartida.
+# - Las consultas se ordenan por (algoritmo, inicio) y se mandan en
+#   bloques: menos mensajes entre procesos y, dentro de cada bloque,
+#   las consultas con el mismo inicio comparten un árbol
+#   (consultas_lote.busqueda_lote).
+# - Los resultados vuelven en el orden de entrada, con las mismas
+#   tuplas que breadth_first_search / depth_first_search /
+#   uniform_cost_search.
+# ------------------------------------------------------------
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from cargador_grafo import cargar_binario
+from consultas_lote import busqueda_lote
+from memoria_compartida import GrafoCompartido
+from red_social_busqueda import resolver_red
+
+# Red del proceso trabajador (se fija una vez en iniciar_trabajador)
+_red_trabajador = None
+_compartido_trabajador = None   # mantiene vivo el bloque adjuntado
+
+
+def iniciar_trabajador(red):
+    """
+    Initializer de un ProcessPoolExecutor: fija la red del proceso
+    (ruta de un .gcsr, GrafoCompartido, GrafoCSR o dict).
+    """
+    global _red_trabajador, _compartido_trabajador
+    if isinstance(red, GrafoCompartido):
+        _compartido_trabajador = red
+        red = red.grafo
+    _red_trabajador = cargar_binario(red) if isinstance(red, str) else red
+
+
+def resolver_bloque(bloque):
+    """
+    Resuelve un bloque de consultas (algoritmo, inicio, objetivo) con la
+    red fijada por iniciar_trabajador.
+    """
+    return _resolver(bloque, _red_trabajador)
+
+
+def resolver_bloque_aislado(bloque):
+    """
+    Como resolver_bloque, pero una consulta que falla no arrastra a las
+    demás: su lugar en la lista lleva la excepción en vez del resultado.
+    """
+    try:
+        return _resolver(bloque, _red_trabajador)
+    except Exception:
+        pass
+    # Algo falló: repetir consulta por consulta para aislar el error
+    resultados = []
+    for consulta in bloque:
+        try:
+            resultados.append(_resolver([consulta], _red_trabajador)[0])
+        except Exception as error:
+            resultados.append(error)
+    return resultados
+
+
+def _resolver(bloque, red):
+    resultados = [None] * len(bloque)
+    por_algoritmo = {}
+    for i, (algoritmo, inicio, objetivo) in enumerate(bloque):
+        por_algoritmo.setdefault(algoritmo, []).append((i, inicio, objetivo))
+    for algoritmo, consultas in por_algoritmo.items():
+        respuestas = busqueda_lote([(s, t) for _, s, t in consultas], algoritmo, red)
+        for (i, _, _), respuesta in zip(consultas, respuestas):
+            resultados[i] = respuesta
+    return resultados
+
+
+def ejecutar_en_paralelo(consultas, red=None, procesos=None, tam_bloque=None):
+    """
+    Resuelve `consultas` (lista de (algoritmo, inicio, objetivo)) en
+    `procesos` procesos (por defecto, uno por núcleo). `red` puede ser
+    un GrafoCSR / dict, None (red global), la ruta de un grafo binario o
+    un GrafoCompartido.
+    `tam_bloque` es cuántas consultas viajan por tarea.
+    """
+    consultas = list(consultas)
+    if not consultas:
+        return []
+    procesos = procesos or os.cpu_count() or 1
+    if not isinstance(red, (str, GrafoCompartido)):
+        red = resolver_red(red)
+        # Un GrafoCSR de cargar_binario (o de un GrafoCompartido) son vistas
+        # sobre un mmap / bloque compartido: no viaja por pickle
+        if procesos > 1 and isinstance(red.offsets, memoryview):
+            raise ValueError("El grafo está sobre un archivo mapeado o memoria compartida "
+                             "y no se puede copiar a otros procesos: pase la ruta del .gcsr "
+                             "o el GrafoCompartido")
+
+    # Agrupar por (algoritmo, inicio) para que los bloques compartan árboles
+    orden = sorted(range(len(consultas)), key=lambda i: consultas[i][:2])
+    if tam_bloque is None:
+        tam_bloque = max(1, -(-len(consultas) // (procesos * 4)))
+    bloques = [
+        [consultas[i] for i in orden[k:k + tam_bloque]]
+        for k in range(0, len(orden), tam_bloque)
+    ]
+
+    if procesos == 1:
+        if isinstance(red, GrafoCompartido):
+            red_local = red.grafo
+        else:
+            red_local = cargar_binario(red) if isinstance(red, str) else red
+        resultados_bloques = [_resolver(bloque, red_local) for bloque in bloques]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos,
+                                 initializer=iniciar_trabajador,
+                                 initargs=(red,)) as executor:
+            resultados_bloques = list(executor.map(resolver_bloque, bloques))
+
+    # Devolver en el orden de entrada
+    resultados = [None] * len(consultas)
+    posiciones = iter(orden)
+    for bloque in resultados_bloques:
+        for resultado in bloque:
+            resultados[next(posiciones)] = resultado
+    return resultados
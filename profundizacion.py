@@ -0,0 +1,193 @@
+# ------------------------------------------------------------
+# BPP con memoria proporcional a la profundidad
+# - depth_first_search y Opcion2.bpp guardan `explored` y `parent` de
+#   todo lo alcanzable: en memoria no ganan nada frente a BPA.
+# - Aquí la búsqueda solo guarda la RUTA actual y, por cada nodo de la
+#   ruta, un iterador sobre sus vecinos (orden lexicográfico, el mismo
+#   en que depth_first_search los expande). Memoria O(profundidad).
+# - evitar_ciclos=True descarta solo los vecinos que ya están en la
+#   ruta actual (chequeo de ciclos sobre el camino, no global): un nodo
+#   se puede volver a visitar por otro camino, a cambio de no recordar
+#   todo lo visitado. Con evitar_ciclos=False solo se descarta volver
+#   al padre inmediato; como los ciclos más largos no se detectan, la
+#   profundización necesita un tope (limite_maximo / costo_maximo).
+# - Modos:
+#     depth_limited_search        BPP hasta `limite` aristas
+#     iterative_deepening_search  límite 0, 1, 2, ... (ruta de menos
+#                                 saltos, como breadth_first_search)
+#     ida_star_search             profundización por COSTO con cota
+#                                 f = g + h (ruta de costo mínimo, como
+#                                 uniform_cost_search si h es admisible)
+# ------------------------------------------------------------
+
+from red_social_busqueda import resolver_red
+
+INF = float("inf")
+
+
+def _profundidad_limitada(g, inicio, es_objetivo, limite, evitar_ciclos):
+    """
+    BPP desde `inicio` hasta `limite` aristas. Devuelve
+    (ruta de IDs o None, cortado, expandidos); `cortado` indica que
+    algún nodo quedó sin expandir por el límite.
+    """
+    expandidos = 1
+    if es_objetivo(inicio):
+        return [inicio], False, expandidos
+    vecinos = g.vecinos
+    if limite == 0:
+        return None, any(x != inicio for x in vecinos(inicio)), expandidos
+
+    ruta = [inicio]
+    en_ruta = {inicio}
+    pila = [iter(vecinos(inicio))]
+    cortado = False
+
+    while pila:
+        neighbor = next(pila[-1], None)
+        if neighbor is None:
+            pila.pop()
+            nodo = ruta.pop()
+            if evitar_ciclos:
+                en_ruta.discard(nodo)
+            continue
+        if evitar_ciclos:
+            if neighbor in en_ruta:
+                continue
+        elif len(ruta) > 1 and neighbor == ruta[-2]:
+            continue                    # no volver al padre inmediato
+        expandidos += 1
+        if es_objetivo(neighbor):
+            ruta.append(neighbor)
+            return ruta, False, expandidos
+        if len(ruta) < limite:
+            ruta.append(neighbor)
+            pila.append(iter(vecinos(neighbor)))
+            if evitar_ciclos:
+                en_ruta.add(neighbor)
+        elif not cortado:
+            # Cortado solo si la ruta podía seguir: algún vecino fuera de
+            # la ruta (sin chequeo de ciclos, alguno que no sea el padre)
+            padre = ruta[-1]
+            for x in vecinos(neighbor):
+                if x != neighbor and (x not in en_ruta if evitar_ciclos else x != padre):
+                    cortado = True
+                    break
+    return None, cortado, expandidos
+
+
+def depth_limited_search(initial_state, goal_test, limite, red=None, evitar_ciclos=True):
+    """
+    BPP hasta `limite` aristas desde `initial_state`.
+    Devuelve (ok, ruta, expandidos).
+    """
+    g = resolver_red(red)
+    etiquetas = g.etiquetas
+    ruta, _, expandidos = _profundidad_limitada(
+        g, g.id_de(initial_state), lambda v: goal_test(etiquetas[v]), limite, evitar_ciclos)
+    if ruta is None:
+        return False, None, expandidos
+    return True, g.etiquetar(ruta), expandidos
+
+
+def iterative_deepening_search(initial_state, goal_test, red=None, limite_maximo=None,
+                               evitar_ciclos=True):
+    """
+    BPP limitada con límite 0, 1, 2, ... hasta encontrar el objetivo, hasta
+    que ningún nodo quede cortado por el límite (no hay solución) o hasta
+    `limite_maximo`. Devuelve (ok, ruta, expandidos) con los expandidos de
+    todas las iteraciones.
+    Con evitar_ciclos=False `limite_maximo` es obligatorio: en un ciclo
+    siempre queda algún nodo cortado y, si el objetivo es inalcanzable,
+    la profundización no terminaría nunca.
+    """
+    if not evitar_ciclos and limite_maximo is None:
+        raise ValueError("Sin evitar_ciclos hace falta limite_maximo")
+    g = resolver_red(red)
+    etiquetas = g.etiquetas
+    inicio = g.id_de(initial_state)
+    es_objetivo = lambda v: goal_test(etiquetas[v])
+
+    total = 0
+    limite = 0
+    while limite_maximo is None or limite <= limite_maximo:
+        ruta, cortado, expandidos = _profundidad_limitada(g, inicio, es_objetivo, limite, evitar_ciclos)
+        total += expandidos
+        if ruta is not None:
+            return True, g.etiquetar(ruta), total
+        if not cortado:
+            break
+        limite += 1
+    return False, None, total
+
+
+# ============================================================
+# IDA* (profundización por costo)
+# ============================================================
+def ida_star_search(initial_state, goal_test, red=None, heuristica=None, evitar_ciclos=True,
+                    costo_maximo=None):
+    """
+    Profundización iterativa con cota f = g + h. `heuristica(etiqueta)`
+    debe ser admisible (no sobreestimar); sin heurística (h = 0) cada
+    iteración sube la cota al menor costo que la superó. No se prueban
+    cotas mayores que `costo_maximo`.
+    Con evitar_ciclos=False `costo_maximo` es obligatorio (ir y volver
+    por un ciclo mantiene la cota finita para siempre) y no debe haber
+    ciclos de costo 0 (una iteración no terminaría).
+    Devuelve (ok, ruta, costo, expandidos).
+    """
+    if not evitar_ciclos and costo_maximo is None:
+        raise ValueError("Sin evitar_ciclos hace falta costo_maximo")
+    g = resolver_red(red)
+    etiquetas = g.etiquetas
+    aristas = g.aristas
+    inicio = g.id_de(initial_state)
+    h = (lambda v: 0) if heuristica is None else (lambda v: heuristica(etiquetas[v]))
+
+    cota = h(inicio)
+    total = 0
+    while True:
+        # BPP acotada por f: ruta, costos acumulados e iteradores de aristas
+        ruta = [inicio]
+        costos = [0]
+        en_ruta = {inicio}
+        pila = [iter(aristas(inicio))]
+        siguiente_cota = INF
+        total += 1
+        if goal_test(etiquetas[inicio]):
+            return True, [etiquetas[inicio]], 0, total
+
+        while pila:
+            arista = next(pila[-1], None)
+            if arista is None:
+                pila.pop()
+                costos.pop()
+                nodo = ruta.pop()
+                if evitar_ciclos:
+                    en_ruta.discard(nodo)
+                continue
+            neighbor, step = arista
+            if evitar_ciclos:
+                if neighbor in en_ruta:
+                    continue
+            elif len(ruta) > 1 and neighbor == ruta[-2]:
+                continue                # no volver al padre inmediato
+            cost = costos[-1] + step
+            f = cost + h(neighbor)
+            if f > cota:
+                if f < siguiente_cota:
+                    siguiente_cota = f
+                continue
+            total += 1
+            if goal_test(etiquetas[neighbor]):
+                ruta.append(neighbor)
+                return True, g.etiquetar(ruta), cost, total
+            ruta.append(neighbor)
+            costos.append(cost)
+            pila.append(iter(aristas(neighbor)))
+            if evitar_ciclos:
+                en_ruta.add(neighbor)
+
+        if siguiente_cota == INF or (costo_maximo is not None and siguiente_cota > costo_maximo):
+            return False, None, None, total
+        cota = siguiente_cota
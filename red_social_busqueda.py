@@ -8,6 +8,10 @@
 # ------------------------------------------------------------
 
 import heapq
+import time
+
+from fronteras import Cola, Pila
+from grafo_csr import como_csr
 
 # -----------------------------
 # Grafo (red social) con costos
@@ -26,6 +30,31 @@ grafo = {
     'J': {'C': 5, 'D': 5, 'E': 3, 'H': 4}
 }
 
+# Versión CSR congelada de `grafo` (IDs enteros, vecinos ya ordenados).
+# Las búsquedas la usan por defecto; se les puede pasar otra red con `red=`
+# y un EstadisticasBusqueda (estadisticas.py) con `estadisticas=` para medirlas.
+grafo_csr = como_csr(grafo)
+
+
+def resolver_red(red):
+    return grafo_csr if red is None else como_csr(red)
+
+
+def cambiar_arista(u, v, costo=None):
+    """
+    Agrega o actualiza la arista (no dirigida) u-v de `grafo` con `costo`,
+    o la elimina si costo es None, y reconstruye grafo_csr. El CSR nuevo
+    trae otra `version`, así los resultados en cache quedan invalidados.
+    """
+    global grafo_csr
+    if costo is None:
+        grafo.get(u, {}).pop(v, None)
+        grafo.get(v, {}).pop(u, None)
+    else:
+        grafo.setdefault(u, {})[v] = costo
+        grafo.setdefault(v, {})[u] = costo
+    grafo_csr = como_csr(grafo)
+
 # ---------------------------------------
 # Reconstrucción de ruta usando "parent"
 # ---------------------------------------
@@ -41,26 +70,37 @@ def reconstruir_ruta(parent, goal):
 # ============================================================
 # A) BPA / BFS (Queue FIFO) - según pseudocódigo del profe
 # ============================================================
-def breadth_first_search(initial_state, goal_test):
-    frontier = [initial_state]       # Queue
+def breadth_first_search(initial_state, goal_test, red=None, estadisticas=None):
+    t0 = time.perf_counter() if estadisticas is not None else None
+    g = resolver_red(red)
+    etiquetas = g.etiquetas
+    inicio = g.id_de(initial_state)
+
+    frontier = Cola([inicio])        # Queue (con índice: `in` es O(1))
     explored = set()                 # Set
-    parent = {initial_state: None}
+    parent = {inicio: None}
     orden_visita = []
 
     while len(frontier) > 0:
-        state = frontier.pop(0)      # dequeue
+        state = frontier.decolar()   # dequeue
         explored.add(state)
-        orden_visita.append(state)
+        orden_visita.append(etiquetas[state])
 
-        if goal_test(state):
-            return True, orden_visita, reconstruir_ruta(parent, state)
+        if goal_test(etiquetas[state]):
+            if estadisticas is not None:
+                estadisticas.registrar_recorrido(g, orden_visita, parent, explored, t0,
+                                                 objetivo=state)
+            return True, orden_visita, g.etiquetar(reconstruir_ruta(parent, state))
 
-        # vecinos en orden lexicográfico (como se usa en los ejemplos del profe)
-        for neighbor in sorted(grafo[state].keys()):
+        # vecinos en orden lexicográfico (como se usa en los ejemplos del profe);
+        # en el CSR ya vienen ordenados
+        for neighbor in g.vecinos(state):
             if (neighbor not in frontier) and (neighbor not in explored):
                 parent[neighbor] = state
-                frontier.append(neighbor)  # enqueue
+                frontier.encolar(neighbor)  # enqueue
 
+    if estadisticas is not None:
+        estadisticas.registrar_recorrido(g, orden_visita, parent, explored, t0)
     return False, orden_visita, None
 
 # ============================================================
@@ -69,27 +109,37 @@ def breadth_first_search(initial_state, goal_test):
 #       empujamos en orden inverso para que salga el menor primero
 #       cuando se hace pop().
 # ============================================================
-def depth_first_search(initial_state, goal_test):
-    frontier = [initial_state]       # Stack
+def depth_first_search(initial_state, goal_test, red=None, estadisticas=None):
+    t0 = time.perf_counter() if estadisticas is not None else None
+    g = resolver_red(red)
+    etiquetas = g.etiquetas
+    inicio = g.id_de(initial_state)
+
+    frontier = Pila([inicio])        # Stack (con índice: `in` es O(1))
     explored = set()                 # Set
-    parent = {initial_state: None}
+    parent = {inicio: None}
     orden_visita = []
 
     while len(frontier) > 0:
-        state = frontier.pop()       # pop (LIFO)
+        state = frontier.desapilar() # pop (LIFO)
         explored.add(state)
-        orden_visita.append(state)
+        orden_visita.append(etiquetas[state])
 
-        if goal_test(state):
-            return True, orden_visita, reconstruir_ruta(parent, state)
+        if goal_test(etiquetas[state]):
+            if estadisticas is not None:
+                estadisticas.registrar_recorrido(g, orden_visita, parent, explored, t0,
+                                                 objetivo=state)
+            return True, orden_visita, g.etiquetar(reconstruir_ruta(parent, state))
 
         # Para que el stack explore primero el "lexicográficamente menor",
         # se apila en orden inverso.
-        for neighbor in sorted(grafo[state].keys(), reverse=True):
+        for neighbor in g.vecinos_inverso(state):
             if (neighbor not in frontier) and (neighbor not in explored):
                 parent[neighbor] = state
-                frontier.append(neighbor)  # push
+                frontier.apilar(neighbor)  # push
 
+    if estadisticas is not None:
+        estadisticas.registrar_recorrido(g, orden_visita, parent, explored, t0)
     return False, orden_visita, None
 
 # ============================================================
@@ -97,14 +147,21 @@ def depth_first_search(initial_state, goal_test):
 # - "frontier.deleteMin()" (heapq)
 # - "decrease-key" cuando aparece un mejor costo para un nodo en frontier
 # ============================================================
-def uniform_cost_search(initial_state, goal_test):
+def uniform_cost_search(initial_state, goal_test, red=None, estadisticas=None):
+    if estadisticas is not None:
+        return _uniform_cost_search_medida(initial_state, goal_test, red, estadisticas)
+    g = resolver_red(red)
+    etiquetas = g.etiquetas
+    inicio = g.id_de(initial_state)
+
     explored = set()
-    parent = {initial_state: None}
-    g_cost = {initial_state: 0}
+    parent = {inicio: None}
+    g_cost = {inicio: 0}
 
     # frontier = Heap priority queue of (cost, node)
-    heap = [(0, initial_state)]
-    frontier_best = {initial_state: 0}  # para saber si un nodo está en frontier y su mejor costo
+    # (los IDs siguen el orden lexicográfico, así que el desempate es el mismo)
+    heap = [(0, inicio)]
+    frontier_best = {inicio: 0}  # para saber si un nodo está en frontier y su mejor costo
 
     orden_visita = []
 
@@ -119,13 +176,12 @@ def uniform_cost_search(initial_state, goal_test):
         frontier_best.pop(state, None)
 
         explored.add(state)
-        orden_visita.append(state)
+        orden_visita.append(etiquetas[state])
 
-        if goal_test(state):
-            return True, orden_visita, reconstruir_ruta(parent, state), cost
+        if goal_test(etiquetas[state]):
+            return True, orden_visita, g.etiquetar(reconstruir_ruta(parent, state)), cost
 
-        for neighbor in sorted(grafo[state].keys()):
-            step = grafo[state][neighbor]
+        for neighbor, step in g.aristas(state):
             new_cost = cost + step
 
             if (neighbor not in explored) and (neighbor not in frontier_best):
@@ -145,10 +201,89 @@ def uniform_cost_search(initial_state, goal_test):
 
     return False, orden_visita, None, None
 
+
+def _uniform_cost_search_medida(initial_state, goal_test, red, estadisticas):
+    # Mismo ciclo que uniform_cost_search, con los contadores de
+    # `estadisticas`; así la búsqueda sin medir no paga por ellos
+    t0 = time.perf_counter()
+    g = resolver_red(red)
+    etiquetas = g.etiquetas
+    inicio = g.id_de(initial_state)
+
+    explored = set()
+    parent = {inicio: None}
+    g_cost = {inicio: 0}
+    heap = [(0, inicio)]
+    frontier_best = {inicio: 0}
+    orden_visita = []
+    offsets = g.offsets
+    empujes = obsoletas = decrementos = relajadas = 0
+    pico = 1
+
+    while len(heap) > 0:
+        cost, state = heapq.heappop(heap)
+
+        if state in frontier_best and cost != frontier_best[state]:
+            obsoletas += 1
+            continue
+
+        frontier_best.pop(state, None)
+
+        explored.add(state)
+        orden_visita.append(etiquetas[state])
+
+        if goal_test(etiquetas[state]):
+            estadisticas.registrar_recorrido(g, orden_visita, parent, explored, t0,
+                                             aristas_relajadas=relajadas, frontera_maxima=pico,
+                                             inserciones=empujes, entradas_obsoletas=obsoletas,
+                                             decrementos=decrementos)
+            return True, orden_visita, g.etiquetar(reconstruir_ruta(parent, state)), cost
+
+        # Las aristas del objetivo no se revisan: se cuentan después del test
+        relajadas += offsets[state + 1] - offsets[state]
+        for neighbor, step in g.aristas(state):
+            new_cost = cost + step
+
+            if (neighbor not in explored) and (neighbor not in frontier_best):
+                parent[neighbor] = state
+                g_cost[neighbor] = new_cost
+                frontier_best[neighbor] = new_cost
+                heapq.heappush(heap, (new_cost, neighbor))
+                empujes += 1
+
+            elif neighbor in frontier_best:
+                if new_cost < frontier_best[neighbor]:
+                    parent[neighbor] = state
+                    g_cost[neighbor] = new_cost
+                    frontier_best[neighbor] = new_cost
+                    heapq.heappush(heap, (new_cost, neighbor))
+                    empujes += 1
+                    decrementos += 1
+
+        if len(heap) > pico:
+            pico = len(heap)
+
+    estadisticas.registrar_recorrido(g, orden_visita, parent, explored, t0,
+                                     aristas_relajadas=relajadas, frontera_maxima=pico,
+                                     inserciones=empujes, entradas_obsoletas=obsoletas,
+                                     decrementos=decrementos)
+    return False, orden_visita, None, None
+
+# Algoritmos por nombre (los del menú)
+ALGORITMOS = {
+    "BPA": breadth_first_search,
+    "BPP": depth_first_search,
+    "CU": uniform_cost_search,
+}
+
 # ============================================================
 # D) Consola (interactivo)
 # ============================================================
 def main():
+    # Las preguntas se repiten mucho: se responden desde un cache LRU
+    from cache_busquedas import CacheBusquedas
+    cache = CacheBusquedas()
+
     while True:
         print("\n--- Punto 2: Modelos de Búsqueda ---")
         print("1) BPA (Anchura)")
@@ -169,22 +304,20 @@ def main():
             print("❌ Nodo inválido. Intente nuevamente.")
             continue
 
-        goal_test = lambda s: s == objetivo
-
         if opcion == "1":
-            ok, orden, ruta = breadth_first_search(inicio, goal_test)
+            ok, orden, ruta = cache.buscar("BPA", inicio, objetivo)
             print("\n--- RESULTADOS BPA ---")
             print("Orden de visita:", orden)
             print("Ruta encontrada:", ruta)
 
         elif opcion == "2":
-            ok, orden, ruta = depth_first_search(inicio, goal_test)
+            ok, orden, ruta = cache.buscar("BPP", inicio, objetivo)
             print("\n--- RESULTADOS BPP ---")
             print("Orden de visita:", orden)
             print("Ruta encontrada:", ruta)
 
         elif opcion == "3":
-            ok, orden, ruta, costo = uniform_cost_search(inicio, goal_test)
+            ok, orden, ruta, costo = cache.buscar("CU", inicio, objetivo)
             print("\n--- RESULTADOS COSTO UNIFORME ---")
             print("Orden de visita:", orden)
             print("Ruta encontrada:", ruta)
@@ -0,0 +1,232 @@
+# ------------------------------------------------------------
+# Servidor asyncio de consultas de rutas (JSON por líneas sobre TCP)
+# - Reemplaza los main() con input() cuando hay que atender a muchos
+#   clientes a la vez: el grafo se carga UNA vez y el servidor queda
+#   vivo respondiendo consultas concurrentes de BPA / BPP / CU.
+# - Protocolo: cada línea es un objeto JSON y cada respuesta también.
+#     -> {"id": 1, "algoritmo": "CU", "inicio": "A", "objetivo": "G"}
+#     <- {"id": 1, "ok": true, "orden": [...], "ruta": [...], "costo": 11,
+#         "latencia_ms": 0.8}
+#     -> {"id": 2, "comando": "estadisticas"}
+#     <- {"id": 2, "consultas": ..., "lotes": ..., "p50_ms": ..., ...}
+#   Un error se responde como {"id": ..., "error": "..."}. Una consulta
+#   inválida se rechaza antes de entrar a la cola, y si una consulta
+#   falla en el pool solo ella recibe el error, no el resto de su lote.
+# - Las búsquedas (CPU) corren en un ProcessPoolExecutor con el grafo
+#   ya cargado en cada proceso (ver paralelo.py), así el event loop
+#   nunca se bloquea.
+# - Micro-lotes: las consultas que llegan dentro de `ventana` segundos
+#   (o hasta `tam_lote`) viajan juntas en una sola tarea, y dentro del
+#   lote las del mismo inicio comparten árbol (consultas_lote).
+#
+# Uso: python servidor.py [puerto] [grafo.gcsr]
+# ------------------------------------------------------------
+
+import asyncio
+import json
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from cargador_grafo import cargar_binario
+from paralelo import iniciar_trabajador, resolver_bloque_aislado
+from red_social_busqueda import ALGORITMOS, resolver_red
+
+PUERTO = 8765
+
+
+class ServidorBusquedas:
+    """
+    Servidor de consultas. `red` es un GrafoCSR / dict, None (red global)
+    o la ruta de un grafo binario (cada proceso lo abre con mmap).
+    """
+
+    def __init__(self, red=None, procesos=None, ventana=0.002, tam_lote=256,
+                 max_latencias=10000):
+        self.red = red if isinstance(red, str) else resolver_red(red)
+        self.grafo = cargar_binario(red) if isinstance(red, str) else self.red
+        self.procesos = procesos
+        self.ventana = ventana
+        self.tam_lote = tam_lote
+        self.latencias = deque(maxlen=max_latencias)
+        self.consultas = 0
+        self.lotes = 0
+        self._cola = None
+        self._pool = None
+        self._servidor = None
+        self._tareas = set()
+        self._conexiones = {}        # writer -> tarea que atiende la conexión
+
+    # --------------------------------------------------------
+    # Ciclo de vida
+    # --------------------------------------------------------
+    async def iniciar(self, host="127.0.0.1", puerto=PUERTO):
+        self._cola = asyncio.Queue()
+        self._pool = ProcessPoolExecutor(max_workers=self.procesos,
+                                         initializer=iniciar_trabajador,
+                                         initargs=(self.red,))
+        self._lanzar(self._agrupar())
+        self._servidor = await asyncio.start_server(self._atender, host, puerto)
+        return self._servidor
+
+    async def cerrar(self):
+        if self._servidor is not None:
+            self._servidor.close()
+        # Cerrar las conexiones abiertas y esperar a que sus tareas terminen
+        for writer in list(self._conexiones):
+            writer.close()
+        await asyncio.gather(*self._conexiones.values(), return_exceptions=True)
+        if self._servidor is not None:
+            await self._servidor.wait_closed()
+        for tarea in list(self._tareas):
+            tarea.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+
+    def _lanzar(self, corutina):
+        tarea = asyncio.get_running_loop().create_task(corutina)
+        self._tareas.add(tarea)
+        tarea.add_done_callback(self._tareas.discard)
+        return tarea
+
+    # --------------------------------------------------------
+    # Conexiones
+    # --------------------------------------------------------
+    async def _atender(self, reader, writer):
+        self._conexiones[writer] = asyncio.current_task()
+        try:
+            while True:
+                linea = await reader.readline()
+                if not linea:
+                    break
+                # Cada consulta se resuelve aparte: las que llegan juntas
+                # (aunque sea por la misma conexión) caen en el mismo lote
+                self._lanzar(self._responder(linea, writer))
+        except ConnectionError:
+            pass
+        finally:
+            self._conexiones.pop(writer, None)
+            writer.close()
+
+    async def _responder(self, linea, writer):
+        t0 = time.perf_counter()
+        id_consulta = None
+        try:
+            pedido = json.loads(linea)
+            id_consulta = pedido.get("id")
+            if pedido.get("comando") == "estadisticas":
+                respuesta = self.estadisticas()
+            else:
+                respuesta = await self.consultar(pedido.get("algoritmo", "CU"),
+                                                 pedido.get("inicio"), pedido.get("objetivo"))
+                latencia = (time.perf_counter() - t0) * 1000
+                self.latencias.append(latencia)
+                respuesta["latencia_ms"] = round(latencia, 3)
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            respuesta = {"error": str(error)}
+        respuesta = {"id": id_consulta, **respuesta}
+        if not writer.is_closing():
+            writer.write(json.dumps(respuesta, ensure_ascii=False).encode() + b"\n")
+            await writer.drain()
+
+    # --------------------------------------------------------
+    # Consultas y micro-lotes
+    # --------------------------------------------------------
+    async def consultar(self, algoritmo, inicio, objetivo):
+        """Resuelve una consulta en el pool y devuelve el resultado como dict."""
+        self._validar(algoritmo, inicio, objetivo)
+        futuro = asyncio.get_running_loop().create_future()
+        await self._cola.put(((algoritmo, inicio, objetivo), futuro))
+        resultado = await futuro
+        respuesta = {"ok": resultado[0], "orden": resultado[1], "ruta": resultado[2]}
+        if algoritmo == "CU":
+            respuesta["costo"] = resultado[3]
+        return respuesta
+
+    def _validar(self, algoritmo, inicio, objetivo):
+        # Rechazar aquí lo que haría fallar la búsqueda en el pool
+        for valor in (algoritmo, inicio, objetivo):
+            try:
+                hash(valor)
+            except TypeError:
+                raise ValueError(f"Valor no válido en la consulta: {valor!r}") from None
+        if algoritmo not in ALGORITMOS:
+            raise ValueError(f"Algoritmo desconocido: {algoritmo!r} (use BPA, BPP o CU)")
+        for nodo in (inicio, objetivo):
+            if nodo not in self.grafo:
+                raise ValueError(f"Nodo inválido: {nodo!r}")
+
+    async def _agrupar(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            lote = [await self._cola.get()]
+            limite = loop.time() + self.ventana
+            while len(lote) < self.tam_lote:
+                restante = limite - loop.time()
+                if restante <= 0:
+                    break
+                try:
+                    lote.append(await asyncio.wait_for(self._cola.get(), restante))
+                except asyncio.TimeoutError:
+                    break
+            self._lanzar(self._despachar(lote))
+
+    async def _despachar(self, lote):
+        self.lotes += 1
+        self.consultas += len(lote)
+        loop = asyncio.get_running_loop()
+        try:
+            resultados = await loop.run_in_executor(
+                self._pool, resolver_bloque_aislado, [consulta for consulta, _ in lote])
+        except Exception as error:
+            # Falló el pool mismo (p. ej. un proceso murió): todo el lote
+            for _, futuro in lote:
+                if not futuro.done():
+                    futuro.set_exception(error)
+            return
+        for (_, futuro), resultado in zip(lote, resultados):
+            if futuro.done():
+                continue
+            if isinstance(resultado, Exception):
+                futuro.set_exception(resultado)
+            else:
+                futuro.set_result(resultado)
+
+    def estadisticas(self):
+        """Consultas y lotes atendidos, y percentiles de latencia (ms)."""
+        ordenadas = sorted(self.latencias)
+
+        def percentil(p):
+            if not ordenadas:
+                return None
+            return round(ordenadas[min(len(ordenadas) - 1, int(p * len(ordenadas)))], 3)
+
+        return {
+            "consultas": self.consultas,
+            "lotes": self.lotes,
+            "tam_lote_promedio": round(self.consultas / self.lotes, 2) if self.lotes else None,
+            "p50_ms": percentil(0.50),
+            "p95_ms": percentil(0.95),
+            "p99_ms": percentil(0.99),
+            "max_ms": round(ordenadas[-1], 3) if ordenadas else None,
+        }
+
+
+async def servir(red=None, host="127.0.0.1", puerto=PUERTO, **opciones):
+    servidor = ServidorBusquedas(red, **opciones)
+    tcp = await servidor.iniciar(host, puerto)
+    print(f"Servidor de búsquedas escuchando en {host}:{puerto}")
+    try:
+        await tcp.serve_forever()
+    finally:
+        await servidor.cerrar()
+
+
+if __name__ == "__main__":
+    puerto = int(sys.argv[1]) if len(sys.argv) > 1 else PUERTO
+    red = sys.argv[2] if len(sys.argv) > 2 else None
+    try:
+        asyncio.run(servir(red, puerto=puerto))
+    except KeyboardInterrupt:
+        print("Saliendo del servidor...")
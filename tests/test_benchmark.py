@@ -0,0 +1,32 @@
+# ------------------------------------------------------------
+# Benchmark: mediciones consistentes con las búsquedas y comparación
+# ------------------------------------------------------------
+
+from benchmark import ALGORITMOS_BENCHMARK, comparar, correr_benchmark, medir
+from generadores_grafos import generar
+from red_social_busqueda import breadth_first_search, uniform_cost_search
+
+
+def test_medir_expandidos_como_la_busqueda():
+    g = generar("ER", 1000, semilla=0)
+    s, t = g.etiquetas[0], g.etiquetas[50]
+    m = medir("breadth_first_search", g, s, t, memoria=True, repeticiones=1)
+    ok, orden, _ = breadth_first_search(s, lambda x: x == t, g)
+    assert (m["ok"], m["expandidos"]) == (ok, len(orden))
+    assert m["tiempo_s"] >= 0 and m["memoria_pico_bytes"] > 0
+    m = medir("uniform_cost_search", g, s, t, memoria=False, repeticiones=1)
+    assert m["expandidos"] == len(uniform_cost_search(s, lambda x: x == t, g)[1])
+    assert m["memoria_pico_bytes"] is None
+
+
+def test_correr_y_comparar():
+    algoritmos = sorted(ALGORITMOS_BENCHMARK)[:2]
+    base = correr_benchmark(tamanos=(500,), modelos=("BA", "WS"), algoritmos=algoritmos,
+                            consultas=2, memoria=False, repeticiones=1)
+    assert len(base["mediciones"]) == 2 * 2 * 2
+    assert len(base["resumen"]) == 2 * 2
+
+    lento = {"resumen": [dict(r, tiempo_mediana_s=r["tiempo_mediana_s"] * 2) for r in base["resumen"]]}
+    filas = comparar(base, lento)
+    assert len(filas) == 4 and all(f["regresion"] for f in filas)
+    assert not any(f["regresion"] for f in comparar(base, base))
@@ -0,0 +1,63 @@
+# ------------------------------------------------------------
+# BPA / CU bidireccionales contra las búsquedas unidireccionales
+# ------------------------------------------------------------
+
+import random
+
+import pytest
+
+from bidireccional import bidirectional_breadth_first_search, bidirectional_uniform_cost_search
+from red_social_busqueda import breadth_first_search, uniform_cost_search
+
+
+def es(objetivo):
+    return lambda x: x == objetivo
+
+
+def red_aleatoria(semilla, n=40, m=70, dirigida=False):
+    rnd = random.Random(semilla)
+    nodos = [f"n{i:02d}" for i in range(n)]
+    red = {v: {} for v in nodos}
+    for _ in range(m):
+        u, v = rnd.sample(nodos, 2)
+        red[u][v] = rnd.randint(1, 9)
+        if not dirigida:
+            red[v][u] = red[u][v]
+    return red
+
+
+def invertir(red):
+    inversa = {v: {} for v in red}
+    for u, vecinos in red.items():
+        for v, w in vecinos.items():
+            inversa[v][u] = w
+    return inversa
+
+
+def costo_ruta(red, ruta):
+    return sum(red[a][b] for a, b in zip(ruta, ruta[1:]))
+
+
+@pytest.mark.parametrize("dirigida", [False, True])
+@pytest.mark.parametrize("semilla", range(4))
+def test_coincide_con_busquedas_originales(semilla, dirigida):
+    red = red_aleatoria(semilla, dirigida=dirigida)
+    inversa = invertir(red) if dirigida else None
+    nodos = sorted(red)
+    for s in nodos[:8]:
+        for t in nodos:
+            ok, _, ruta = breadth_first_search(s, es(t), red)
+            ok_b, _, ruta_b = bidirectional_breadth_first_search(s, t, red, inversa)
+            assert ok_b == ok
+            if ok:
+                assert len(ruta_b) == len(ruta)
+                assert ruta_b[0] == s and ruta_b[-1] == t
+                assert all(b in red[a] for a, b in zip(ruta_b, ruta_b[1:]))
+
+            ok, _, ruta, costo = uniform_cost_search(s, es(t), red)
+            ok_b, _, ruta_b, costo_b = bidirectional_uniform_cost_search(s, t, red, inversa)
+            assert (ok_b, costo_b) == (ok, costo)
+            if ok:
+                assert costo_ruta(red, ruta_b) == costo
+            else:
+                assert ruta_b is None
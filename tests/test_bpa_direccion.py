@@ -0,0 +1,54 @@
+# ------------------------------------------------------------
+# BPA con optimización de dirección contra breadth_first_search
+# ------------------------------------------------------------
+
+import pytest
+
+from bpa_direccion import direction_optimizing_breadth_first_search
+from generadores_grafos import generar
+from red_social_busqueda import breadth_first_search, reconstruir_ruta
+
+
+def es(objetivo):
+    return lambda x: x == objetivo
+
+
+@pytest.mark.parametrize("alpha", [None, 14, 1])
+@pytest.mark.parametrize("modelo", ["BA", "ER", "WS"])
+def test_distancias_iguales_a_bpa(modelo, alpha):
+    g = generar(modelo, 3000, semilla=1)
+    inicio = g.etiquetas[3]
+    distancia, parent, estadisticas = direction_optimizing_breadth_first_search(inicio, g, alpha=alpha)
+    if alpha is None:
+        assert estadisticas["niveles_abajo_arriba"] == 0
+    for objetivo in g.etiquetas[::17]:
+        ok, _, ruta = breadth_first_search(inicio, es(objetivo), g)
+        v = g.id_de(objetivo)
+        assert ok == (distancia[v] != -1)
+        if ok:
+            assert distancia[v] == len(ruta) - 1
+            camino = reconstruir_ruta(parent, v)
+            assert len(camino) == len(ruta)
+            assert all(b in g.vecinos(a) for a, b in zip(camino, camino[1:]))
+
+
+def test_abajo_arriba_en_grafo_denso():
+    g = generar("BA", 3000, semilla=1)
+    _, _, estadisticas = direction_optimizing_breadth_first_search(g.etiquetas[0], g)
+    _, _, puro = direction_optimizing_breadth_first_search(g.etiquetas[0], g, alpha=None)
+    assert estadisticas["niveles_abajo_arriba"] > 0
+    assert estadisticas["aristas_revisadas"] < puro["aristas_revisadas"]
+
+
+def test_dirigido_con_red_inversa():
+    red = {"A": {"B": 1}, "B": {"C": 1}, "C": {}, "D": {"A": 1}}
+    inversa = {"A": {"D": 1}, "B": {"A": 1}, "C": {"B": 1}, "D": {}}
+    distancia, _, _ = direction_optimizing_breadth_first_search("A", red, inversa, alpha=1, beta=1)
+    assert list(distancia) == [0, 1, 2, -1]
+
+
+def test_objetivo_detiene_la_busqueda():
+    g = generar("WS", 3000, semilla=1)
+    distancia, _, _ = direction_optimizing_breadth_first_search(g.etiquetas[0], g, goal_state=g.etiquetas[1])
+    assert distancia[1] == 1
+    assert sum(1 for d in distancia if d != -1) < g.num_nodos
@@ -0,0 +1,36 @@
+# ------------------------------------------------------------
+# BPA por niveles con NumPy contra breadth_first_search
+# ------------------------------------------------------------
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from bpa_vectorizado import INALCANZABLE, level_synchronous_breadth_first_search, ruta_vectorizada
+from generadores_grafos import generar
+from grafo_csr import como_csr
+from red_social_busqueda import breadth_first_search
+
+
+def es(objetivo):
+    return lambda x: x == objetivo
+
+
+@pytest.mark.parametrize("modelo", ["BA", "ER", "WS"])
+def test_distancias_y_rutas_iguales_a_bpa(modelo):
+    g = generar(modelo, 1500, semilla=3)
+    inicio = g.etiquetas[7]
+    distancia, parent = level_synchronous_breadth_first_search(inicio, g)
+    for objetivo in g.etiquetas[::11]:
+        ok, _, ruta = breadth_first_search(inicio, es(objetivo), g)
+        assert ok == (distancia[g.id_de(objetivo)] != INALCANZABLE)
+        assert ruta_vectorizada(g, parent, objetivo) == ruta
+        if ok:
+            assert distancia[g.id_de(objetivo)] == len(ruta) - 1
+
+
+def test_inalcanzable():
+    g = como_csr({"A": {"B": 1}, "B": {"A": 1}, "C": {}})
+    distancia, parent = level_synchronous_breadth_first_search("A", g)
+    assert list(distancia) == [0, 1, INALCANZABLE]
+    assert ruta_vectorizada(g, parent, "C") is None
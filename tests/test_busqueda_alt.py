@@ -0,0 +1,65 @@
+# ------------------------------------------------------------
+# A* con landmarks (ALT) contra uniform_cost_search
+# ------------------------------------------------------------
+
+import random
+
+import pytest
+
+from busqueda_alt import a_star_search, distancias_desde, preprocesar_landmarks
+from grafo_csr import como_csr
+from red_social_busqueda import uniform_cost_search
+
+
+def es(objetivo):
+    return lambda x: x == objetivo
+
+
+def red_aleatoria(semilla, n=40, m=70, dirigida=False):
+    rnd = random.Random(semilla)
+    nodos = [f"n{i:02d}" for i in range(n)]
+    red = {v: {} for v in nodos}
+    for _ in range(m):
+        u, v = rnd.sample(nodos, 2)
+        red[u][v] = rnd.randint(1, 9)
+        if not dirigida:
+            red[v][u] = red[u][v]
+    return red
+
+
+def invertir(red):
+    inversa = {v: {} for v in red}
+    for u, vecinos in red.items():
+        for v, w in vecinos.items():
+            inversa[v][u] = w
+    return inversa
+
+
+def costo_ruta(red, ruta):
+    return sum(red[a][b] for a, b in zip(ruta, ruta[1:]))
+
+
+def test_distancias_desde():
+    g = como_csr({"A": {"B": 2}, "B": {"A": 2, "C": 3}, "C": {"B": 3}, "D": {}})
+    assert list(distancias_desde(g, g.id_de("A"))) == [0, 2, 5, float("inf")]
+
+
+@pytest.mark.parametrize("dirigida", [False, True])
+@pytest.mark.parametrize("semilla", range(4))
+def test_coincide_con_uniform_cost_search(semilla, dirigida):
+    red = red_aleatoria(semilla, dirigida=dirigida)
+    landmarks = preprocesar_landmarks(red, 4, invertir(red) if dirigida else None)
+    nodos = sorted(red)
+    expandidos = expandidos_a = 0
+    for s in nodos[:8]:
+        for t in nodos:
+            ok, orden, _, costo = uniform_cost_search(s, es(t), red)
+            ok_a, orden_a, ruta_a, costo_a = a_star_search(s, t, landmarks)
+            assert (ok_a, costo_a) == (ok, costo)
+            if ok:
+                assert ruta_a[0] == s and ruta_a[-1] == t
+                assert costo_ruta(red, ruta_a) == costo
+            expandidos += len(orden)
+            expandidos_a += len(orden_a)
+    # Ante empates A* puede expandir algún nodo de más, pero en total menos
+    assert expandidos_a <= expandidos
@@ -0,0 +1,72 @@
+# ------------------------------------------------------------
+# CacheBusquedas: LRU, invalidación por versión y memoria acotada
+# ------------------------------------------------------------
+
+import pytest
+
+import red_social_busqueda
+from cache_busquedas import CacheBusquedas
+from red_social_busqueda import breadth_first_search, cambiar_arista, uniform_cost_search
+
+
+def es(objetivo):
+    return lambda x: x == objetivo
+
+
+@pytest.fixture
+def arista_restaurada():
+    # cambiar_arista modifica la red global: se deja como estaba
+    costo = red_social_busqueda.grafo["A"]["C"]
+    yield
+    cambiar_arista("A", "C", costo)
+
+
+def test_mismo_resultado_y_aciertos():
+    cache = CacheBusquedas(8)
+    esperado = uniform_cost_search("A", es("G"))
+    assert cache.buscar("CU", "A", "G") == esperado
+    assert cache.buscar("CU", "A", "G") == esperado
+    assert cache.buscar("BPA", "A", "G") == breadth_first_search("A", es("G"))
+    assert (cache.aciertos, cache.fallos) == (1, 2)
+
+
+def test_invalidacion_despues_de_cambiar_arista(arista_restaurada):
+    cache = CacheBusquedas(8)
+    antes = cache.buscar("CU", "A", "G")
+    cambiar_arista("A", "C", None)
+    despues = cache.buscar("CU", "A", "G")
+    assert despues == uniform_cost_search("A", es("G"))
+    assert despues != antes
+    assert cache.invalidaciones == 1 and cache.fallos == 2
+
+
+def test_desalojo_lru():
+    cache = CacheBusquedas(2)
+    cache.buscar("CU", "A", "G")
+    cache.buscar("CU", "A", "H")
+    cache.buscar("CU", "A", "G")        # G pasa a ser el más reciente
+    cache.buscar("CU", "A", "I")        # sale H
+    assert cache.desalojos == 1
+    cache.buscar("CU", "A", "G")
+    assert cache.aciertos == 2
+
+
+def test_compacto_guarda_el_largo_del_orden():
+    cache = CacheBusquedas(8, compacto=True)
+    ok, orden, ruta, costo = uniform_cost_search("A", es("G"))
+    assert cache.buscar("CU", "A", "G") == (ok, len(orden), ruta, costo)
+    assert cache.estadisticas()["elementos"] == 0
+
+
+def test_max_elementos_acota_los_ordenes_guardados():
+    cache = CacheBusquedas(100, max_elementos=15)
+    for objetivo in "BCDEFGHIJ":
+        cache.buscar("BPA", "A", objetivo)
+        assert cache.estadisticas()["elementos"] <= 15 or len(cache) == 1
+    assert cache.desalojos > 0
+
+
+def test_resultado_devuelto_no_altera_el_cache():
+    cache = CacheBusquedas(8)
+    cache.buscar("BPA", "A", "G")[2].append("Z")
+    assert cache.buscar("BPA", "A", "G") == breadth_first_search("A", es("G"))
@@ -0,0 +1,62 @@
+# ------------------------------------------------------------
+# Árboles de caminos mínimos reparados contra uniform_cost_search
+# ------------------------------------------------------------
+
+import random
+
+import pytest
+
+from caminos_dinamicos import RedDinamica
+from red_social_busqueda import uniform_cost_search
+
+
+def es(objetivo):
+    return lambda x: x == objetivo
+
+
+def red_aleatoria(semilla, n=30, m=60):
+    rnd = random.Random(semilla)
+    nodos = [f"n{i:02d}" for i in range(n)]
+    red = {v: {} for v in nodos}
+    for _ in range(m):
+        u, v = rnd.sample(nodos, 2)
+        red[u][v] = red[v][u] = rnd.randint(1, 9)
+    return red
+
+
+def comprobar(dinamica, arbol):
+    red = {u: dict(vecinos) for u, vecinos in dinamica.ady.items()}
+    for t in red:
+        ok, _, _, costo = uniform_cost_search(arbol.origen, es(t), red)
+        assert arbol.distancia(t) == costo
+        if ok:
+            ruta = arbol.ruta(t)
+            assert ruta[0] == arbol.origen and ruta[-1] == t
+            assert sum(red[a][b] for a, b in zip(ruta, ruta[1:])) == costo
+        else:
+            assert arbol.ruta(t) is None
+
+
+@pytest.mark.parametrize("semilla", range(4))
+def test_reparaciones_coinciden_con_uniform_cost_search(semilla):
+    rnd = random.Random(semilla)
+    dinamica = RedDinamica(red_aleatoria(semilla))
+    arboles = [dinamica.arbol(o) for o in ("n00", "n05", "n17")]
+    nodos = sorted(dinamica.ady)
+    for _ in range(40):
+        u, v = rnd.sample(nodos, 2)
+        costo = rnd.choice([None, 1, 3, 9, 20])    # quitar, abaratar o encarecer
+        dinamica.cambiar_arista(u, v, costo)
+        for arbol in arboles:
+            comprobar(dinamica, arbol)
+
+
+def test_cambio_fuera_del_arbol_no_resienta():
+    dinamica = RedDinamica({"A": {"B": 1, "C": 1}, "B": {"A": 1, "C": 5}, "C": {"A": 1, "B": 5}})
+    dinamica.arbol("A")
+    assert dinamica.cambiar_arista("B", "C", 7) == 0
+
+
+def test_origen_desconocido():
+    with pytest.raises(KeyError):
+        RedDinamica().arbol("Z")
@@ -0,0 +1,43 @@
+# ------------------------------------------------------------
+# cargar_lista_aristas: encabezados y costos
+# ------------------------------------------------------------
+
+import io
+
+import pytest
+
+from cargador_grafo import cargar_lista_aristas
+
+
+def cargar(texto, **opciones):
+    return cargar_lista_aristas(io.StringIO(texto), **opciones)
+
+
+@pytest.mark.parametrize("texto", [
+    "src,dst\nA,B\nB,C\n",
+    "source\ttarget\nA\tB\nB\tC\n",
+    "# comentario\norigen,destino,costo\nA,B,1\nB,C,1\n",
+    "a,b,weight\nA,B,1\nB,C,1\n",
+    "A,B\nB,C\n",
+])
+def test_encabezado_detectado(texto):
+    g = cargar(texto)
+    assert list(g.etiquetas) == ["A", "B", "C"]
+    assert g.num_arcos == 4
+
+
+def test_encabezado_explicito():
+    assert list(cargar("x,y\nA,B\n", encabezado=True).etiquetas) == ["A", "B"]
+    assert list(cargar("src,dst\nA,B\n", encabezado=False).etiquetas) == ["A", "B", "dst", "src"]
+    with pytest.raises(ValueError):
+        cargar("a,b,weight\nA,B,1\n", encabezado=False)
+
+
+def test_costo_invalido_despues_del_encabezado():
+    with pytest.raises(ValueError):
+        cargar("src,dst,weight\nA,B,x\n")
+
+
+def test_costos_float():
+    g = cargar("A,B,1\nB,C,2.5\n", dirigido=True)
+    assert g.costo(g.id_de("B"), g.id_de("C")) == 2.5
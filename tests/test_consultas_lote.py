@@ -0,0 +1,51 @@
+# ------------------------------------------------------------
+# Consultas en lote: un árbol por inicio, mismas respuestas que la
+# búsqueda individual
+# ------------------------------------------------------------
+
+import random
+
+import pytest
+
+from consultas_lote import busqueda_lote, construir_arbol
+from red_social_busqueda import breadth_first_search, depth_first_search, uniform_cost_search
+
+BUSQUEDAS = {"BPA": breadth_first_search, "BPP": depth_first_search, "CU": uniform_cost_search}
+
+
+def es(objetivo):
+    return lambda x: x == objetivo
+
+
+def red_aleatoria(semilla, n=30, m=50):
+    rnd = random.Random(semilla)
+    nodos = [f"n{i:02d}" for i in range(n)]
+    red = {v: {} for v in nodos}
+    for _ in range(m):
+        u, v = rnd.sample(nodos, 2)
+        red[u][v] = red[v][u] = rnd.randint(1, 9)
+    return red
+
+
+@pytest.mark.parametrize("algoritmo", sorted(BUSQUEDAS))
+@pytest.mark.parametrize("semilla", range(3))
+def test_lote_igual_a_busqueda_individual(semilla, algoritmo):
+    red = red_aleatoria(semilla)
+    rnd = random.Random(semilla)
+    nodos = sorted(red)
+    consultas = [(rnd.choice(nodos[:5]), rnd.choice(nodos)) for _ in range(60)]
+    consultas.append((nodos[0], "no-existe"))
+    esperadas = [BUSQUEDAS[algoritmo](s, es(t), red) for s, t in consultas]
+    assert busqueda_lote(consultas, algoritmo, red) == esperadas
+
+
+def test_arbol_se_detiene_en_los_objetivos():
+    red = red_aleatoria(1)
+    completo = construir_arbol("n00", "BPA", red)
+    parcial = construir_arbol("n00", "BPA", red, objetivos={"n00"})
+    assert parcial.orden == completo.orden[:1]
+
+
+def test_algoritmo_desconocido():
+    with pytest.raises(ValueError):
+        construir_arbol("A", "XYZ")
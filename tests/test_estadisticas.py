@@ -0,0 +1,81 @@
+# ------------------------------------------------------------
+# EstadisticasBusqueda: no cambia resultados y cuenta bien
+# ------------------------------------------------------------
+
+import pytest
+
+import Opcion2
+from estadisticas import EstadisticasBusqueda, TrazaEstadisticas
+from generadores_grafos import generar
+from red_social_busqueda import ALGORITMOS, grafo_csr
+
+
+def es(objetivo):
+    return lambda x: x == objetivo
+
+
+@pytest.fixture(scope="module")
+def red():
+    return generar("WS", 3000, semilla=8)
+
+
+def consultas(g):
+    n = g.num_nodos
+    return [(g.etiquetas[i % n], g.etiquetas[j % n]) for i, j in [(0, 1), (0, -1), (7, 300), (5, 5)]] + \
+           [(g.etiquetas[3], "no existe")]
+
+
+def relajadas_esperadas(g, orden, ruta):
+    # uniform_cost_search puede expandir dos veces un nodo (aparece dos
+    # veces en el orden): sus aristas se revisan dos veces
+    ids = [g.id_de(x) for x in orden]
+    total = sum(g.offsets[v + 1] - g.offsets[v] for v in ids)
+    if ruta is not None:
+        objetivo = g.id_de(ruta[-1])
+        total -= g.offsets[objetivo + 1] - g.offsets[objetivo]
+    return total
+
+
+@pytest.mark.parametrize("algoritmo", sorted(ALGORITMOS))
+@pytest.mark.parametrize("nombre", ["curso", "ws"])
+def test_mismos_resultados_y_contadores(algoritmo, nombre, red):
+    g = grafo_csr if nombre == "curso" else red
+    busqueda = ALGORITMOS[algoritmo]
+    for inicio, objetivo in consultas(g):
+        est = EstadisticasBusqueda()
+        resultado = busqueda(inicio, es(objetivo), g, estadisticas=est)
+        assert resultado == busqueda(inicio, es(objetivo), g)
+        orden, ruta = resultado[1], resultado[2]
+        assert est.consultas == 1
+        assert est.expandidos == len(orden)
+        assert est.aristas_relajadas == relajadas_esperadas(g, orden, ruta)
+        assert est.frontera_maxima >= 1
+        assert est.inserciones >= len(orden) - 1
+        assert 0 <= est.entradas_obsoletas <= est.decrementos
+        if algoritmo != "CU":
+            assert est.decrementos == 0
+        assert est.tiempo_s >= 0
+
+
+def test_agregado_de_un_lote(red):
+    total = EstadisticasBusqueda()
+    partes = []
+    for inicio, objetivo in consultas(red):
+        parte = EstadisticasBusqueda()
+        ALGORITMOS["CU"](inicio, es(objetivo), red, estadisticas=parte)
+        ALGORITMOS["CU"](inicio, es(objetivo), red, estadisticas=total)
+        partes.append(parte)
+    suma = sum(partes, EstadisticasBusqueda())
+    esperado, obtenido = suma.como_dict(), total.como_dict()
+    esperado.pop("tiempo_s"), obtenido.pop("tiempo_s")
+    assert obtenido == esperado
+    assert total.frontera_maxima == max(p.frontera_maxima for p in partes)
+
+
+def test_opcion2_bpa_como_breadth_first_search(red):
+    for inicio, objetivo in consultas(red)[:4]:
+        original, traza = EstadisticasBusqueda(), TrazaEstadisticas()
+        ALGORITMOS["BPA"](inicio, es(objetivo), red, estadisticas=original)
+        Opcion2.bpa(red, inicio, objetivo, traza=traza)
+        assert traza.estadisticas.expandidos == original.expandidos
+        assert traza.estadisticas.aristas_relajadas == original.aristas_relajadas
@@ -0,0 +1,56 @@
+# ------------------------------------------------------------
+# IndiceHubs: distancias y rutas con pesos float y de costo 0
+# ------------------------------------------------------------
+
+import random
+
+import pytest
+
+from etiquetado_hubs import construir_indice_hubs
+from grafo_csr import como_csr
+from red_social_busqueda import uniform_cost_search
+
+
+def red_aleatoria(semilla, n=40, m=90, pesos=lambda rnd: round(rnd.uniform(0.1, 3), 1)):
+    rnd = random.Random(semilla)
+    red = {f"n{i:02d}": {} for i in range(n)}
+    nodos = sorted(red)
+    for _ in range(m):
+        u, v = rnd.sample(nodos, 2)
+        red[u][v] = red[v][u] = pesos(rnd)
+    return red
+
+
+def costo_ruta(red, ruta):
+    return sum(red[a][b] for a, b in zip(ruta, ruta[1:]))
+
+
+@pytest.mark.parametrize("semilla", range(8))
+def test_ruta_con_pesos_float(semilla):
+    red = red_aleatoria(semilla)
+    g = como_csr(red)
+    indice = construir_indice_hubs(g)
+    rnd = random.Random(semilla)
+    for _ in range(50):
+        s, t = rnd.choice(g.etiquetas), rnd.choice(g.etiquetas)
+        esperado = uniform_cost_search(s, lambda x: x == t, g)[3]
+        d = indice.distance(s, t)
+        ruta = indice.ruta(s, t)
+        if esperado is None:
+            assert d is None and ruta is None
+            continue
+        assert d == pytest.approx(esperado)
+        assert ruta[0] == s and ruta[-1] == t
+        assert costo_ruta(red, ruta) == pytest.approx(esperado)
+
+
+def test_ruta_con_aristas_de_costo_cero():
+    red = red_aleatoria(3, pesos=lambda rnd: rnd.choice([0, 0, 1, 2]))
+    g = como_csr(red)
+    indice = construir_indice_hubs(g)
+    for s in g.etiquetas[:10]:
+        for t in g.etiquetas:
+            ruta = indice.ruta(s, t)
+            if ruta is not None:
+                assert len(set(ruta)) == len(ruta)
+                assert costo_ruta(red, ruta) == indice.distance(s, t)
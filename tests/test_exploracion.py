@@ -0,0 +1,86 @@
+# ------------------------------------------------------------
+# Exploración perezosa: mismo orden y costos que las búsquedas,
+# presupuestos respetados
+# ------------------------------------------------------------
+
+from itertools import islice
+
+import pytest
+
+from exploracion import iter_breadth_first_search, iter_uniform_cost_search
+from generadores_grafos import generar
+from red_social_busqueda import breadth_first_search, grafo_csr, uniform_cost_search
+
+
+def nunca(_):
+    return False
+
+
+def es(objetivo):
+    return lambda x: x == objetivo
+
+
+@pytest.fixture(scope="module")
+def red():
+    return generar("WS", 4000, semilla=6)
+
+
+def sin_repetir(orden):
+    return list(dict.fromkeys(orden))
+
+
+@pytest.mark.parametrize("nombre", ["curso", "ws"])
+def test_bfs_como_breadth_first_search(nombre, red):
+    g = grafo_csr if nombre == "curso" else red
+    inicio = g.etiquetas[1]
+    entregados = list(iter_breadth_first_search(inicio, g))
+    assert [n for n, _, _ in entregados] == breadth_first_search(inicio, nunca, g)[1]
+    saltos = {n: s for n, s, _ in entregados}
+    for nodo, s, padre in entregados[::37]:
+        assert s == len(breadth_first_search(inicio, es(nodo), g)[2]) - 1
+        assert (padre is None) == (nodo == inicio)
+        if padre is not None:
+            assert saltos[padre] == s - 1
+
+
+@pytest.mark.parametrize("nombre", ["curso", "ws"])
+def test_ucs_como_uniform_cost_search(nombre, red):
+    g = grafo_csr if nombre == "curso" else red
+    inicio = g.etiquetas[2]
+    entregados = list(iter_uniform_cost_search(inicio, g))
+    assert [n for n, _, _ in entregados] == sin_repetir(uniform_cost_search(inicio, nunca, g)[1])
+    costos = {n: c for n, c, _ in entregados}
+    for nodo, c, padre in entregados[::37]:
+        assert c == uniform_cost_search(inicio, es(nodo), g)[3]
+        if padre is not None:
+            assert costos[padre] + g.costo(g.id_de(padre), g.id_de(nodo)) == c
+
+
+def test_presupuestos_bfs(red):
+    inicio = red.etiquetas[0]
+    completo = list(iter_breadth_first_search(inicio, red))
+    for max_saltos in (0, 1, 3):
+        parcial = list(iter_breadth_first_search(inicio, red, max_saltos=max_saltos))
+        assert parcial == [x for x in completo if x[1] <= max_saltos]
+    assert list(iter_breadth_first_search(inicio, red, max_nodos=50)) == completo[:50]
+    assert list(iter_breadth_first_search(inicio, red, max_nodos=0)) == []
+
+
+def test_presupuestos_ucs(red):
+    inicio = red.etiquetas[0]
+    completo = list(iter_uniform_cost_search(inicio, red))
+    for max_costo in (0, 5, 12):
+        parcial = list(iter_uniform_cost_search(inicio, red, max_costo=max_costo))
+        assert parcial == [x for x in completo if x[1] <= max_costo]
+    assert list(iter_uniform_cost_search(inicio, red, max_nodos=50)) == completo[:50]
+    ambos = list(iter_uniform_cost_search(inicio, red, max_costo=12, max_nodos=10))
+    assert ambos == [x for x in completo if x[1] <= 12][:10]
+
+
+def test_perezoso(red):
+    # Cortar el generador da el prefijo del recorrido completo
+    inicio = red.etiquetas[9]
+    assert list(islice(iter_uniform_cost_search(inicio, red), 5)) == \
+        list(iter_uniform_cost_search(inicio, red))[:5]
+    primero = next(iter_breadth_first_search(inicio, red))
+    assert primero == (inicio, 0, None)
@@ -0,0 +1,71 @@
+# ------------------------------------------------------------
+# Grafo fragmentado: BPA / CU distribuidas contra las originales
+# ------------------------------------------------------------
+
+import random
+
+import pytest
+
+from cargador_grafo import guardar_binario
+from fragmentos import (
+    GrafoFragmentado,
+    distributed_breadth_first_search,
+    distributed_uniform_cost_search,
+)
+from generadores_grafos import generar
+from grafo_csr import como_csr
+from red_social_busqueda import breadth_first_search, uniform_cost_search
+
+
+def es(objetivo):
+    return lambda x: x == objetivo
+
+
+def costo_ruta(g, ruta):
+    ids = [g.id_de(x) for x in ruta]
+    return sum(g.costo(u, v) for u, v in zip(ids, ids[1:]))
+
+
+@pytest.fixture(scope="module")
+def red():
+    # Dos componentes: los nodos de la segunda son inalcanzables desde la primera
+    g = generar("WS", 1500, semilla=5)
+    red = {g.etiquetas[u]: {g.etiquetas[v]: w for v, w in g.aristas(u)} for u in range(g.num_nodos)}
+    red["z1"] = {"z2": 3}
+    red["z2"] = {"z1": 3}
+    return como_csr(red)
+
+
+@pytest.mark.parametrize("particion", ["hash", "rangos"])
+def test_coincide_con_busquedas_originales(red, particion):
+    rnd = random.Random(11)
+    pares = [(rnd.choice(red.etiquetas[:-2]), rnd.choice(red.etiquetas)) for _ in range(12)]
+    pares.append((red.etiquetas[0], "z2"))
+    with GrafoFragmentado(red, 3, particion) as fr:
+        for s, t in pares:
+            ok, _, ruta = breadth_first_search(s, es(t), red)
+            ok_d, ruta_d, saltos = distributed_breadth_first_search(s, t, fr)
+            assert ok_d == ok
+            if ok:
+                assert saltos == len(ruta) - 1 == len(ruta_d) - 1
+                assert ruta_d[0] == s and ruta_d[-1] == t
+            else:
+                assert ruta_d is None and saltos is None
+
+            ok, _, _, costo = uniform_cost_search(s, es(t), red)
+            for delta in (None, 1, 100):
+                ok_d, ruta_d, costo_d = distributed_uniform_cost_search(s, t, fr, delta)
+                assert ok_d == ok and costo_d == costo
+                if ok:
+                    assert costo_ruta(red, ruta_d) == costo
+
+
+def test_desde_archivo_binario_y_dirigido(tmp_path):
+    red = {"A": {"B": 1.5, "C": 4}, "B": {"C": 1.25}, "C": {}, "D": {"A": 1}}
+    ruta = str(tmp_path / "red.gcsr")
+    guardar_binario(como_csr(red), ruta)
+    with GrafoFragmentado(ruta, 2, "rangos") as fr:
+        assert distributed_uniform_cost_search("A", "C", fr) == (True, ["A", "B", "C"], 2.75)
+        assert distributed_breadth_first_search("A", "C", fr) == (True, ["A", "C"], 1)
+        assert distributed_uniform_cost_search("A", "D", fr) == (False, None, None)
+        assert distributed_breadth_first_search("C", "A", fr) == (False, None, None)
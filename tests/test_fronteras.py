@@ -0,0 +1,55 @@
+# ------------------------------------------------------------
+# Cola / Pila y las BPA / BPP que las usan
+# ------------------------------------------------------------
+
+import random
+
+import pytest
+
+import Opcion2
+from fronteras import Cola, Pila
+from red_social_busqueda import breadth_first_search, depth_first_search
+
+
+def es(objetivo):
+    return lambda x: x == objetivo
+
+
+def red_aleatoria(semilla, n=30, m=60):
+    rnd = random.Random(semilla)
+    nodos = [f"n{i:02d}" for i in range(n)]
+    red = {v: {} for v in nodos}
+    for _ in range(m):
+        u, v = rnd.sample(nodos, 2)
+        red[u][v] = red[v][u] = rnd.randint(1, 9)
+    return red
+
+
+def test_cola_fifo_con_pertenencia():
+    cola = Cola(["A", "B"])
+    cola.encolar("C")
+    assert "B" in cola and "Z" not in cola and len(cola) == 3
+    assert list(cola) == ["A", "B", "C"]
+    assert cola.decolar() == "A"
+    assert "A" not in cola and len(cola) == 2
+
+
+def test_pila_lifo_con_pertenencia():
+    pila = Pila(["A", "B"])
+    pila.apilar("C")
+    assert list(pila) == ["A", "B", "C"]
+    assert pila.desapilar() == "C"
+    assert "C" not in pila and "A" in pila and len(pila) == 2
+
+
+@pytest.mark.parametrize("semilla", range(5))
+def test_bpa_y_bpp_de_opcion2_coinciden_con_el_modulo_principal(semilla):
+    red = red_aleatoria(semilla)
+    lista = {u: sorted(vecinos.items()) for u, vecinos in red.items()}
+    nodos = sorted(red)
+    for s in nodos[:6]:
+        for t in nodos:
+            ok, orden, ruta = breadth_first_search(s, es(t), red)
+            assert Opcion2.bpa(lista, s, t) == (ruta, orden)
+            ok, orden, ruta = depth_first_search(s, es(t), red)
+            assert Opcion2.bpp(lista, s, t) == (ruta, orden)
@@ -0,0 +1,58 @@
+# ------------------------------------------------------------
+# Generadores sintéticos y csr_desde_arcos
+# ------------------------------------------------------------
+
+from array import array
+
+import pytest
+
+from cargador_grafo import csr_desde_arcos
+from generadores_grafos import COSTO_MAX, COSTO_MIN, generar
+from red_social_busqueda import breadth_first_search, uniform_cost_search
+
+
+@pytest.mark.parametrize("modelo", ["BA", "ER", "WS"])
+def test_no_dirigido_y_costos_en_rango(modelo):
+    g = generar(modelo, 3000, semilla=1)
+    assert g.num_nodos == 2 * 3000 // 10
+    assert g.num_arcos % 2 == 0
+    for u in range(g.num_nodos):
+        for v, w in g.aristas(u):
+            assert v != u
+            assert COSTO_MIN <= w <= COSTO_MAX
+            assert g.costo(v, u) == w
+    assert g.etiquetas == sorted(g.etiquetas)
+
+
+@pytest.mark.parametrize("modelo", ["BA", "ER", "WS"])
+def test_misma_semilla_mismo_grafo(modelo):
+    a, b = generar(modelo, 2000, semilla=5), generar(modelo, 2000, semilla=5)
+    c = generar(modelo, 2000, semilla=6)
+    assert (a.etiquetas, list(a.offsets), list(a.destinos), list(a.pesos)) == \
+           (b.etiquetas, list(b.offsets), list(b.destinos), list(b.pesos))
+    assert (list(a.destinos), list(a.pesos)) != (list(c.destinos), list(c.pesos))
+
+
+def test_busquedas_sobre_generado():
+    g = generar("BA", 2000, semilla=3)
+    inicio, objetivo = g.etiquetas[0], g.etiquetas[-1]
+    ok, _, ruta = breadth_first_search(inicio, lambda s: s == objetivo, g)
+    assert ok and ruta[0] == inicio and ruta[-1] == objetivo
+    assert uniform_cost_search(inicio, lambda s: s == objetivo, g)[0]
+
+
+def test_modelo_desconocido():
+    with pytest.raises(ValueError):
+        generar("XX", 100)
+
+
+def test_csr_desde_arcos():
+    # Etiquetas fuera de orden y una arista repetida (gana la última)
+    indice = {"c": 0, "a": 1, "b": 2}
+    g = csr_desde_arcos(indice, array("i", [0, 1, 0, 0]), array("i", [1, 2, 2, 2]),
+                        array("q", [4, 3, 9, 5]))
+    assert g.etiquetas == ["a", "b", "c"]
+    assert indice == {"a": 0, "b": 1, "c": 2}
+    assert [(g.etiquetas[u], g.etiquetas[v], w)
+            for u in range(g.num_nodos) for v, w in g.aristas(u)] == \
+           [("a", "b", 3), ("c", "a", 4), ("c", "b", 5)]
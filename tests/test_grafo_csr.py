@@ -0,0 +1,25 @@
+# ------------------------------------------------------------
+# GrafoCSR: vecinos en orden inverso (BPP)
+# ------------------------------------------------------------
+
+import Opcion2
+from grafo_csr import como_csr
+from red_social_busqueda import depth_first_search
+
+
+def test_vecinos_inverso_nodo_cero_aislado():
+    g = como_csr({"A": {}, "B": {"C": 1}, "C": {"B": 1}})
+    assert list(g.vecinos_inverso(g.id_de("A"))) == []
+    assert g.etiquetar(g.vecinos_inverso(g.id_de("B"))) == ["C"]
+
+
+def test_vecinos_inverso_orden():
+    g = como_csr({"A": {"B": 1, "C": 2, "D": 3}})
+    assert g.etiquetar(g.vecinos_inverso(g.id_de("A"))) == ["D", "C", "B"]
+
+
+def test_bpp_desde_nodo_cero_aislado():
+    red = {"A": {}, "B": {"C": 1}, "C": {"B": 1}}
+    ok, orden, ruta = depth_first_search("A", lambda x: x == "C", red)
+    assert not ok and ruta is None and orden == ["A"]
+    assert Opcion2.bpp({"A": [], "B": [("C", 1)], "C": [("B", 1)]}, "A", "C") == (None, ["A"])
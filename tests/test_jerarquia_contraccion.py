@@ -0,0 +1,59 @@
+# ------------------------------------------------------------
+# Contraction Hierarchies contra uniform_cost_search
+# ------------------------------------------------------------
+
+import random
+
+import pytest
+
+from jerarquia_contraccion import (
+    _atajos,
+    _diferencia_estimada,
+    construir_jerarquia,
+    contraction_hierarchy_search,
+)
+from red_social_busqueda import uniform_cost_search
+
+
+def es(objetivo):
+    return lambda x: x == objetivo
+
+
+def red_aleatoria(semilla, n=60, m=150):
+    rnd = random.Random(semilla)
+    nodos = [f"n{i:02d}" for i in range(n)]
+    red = {v: {} for v in nodos}
+    for _ in range(m):
+        u, v = rnd.sample(nodos, 2)
+        red[u][v] = red[v][u] = rnd.randint(1, 9)
+    return red
+
+
+def costo_ruta(red, ruta):
+    return sum(red[a][b] for a, b in zip(ruta, ruta[1:]))
+
+
+@pytest.mark.parametrize("grado_nucleo", [None, 4])
+@pytest.mark.parametrize("semilla", range(4))
+def test_coincide_con_uniform_cost_search(semilla, grado_nucleo):
+    red = red_aleatoria(semilla)
+    red["aislado"] = {}
+    ch = construir_jerarquia(red, grado_nucleo=grado_nucleo)
+    nodos = sorted(red)
+    for s in nodos[:10]:
+        for t in nodos:
+            ok, _, _, costo = uniform_cost_search(s, es(t), red)
+            ok_ch, _, ruta, costo_ch = contraction_hierarchy_search(s, t, ch)
+            assert (ok_ch, costo_ch) == (ok, costo)
+            if ok:
+                assert ruta[0] == s and ruta[-1] == t
+                assert costo_ruta(red, ruta) == costo
+
+
+def test_prioridad_estimada_no_subestima():
+    red = red_aleatoria(9)
+    ch = construir_jerarquia(red)        # solo para obtener el grafo CSR
+    g = ch.grafo
+    ady = [{v: (w, -1) for v, w in g.aristas(u)} for u in range(g.num_nodos)]
+    for v in range(g.num_nodos):
+        assert _diferencia_estimada(ady, v) >= len(_atajos(ady, v, 50)) - len(ady[v])
@@ -0,0 +1,86 @@
+# ------------------------------------------------------------
+# Yen: k rutas simples, distintas, en orden de costo
+# ------------------------------------------------------------
+
+import pytest
+
+from generadores_grafos import erdos_renyi, generar
+from k_rutas import k_shortest_paths
+from red_social_busqueda import grafo_csr, uniform_cost_search
+
+
+def es(objetivo):
+    return lambda x: x == objetivo
+
+
+def costo_de(g, ruta):
+    ids = [g.id_de(x) for x in ruta]
+    return sum(g.costo(u, v) for u, v in zip(ids, ids[1:]))
+
+
+def todas_las_rutas(g, inicio, objetivo):
+    # Fuerza bruta: costos de todas las rutas simples
+    costos = []
+    pila = [(g.id_de(inicio), [g.id_de(inicio)], 0)]
+    meta = g.id_de(objetivo)
+    while pila:
+        u, ruta, costo = pila.pop()
+        if u == meta:
+            costos.append(costo)
+            continue
+        for v, w in g.aristas(u):
+            if v not in ruta:
+                pila.append((v, ruta + [v], costo + w))
+    return sorted(costos)
+
+
+def revisar(g, rutas, inicio, objetivo):
+    costos = [c for _, c in rutas]
+    assert costos == sorted(costos)
+    assert len({tuple(r) for r, _ in rutas}) == len(rutas)
+    for ruta, costo in rutas:
+        assert ruta[0] == inicio and ruta[-1] == objetivo
+        assert len(set(ruta)) == len(ruta)
+        assert costo_de(g, ruta) == costo
+
+
+@pytest.mark.parametrize("inicio, objetivo", [("A", "G"), ("B", "J"), ("E", "C"), ("A", "B")])
+def test_red_del_curso_contra_fuerza_bruta(inicio, objetivo):
+    rutas = k_shortest_paths(inicio, objetivo, 15)
+    revisar(grafo_csr, rutas, inicio, objetivo)
+    esperados = todas_las_rutas(grafo_csr, inicio, objetivo)
+    assert [c for _, c in rutas] == esperados[:15]
+    assert rutas[0][1] == uniform_cost_search(inicio, es(objetivo))[3]
+
+
+@pytest.mark.parametrize("semilla", range(4))
+def test_grafos_chicos_contra_fuerza_bruta(semilla):
+    g = erdos_renyi(11, 22, semilla)
+    inicio, objetivo = g.etiquetas[0], g.etiquetas[-1]
+    esperados = todas_las_rutas(g, inicio, objetivo)
+    rutas = k_shortest_paths(inicio, objetivo, 25, g)
+    revisar(g, rutas, inicio, objetivo)
+    assert [c for _, c in rutas] == esperados[:25]
+
+
+def test_grafo_grande_primera_como_ucs():
+    g = generar("BA", 5000, semilla=2)
+    inicio, objetivo = g.etiquetas[3], g.etiquetas[-2]
+    rutas = k_shortest_paths(inicio, objetivo, 8, g)
+    assert len(rutas) == 8
+    revisar(g, rutas, inicio, objetivo)
+    assert rutas[0][1] == uniform_cost_search(inicio, es(objetivo), g)[3]
+
+
+def test_dirigido_con_red_inversa():
+    red = {"A": {"B": 1, "C": 4}, "B": {"C": 1, "D": 5}, "C": {"D": 1}, "D": {}}
+    inversa = {"A": {}, "B": {"A": 1}, "C": {"A": 4, "B": 1}, "D": {"B": 5, "C": 1}}
+    rutas = k_shortest_paths("A", "D", 5, red, inversa)
+    assert rutas == [(["A", "B", "C", "D"], 3), (["A", "C", "D"], 5), (["A", "B", "D"], 6)]
+
+
+def test_casos_borde():
+    assert k_shortest_paths("A", "G", 0) == []
+    assert k_shortest_paths("A", "A", 3) == [(["A"], 0)]
+    red = {"A": {"B": 1}, "B": {"A": 1}, "C": {}}
+    assert k_shortest_paths("A", "C", 3, red) == []
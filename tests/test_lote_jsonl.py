@@ -0,0 +1,87 @@
+# ------------------------------------------------------------
+# Lotes JSONL: resultados de las búsquedas y errores por línea
+# ------------------------------------------------------------
+
+import io
+import json
+
+import pytest
+
+from lote_jsonl import costo_ruta, procesar_flujo
+from red_social_busqueda import ALGORITMOS, grafo_csr
+
+
+def es(objetivo):
+    return lambda x: x == objetivo
+
+
+def correr(lineas, **opciones):
+    salida = io.StringIO()
+    contadores = procesar_flujo(io.StringIO("\n".join(lineas) + "\n"), salida, **opciones)
+    return contadores, [json.loads(l) for l in salida.getvalue().splitlines()]
+
+
+CONSULTAS = [
+    {"id": 1, "algoritmo": "CU", "inicio": "A", "objetivo": "G"},
+    {"id": 2, "algoritmo": "BPA", "inicio": "A", "objetivo": "G"},
+    {"id": 3, "algoritmo": "BPP", "inicio": "B", "objetivo": "F"},
+    {"id": 4, "inicio": "A", "objetivo": "G"},
+    {"id": 5, "algoritmo": "CU", "inicio": "A", "objetivo": "G"},
+]
+
+
+@pytest.mark.parametrize("opciones", [{}, {"con_orden": True},
+                                      {"con_orden": True, "cache_orden": 100}])
+def test_como_las_busquedas(opciones):
+    (resueltas, errores), respuestas = correr([json.dumps(c) for c in CONSULTAS], **opciones)
+    assert (resueltas, errores) == (len(CONSULTAS), 0)
+    for consulta, respuesta in zip(CONSULTAS, respuestas):
+        algoritmo = consulta.get("algoritmo", "CU")
+        ok, orden, ruta = ALGORITMOS[algoritmo](consulta["inicio"], es(consulta["objetivo"]))[:3]
+        assert respuesta["id"] == consulta["id"]
+        assert (respuesta["ok"], respuesta["ruta"]) == (ok, ruta)
+        assert respuesta["expandidos"] == len(orden)
+        assert respuesta["costo"] == costo_ruta(grafo_csr, ruta)
+        if opciones.get("con_orden"):
+            assert respuesta["orden"] == orden
+        else:
+            assert "orden" not in respuesta
+
+
+def test_errores_por_linea_no_cortan_el_flujo():
+    lineas = [
+        json.dumps(CONSULTAS[0]),
+        "{no es json",
+        json.dumps({"id": 9, "inicio": "A"}),
+        json.dumps({"algoritmo": "XX", "inicio": "A", "objetivo": "G"}),
+        json.dumps({"inicio": "Z", "objetivo": "G"}),
+        "[1, 2]",
+        "",
+        json.dumps(CONSULTAS[1]),
+    ]
+    (resueltas, errores), respuestas = correr(lineas)
+    assert (resueltas, errores) == (2, 5)
+    assert [r.get("linea") for r in respuestas] == [None, 2, 3, 4, 5, 6, None]
+    assert all("error" in r for r in respuestas[1:6])
+    assert respuestas[0]["id"] == 1 and respuestas[-1]["id"] == 2
+    assert respuestas[-1]["ruta"] == ALGORITMOS["BPA"]("A", es("G"))[2]
+
+
+def test_cache_compacto_sin_orden(monkeypatch):
+    # Sin --orden el cache guarda solo el largo del orden de visita; con
+    # --orden y sin cache_orden no hay cache
+    import lote_jsonl
+
+    creados = []
+    original = lote_jsonl.CacheBusquedas
+
+    def espiar(*args, **kwargs):
+        creados.append(original(*args, **kwargs))
+        return creados[-1]
+
+    monkeypatch.setattr(lote_jsonl, "CacheBusquedas", espiar)
+    correr([json.dumps(c) for c in CONSULTAS])
+    correr([json.dumps(c) for c in CONSULTAS], con_orden=True)
+    assert len(creados) == 1
+    assert creados[0].compacto and creados[0].aciertos == 2
+    assert creados[0].estadisticas()["elementos"] == 0
@@ -0,0 +1,70 @@
+# ------------------------------------------------------------
+# GrafoCompartido: crear / adjuntar / liberar
+# ------------------------------------------------------------
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from memoria_compartida import GrafoCompartido
+from red_social_busqueda import uniform_cost_search
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def costo(g):
+    return uniform_cost_search("A", lambda x: x == "G", g)[3]
+
+
+def test_ciclo_de_vida():
+    with GrafoCompartido.crear() as compartido:
+        otro = GrafoCompartido.adjuntar(compartido.nombre)
+        assert costo(otro.grafo) == costo(None)
+        otro.liberar()
+        assert otro.liberado and not compartido.liberado
+        nombre = compartido.nombre
+    with pytest.raises(FileNotFoundError):
+        GrafoCompartido.adjuntar(nombre)
+
+
+def test_proceso_independiente_no_borra_el_bloque():
+    with GrafoCompartido.crear() as compartido:
+        codigo = (
+            f"import sys; sys.path.insert(0, {RAIZ!r})\n"
+            "from memoria_compartida import GrafoCompartido\n"
+            f"g = GrafoCompartido.adjuntar({compartido.nombre!r})\n"
+            "print(g.grafo.num_nodos)\n"
+            "g.liberar()\n"
+        )
+        salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True)
+        assert int(salida.stdout) == compartido.grafo.num_nodos
+        # El bloque sigue ahí después de que el otro proceso terminó
+        GrafoCompartido.adjuntar(compartido.nombre).liberar()
+
+
+def test_nombre_del_tracker():
+    import memoria_compartida
+
+    with GrafoCompartido.crear() as compartido:
+        memoria = compartido._memoria
+        assert memoria_compartida._nombre_tracker(memoria).lstrip("/") == memoria.name
+        if memoria_compartida._TRACKER:
+            assert memoria_compartida._nombre_tracker(memoria) == memoria._name
+
+
+@pytest.mark.parametrize("tracker_compartido", [False, True])
+def test_adjuntar_en_el_mismo_proceso_sin_avisos(tracker_compartido):
+    # El tracker avisa al salir si un bloque quedó registrado sin borrar
+    # o si se borró uno que no estaba registrado
+    codigo = (
+        f"import sys; sys.path.insert(0, {RAIZ!r})\n"
+        "from memoria_compartida import GrafoCompartido\n"
+        "dueno = GrafoCompartido.crear()\n"
+        f"otro = GrafoCompartido.adjuntar(dueno.nombre, {tracker_compartido})\n"
+        "otro.liberar()\n"
+        "dueno.liberar()\n"
+    )
+    salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True)
+    assert salida.stderr == ""
@@ -0,0 +1,91 @@
+# ------------------------------------------------------------
+# Multi-origen: mismas distancias que el mínimo de las búsquedas
+# individuales y parada en el objetivo más cercano
+# ------------------------------------------------------------
+
+import pytest
+
+from generadores_grafos import generar
+from multi_origen import multi_source_breadth_first_search, multi_source_uniform_cost_search
+from red_social_busqueda import breadth_first_search, grafo_csr, uniform_cost_search
+
+
+def es(objetivo):
+    return lambda x: x == objetivo
+
+
+def saltos(inicio, objetivo, g):
+    ok, _, ruta = breadth_first_search(inicio, es(objetivo), g)
+    return len(ruta) - 1 if ok else None
+
+
+def costo(inicio, objetivo, g):
+    return uniform_cost_search(inicio, es(objetivo), g)[3]
+
+
+BUSQUEDAS = [(multi_source_breadth_first_search, saltos),
+             (multi_source_uniform_cost_search, costo)]
+
+
+@pytest.fixture(scope="module")
+def red():
+    return generar("ER", 600, semilla=11)
+
+
+def individuales(g, origenes, nodo, distancia):
+    return {s: distancia(s, nodo, g) for s in origenes}
+
+
+def costo_ruta(g, ruta):
+    ids = [g.id_de(x) for x in ruta]
+    return sum(g.costo(u, v) for u, v in zip(ids, ids[1:]))
+
+
+@pytest.mark.parametrize("multi, distancia", BUSQUEDAS)
+@pytest.mark.parametrize("nombre", ["curso", "er"])
+def test_distancias_como_el_minimo(multi, distancia, nombre, red):
+    g = grafo_csr if nombre == "curso" else red
+    origenes = [g.etiquetas[i] for i in (0, 3, g.num_nodos // 2, g.num_nodos - 1)]
+    resultado = multi(origenes, g)
+    for nodo in g.etiquetas[::max(1, g.num_nodos // 40)]:
+        por_origen = {s: d for s, d in individuales(g, origenes, nodo, distancia).items()
+                      if d is not None}
+        if not por_origen:
+            assert resultado.mas_cercano(nodo) is None
+            continue
+        minimo = min(por_origen.values())
+        origen, d = resultado.mas_cercano(nodo)
+        assert d == minimo
+        # Empate: gana el origen lexicográficamente menor
+        assert origen == min(s for s, x in por_origen.items() if x == minimo)
+        ruta = resultado.ruta(nodo)
+        assert ruta[0] == origen and ruta[-1] == nodo
+        if multi is multi_source_uniform_cost_search:
+            assert costo_ruta(g, ruta) == d
+        else:
+            assert len(ruta) - 1 == d
+
+
+@pytest.mark.parametrize("multi, distancia", BUSQUEDAS)
+def test_objetivo_mas_cercano(multi, distancia, red):
+    origenes = [red.etiquetas[5], red.etiquetas[77]]
+    objetivos = [red.etiquetas[i] for i in (20, 40, 60, 90, 110)]
+    completo = multi(origenes, red)
+    resultado = multi(origenes, red, objetivos=objetivos)
+
+    objetivo, origen, d, ruta = resultado.objetivo_encontrado()
+    alcanzados = [completo.mas_cercano(t) for t in objetivos]
+    assert d == min(x[1] for x in alcanzados if x is not None)
+    assert objetivo in objetivos and ruta[0] == origen and ruta[-1] == objetivo
+    assert d == min(distancia(s, objetivo, red) for s in origenes)
+    # Se detuvo antes de recorrer todo
+    assert len(resultado.orden) < len(completo.orden)
+    assert completo.objetivo_encontrado() is None
+
+
+@pytest.mark.parametrize("multi", [m for m, _ in BUSQUEDAS])
+def test_origen_objetivo_y_sin_origenes(multi):
+    resultado = multi(["B", "E"], objetivos=["E", "J"])
+    assert resultado.objetivo_encontrado() == ("E", "E", 0, ["E"])
+    with pytest.raises(ValueError):
+        multi([])
@@ -0,0 +1,44 @@
+# ------------------------------------------------------------
+# Opcion2.cu (montículo binario + padres) contra uniform_cost_search
+# ------------------------------------------------------------
+
+import random
+
+import pytest
+
+import Opcion2
+from red_social_busqueda import uniform_cost_search
+
+
+def es(objetivo):
+    return lambda x: x == objetivo
+
+
+def red_aleatoria(semilla, n=30, m=60):
+    rnd = random.Random(semilla)
+    nodos = [f"n{i:02d}" for i in range(n)]
+    red = {v: {} for v in nodos}
+    for _ in range(m):
+        u, v = rnd.sample(nodos, 2)
+        red[u][v] = red[v][u] = rnd.randint(1, 9)
+    return red
+
+
+def test_caso_del_taller():
+    ruta, costo, _ = Opcion2.cu(Opcion2.crear_grafo(), "A", "D")
+    assert (ruta, costo) == (["A", "D"], 6)
+
+
+@pytest.mark.parametrize("semilla", range(5))
+def test_cu_coincide_con_uniform_cost_search(semilla):
+    red = red_aleatoria(semilla)
+    lista = {u: sorted(vecinos.items()) for u, vecinos in red.items()}
+    nodos = sorted(red)
+    for s in nodos[:6]:
+        for t in nodos:
+            ok, _, ruta, costo = uniform_cost_search(s, es(t), red)
+            ruta_cu, costo_cu, _ = Opcion2.cu(lista, s, t)
+            assert ruta_cu == ruta
+            assert costo_cu == (costo if ok else float("inf"))
+            if ok:
+                assert sum(red[a][b] for a, b in zip(ruta, ruta[1:])) == costo
@@ -0,0 +1,59 @@
+# ------------------------------------------------------------
+# Lotes en paralelo: mismos resultados que las búsquedas individuales
+# ------------------------------------------------------------
+
+import random
+
+import pytest
+
+from cargador_grafo import cargar_binario, guardar_binario
+from generadores_grafos import generar
+from memoria_compartida import GrafoCompartido
+from paralelo import ejecutar_en_paralelo
+from red_social_busqueda import ALGORITMOS
+
+
+def es(objetivo):
+    return lambda x: x == objetivo
+
+
+@pytest.fixture(scope="module")
+def red():
+    return generar("BA", 2000, semilla=2)
+
+
+@pytest.fixture(scope="module")
+def consultas(red):
+    rnd = random.Random(4)
+    return [(rnd.choice(sorted(ALGORITMOS)), rnd.choice(red.etiquetas[:10]), rnd.choice(red.etiquetas))
+            for _ in range(40)]
+
+
+def esperadas(red, consultas):
+    return [ALGORITMOS[a](s, es(t), red) for a, s, t in consultas]
+
+
+@pytest.mark.parametrize("procesos", [1, 2])
+def test_en_memoria(red, consultas, procesos):
+    assert ejecutar_en_paralelo(consultas, red, procesos, tam_bloque=7) == esperadas(red, consultas)
+
+
+def test_desde_archivo_binario(red, consultas, tmp_path):
+    ruta = str(tmp_path / "red.gcsr")
+    guardar_binario(red, ruta)
+    assert ejecutar_en_paralelo(consultas, ruta, 2) == esperadas(red, consultas)
+
+
+def test_grafo_compartido(red, consultas):
+    with GrafoCompartido.crear(red) as compartido:
+        assert ejecutar_en_paralelo(consultas, compartido, 2) == esperadas(red, consultas)
+
+
+def test_grafo_mapeado_pide_ruta(red, consultas, tmp_path):
+    ruta = str(tmp_path / "red.gcsr")
+    guardar_binario(red, ruta)
+    mapeado = cargar_binario(ruta)
+    with pytest.raises(ValueError, match="ruta del .gcsr"):
+        ejecutar_en_paralelo(consultas, mapeado, 2)
+    # En el mismo proceso sí se puede usar
+    assert ejecutar_en_paralelo(consultas, mapeado, 1) == esperadas(red, consultas)
@@ -0,0 +1,73 @@
+# ------------------------------------------------------------
+# Profundización iterativa e IDA*: terminación sin chequeo de ciclos
+# ------------------------------------------------------------
+
+import random
+
+import pytest
+
+from grafo_csr import como_csr
+from profundizacion import iterative_deepening_search, ida_star_search
+from red_social_busqueda import breadth_first_search, uniform_cost_search
+
+RED = {"A": {"B": 1}, "B": {"A": 1}, "C": {}}
+
+
+def es(objetivo):
+    return lambda x: x == objetivo
+
+
+def test_sin_evitar_ciclos_exige_tope():
+    with pytest.raises(ValueError):
+        iterative_deepening_search("A", es("C"), RED, evitar_ciclos=False)
+    with pytest.raises(ValueError):
+        ida_star_search("A", es("C"), RED, evitar_ciclos=False)
+
+
+def test_objetivo_inalcanzable_termina():
+    assert iterative_deepening_search("A", es("C"), RED)[:2] == (False, None)
+    assert iterative_deepening_search("A", es("C"), RED, limite_maximo=30,
+                                      evitar_ciclos=False)[:2] == (False, None)
+    assert ida_star_search("A", es("C"), RED)[:3] == (False, None, None)
+    assert ida_star_search("A", es("C"), RED, evitar_ciclos=False,
+                           costo_maximo=30)[:3] == (False, None, None)
+
+
+@pytest.mark.parametrize("evitar_ciclos", [True, False])
+def test_coincide_con_bpa_y_cu(evitar_ciclos):
+    rnd = random.Random(7)
+    red = {f"n{i}": {} for i in range(8)}
+    nodos = sorted(red)
+    for _ in range(10):
+        u, v = rnd.sample(nodos, 2)
+        red[u][v] = red[v][u] = rnd.randint(1, 5)
+    g = como_csr(red)
+    for s in nodos:
+        for t in nodos:
+            bpa = breadth_first_search(s, es(t), g)
+            cu = uniform_cost_search(s, es(t), g)
+            ok, ruta, _ = iterative_deepening_search(s, es(t), g, limite_maximo=8,
+                                                     evitar_ciclos=evitar_ciclos)
+            assert ok == bpa[0]
+            if ok:
+                assert len(ruta) == len(bpa[2])
+            ok, ruta, costo, _ = ida_star_search(s, es(t), g, evitar_ciclos=evitar_ciclos,
+                                                 costo_maximo=25)
+            assert ok == cu[0] and costo == cu[3]
+
+
+def test_inalcanzable_no_profundiza_de_mas():
+    # Camino A-B-C-D-E y X aislado: con chequeo de ciclos basta con llegar
+    # al final del camino; no hace falta seguir subiendo el límite
+    red = {"A": {"B": 1}, "B": {"A": 1, "C": 1}, "C": {"B": 1, "D": 1},
+           "D": {"C": 1, "E": 1}, "E": {"D": 1}, "X": {}}
+    _, _, expandidos = iterative_deepening_search("A", es("X"), red)
+    # límites 0..4: 1 + 2 + 3 + 4 + 5 nodos expandidos
+    assert expandidos == 15
+
+    # Ciclo A-B-C-A: después del límite 2 ningún vecino queda fuera de la ruta
+    ciclo = {"A": {"B": 1, "C": 1}, "B": {"A": 1, "C": 1}, "C": {"A": 1, "B": 1}, "X": {}}
+    assert iterative_deepening_search("A", es("X"), ciclo, limite_maximo=2)[:2] == (False, None)
+    _, _, total = iterative_deepening_search("A", es("X"), ciclo)
+    _, _, hasta_dos = iterative_deepening_search("A", es("X"), ciclo, limite_maximo=2)
+    assert total == hasta_dos
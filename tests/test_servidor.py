@@ -0,0 +1,98 @@
+# ------------------------------------------------------------
+# Servidor: mismas respuestas que las búsquedas y errores aislados
+# ------------------------------------------------------------
+
+import asyncio
+import json
+
+import pytest
+
+from paralelo import iniciar_trabajador, resolver_bloque_aislado
+from red_social_busqueda import (breadth_first_search, grafo, uniform_cost_search)
+from servidor import ServidorBusquedas
+
+
+def es(objetivo):
+    return lambda x: x == objetivo
+
+
+def correr(corutina_de):
+    async def principal():
+        servidor = ServidorBusquedas(procesos=1, ventana=0.05)
+        tcp = await servidor.iniciar(puerto=0)
+        try:
+            return await corutina_de(servidor, tcp.sockets[0].getsockname()[1])
+        finally:
+            await servidor.cerrar()
+    return asyncio.run(principal())
+
+
+def test_consultas_como_las_busquedas():
+    async def consultas(servidor, _):
+        return await asyncio.gather(servidor.consultar("CU", "A", "G"),
+                                    servidor.consultar("BPA", "A", "G"))
+
+    cu, bpa = correr(consultas)
+    ok, orden, ruta, costo = uniform_cost_search("A", es("G"))
+    assert cu == {"ok": ok, "orden": orden, "ruta": ruta, "costo": costo}
+    ok, orden, ruta = breadth_first_search("A", es("G"))
+    assert bpa == {"ok": ok, "orden": orden, "ruta": ruta}
+
+
+@pytest.mark.parametrize("algoritmo, inicio, objetivo", [
+    ("XX", "A", "G"),
+    ("CU", "Z", "G"),
+    ("CU", "A", "Z"),
+    ("CU", "A", ["G"]),
+    ("CU", {"A": 1}, "G"),
+])
+def test_consulta_invalida_no_entra_a_la_cola(algoritmo, inicio, objetivo):
+    async def consulta(servidor, _):
+        with pytest.raises(ValueError):
+            await servidor.consultar(algoritmo, inicio, objetivo)
+        return servidor._cola.qsize(), servidor.consultas
+
+    assert correr(consulta) == (0, 0)
+
+
+def test_lote_por_tcp_aisla_la_consulta_mala():
+    pedidos = [
+        {"id": 1, "algoritmo": "CU", "inicio": "A", "objetivo": "G"},
+        {"id": 2, "algoritmo": "CU", "inicio": "A", "objetivo": "Z"},
+        {"id": 3, "algoritmo": "BPA", "inicio": "B", "objetivo": "F"},
+    ]
+
+    async def cliente(_, puerto):
+        reader, writer = await asyncio.open_connection("127.0.0.1", puerto)
+        writer.write(b"".join(json.dumps(p).encode() + b"\n" for p in pedidos))
+        await writer.drain()
+        respuestas = [json.loads(await reader.readline()) for _ in pedidos]
+        writer.close()
+        return {r["id"]: r for r in respuestas}
+
+    respuestas = correr(cliente)
+    assert "error" in respuestas[2]
+    assert respuestas[1]["costo"] == uniform_cost_search("A", es("G"))[3]
+    assert respuestas[3]["ruta"] == breadth_first_search("B", es("F"))[2]
+
+
+def test_despacho_aisla_el_error_dentro_del_lote():
+    # Una consulta que falla en el pool solo rompe su propio futuro
+    async def lote(servidor, _):
+        loop = asyncio.get_running_loop()
+        consultas = [("CU", "A", "G"), ("CU", "A", ["G"]), ("BPA", "B", "F")]
+        futuros = [loop.create_future() for _ in consultas]
+        await servidor._despachar(list(zip(consultas, futuros)))
+        return [f.exception() or f.result() for f in futuros]
+
+    bueno1, malo, bueno3 = correr(lote)
+    assert isinstance(malo, TypeError)
+    assert bueno1 == uniform_cost_search("A", es("G"))
+    assert bueno3 == breadth_first_search("B", es("F"))
+
+
+def test_resolver_bloque_aislado():
+    iniciar_trabajador(grafo)
+    resultados = resolver_bloque_aislado([("CU", "A", "G"), ("XX", "A", "G")])
+    assert resultados[0] == uniform_cost_search("A", es("G"))
+    assert isinstance(resultados[1], ValueError)
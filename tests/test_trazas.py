@@ -0,0 +1,71 @@
+# ------------------------------------------------------------
+# Trazas: eventos de bpa / bpp / cu y narración en consola
+# ------------------------------------------------------------
+
+import io
+
+import pytest
+
+import Opcion2
+from trazas import Traza, TrazaConsola
+
+
+class TrazaRegistro(Traza):
+    def __init__(self):
+        self.eventos = []
+
+    def on_start(self, algoritmo, grafo, inicio, objetivo):
+        self.grafo = grafo
+        self.eventos.append(("start", algoritmo))
+
+    def on_dequeue(self, nodo, costo, frontera, parent):
+        self.eventos.append(("dequeue", self.grafo.etiquetas[nodo]))
+
+    def on_enqueue(self, nodo, costo, padre):
+        self.eventos.append(("enqueue", self.grafo.etiquetas[nodo]))
+
+    def on_expand(self, nodo):
+        self.eventos.append(("expand", self.grafo.etiquetas[nodo]))
+
+    def on_goal(self, nodo, costo, ruta, orden_visita):
+        self.eventos.append(("goal", self.grafo.etiquetas[nodo]))
+
+    def on_fail(self, orden_visita):
+        self.eventos.append(("fail",))
+
+
+ALGORITMOS = {"BPA": Opcion2.bpa, "BPP": Opcion2.bpp, "CU": Opcion2.cu}
+
+
+@pytest.mark.parametrize("nombre", sorted(ALGORITMOS))
+def test_traza_no_cambia_el_resultado(nombre):
+    algoritmo = ALGORITMOS[nombre]
+    grafo = Opcion2.crear_grafo()
+    traza = TrazaRegistro()
+    assert algoritmo(grafo, "A", "G", traza=traza) == algoritmo(grafo, "A", "G")
+
+    eventos = traza.eventos
+    assert eventos[0] == ("start", nombre)
+    assert eventos[-1] == ("goal", "G")
+    # Cada expansión cierra un paso que empezó con on_dequeue del mismo nodo
+    visitado = None
+    for evento in eventos[1:-1]:
+        if evento[0] == "dequeue":
+            visitado = evento[1]
+        elif evento[0] == "expand":
+            assert evento[1] == visitado
+
+
+def test_traza_sin_objetivo():
+    grafo = {"A": [("B", 1)], "B": [("A", 1)], "C": []}
+    traza = TrazaRegistro()
+    assert Opcion2.bpa(grafo, "A", "C", traza=traza)[0] is None
+    assert traza.eventos[-1] == ("fail",)
+
+
+@pytest.mark.parametrize("nombre", sorted(ALGORITMOS))
+def test_traza_consola(nombre):
+    salida = io.StringIO()
+    ALGORITMOS[nombre](Opcion2.crear_grafo(), "A", "G", traza=TrazaConsola(salida))
+    texto = salida.getvalue()
+    assert "PROCESO DE BÚSQUEDA" in texto and "OBJETIVO ENCONTRADO EN G" in texto
@@ -0,0 +1,171 @@
+# ------------------------------------------------------------
+# Trazas (eventos) de los algoritmos de Opcion2 (BPA, BPP, CU)
+# - Los algoritmos no imprimen nada: emiten eventos a un objeto
+#   `traza` (on_start, on_dequeue, on_enqueue, on_expand, on_goal,
+#   on_fail) solo si se les pasó uno. Con traza=None el costo es un
+#   `if` por evento: sin f-strings ni I/O en el ciclo principal.
+# - TrazaConsola reproduce la narración paso a paso del taller.
+#
+# Orden de eventos en cada paso:
+#   on_dequeue -> on_goal                  (si es el objetivo)
+#   on_dequeue -> on_enqueue* -> on_expand (si no lo es)
+# Los nodos llegan como IDs del GrafoCSR recibido en on_start.
+# ------------------------------------------------------------
+
+import heapq
+
+from red_social_busqueda import reconstruir_ruta
+
+
+class Traza:
+    """Interfaz de eventos. Todas las operaciones son no-op: se heredan
+    y se redefinen solo las que interesan."""
+
+    def on_start(self, algoritmo, grafo, inicio, objetivo):
+        """Comienza la búsqueda. algoritmo: 'BPA', 'BPP' o 'CU'."""
+
+    def on_dequeue(self, nodo, costo, frontera, parent):
+        """
+        Se sacó `nodo` de la frontera y se marca como visitado.
+        `frontera` es el contenedor ya sin `nodo` (Cola, Pila, o en CU el
+        dict nodo -> mejor costo) y `parent` el mapa de padres.
+        """
+
+    def on_enqueue(self, nodo, costo, padre):
+        """`nodo` entró a la frontera (o mejoró su costo en CU) desde `padre`."""
+
+    def on_expand(self, nodo):
+        """Terminó la expansión de `nodo` (después de sus on_enqueue)."""
+
+    def on_goal(self, nodo, costo, ruta, orden_visita):
+        """Se encontró el objetivo. `ruta` es la lista de IDs desde el inicio."""
+
+    def on_fail(self, orden_visita):
+        """La frontera se vació sin encontrar el objetivo."""
+
+
+_ENCABEZADOS = {
+    'BPA': (
+        "BÚSQUEDA PRIMERO EN ANCHURA (BPA)",
+        "- Estructura: Cola FIFO (First In, First Out)",
+        "- Estrategia: Expandir el nodo MENOS profundo",
+        "- Orden de encolado: Lexicográfico (A, B, C, ...)",
+    ),
+    'BPP': (
+        "BÚSQUEDA PRIMERO EN PROFUNDIDAD (BPP)",
+        "- Estructura: Pila LIFO (Last In, First Out)",
+        "- Estrategia: Expandir el nodo MÁS profundo",
+        "- Orden de apilado: Lexicográfico INVERSO (para que salgan en orden)",
+    ),
+    'CU': (
+        "BÚSQUEDA DE COSTO UNIFORME (CU)",
+        "- Estructura: Cola de prioridad ordenada por COSTO g(n)",
+        "- Estrategia: Expandir el nodo de MENOR COSTO acumulado",
+        "- Orden: Por costo acumulado (desempate lexicográfico)",
+    ),
+}
+
+
+class TrazaConsola(Traza):
+    """Narración paso a paso en consola (la salida original del taller)."""
+
+    def __init__(self, salida=None):
+        self.salida = salida  # archivo destino (None = stdout)
+
+    def _print(self, *args, **kwargs):
+        print(*args, file=self.salida, **kwargs)
+
+    def on_start(self, algoritmo, grafo, inicio, objetivo):
+        self.algoritmo = algoritmo
+        self.grafo = grafo
+        self.etq = grafo.etiquetas
+        self.paso = 0
+        self.agregados = []
+
+        titulo, *caracteristicas = _ENCABEZADOS[algoritmo]
+        self._print("\n" + "="*70)
+        self._print(f"ALGORITMO: {titulo}")
+        self._print("="*70)
+        self._print("\nCARACTERÍSTICAS:")
+        for linea in caracteristicas:
+            self._print(linea)
+        self._print("\n" + "-"*70)
+        self._print("\nPROCESO DE BÚSQUEDA:\n")
+
+    def on_dequeue(self, nodo, costo, frontera, parent):
+        etq = self.etq
+        self.paso += 1
+        self.agregados = []
+        nombre = etq[nodo]
+        camino = ' → '.join(self.grafo.etiquetar(reconstruir_ruta(parent, nodo)))
+
+        # Estado de la frontera antes de sacar el nodo
+        self._print(f"Paso {self.paso}:")
+        if self.algoritmo == 'BPA':
+            self._print(f"  Cola: {[nombre] + self.grafo.etiquetar(frontera)}")
+            self._print(f"  → Decolando: {nombre}")
+            self._print(f"  → Camino hasta {nombre}: {camino}")
+        elif self.algoritmo == 'BPP':
+            self._print(f"  Pila: {self.grafo.etiquetar(frontera) + [nombre]}")
+            self._print(f"  → Desapilando y visitando: {nombre}")
+            self._print(f"  → Camino hasta {nombre}: {camino}")
+        else:
+            pendientes = [(c, n) for n, c in frontera.items()] + [(costo, nodo)]
+            self._print(f"  Cola de prioridad:")
+            for c, n in heapq.nsmallest(5, pendientes):  # Mostrar primeros 5
+                self._print(f"    {etq[n]}({c})", end=" ")
+            if len(pendientes) > 5:
+                self._print(f"... ({len(pendientes)-5} más)")
+            else:
+                self._print()
+            self._print(f"  → Expandiendo: {nombre} con costo acumulado g({nombre})={costo}")
+            self._print(f"  → Camino: {camino}")
+        self._print(f"  → Nodo visitado: {nombre}")
+
+    def on_enqueue(self, nodo, costo, padre):
+        if self.algoritmo == 'CU':
+            self.agregados.append(f"{self.etq[nodo]}({costo})")
+        else:
+            self.agregados.append(self.etq[nodo])
+
+    def on_expand(self, nodo):
+        if self.agregados:
+            if self.algoritmo == 'BPA':
+                self._print(f"  → Encolando vecinos: {self.agregados}")
+            elif self.algoritmo == 'BPP':
+                self._print(f"  → Apilando vecinos (orden inverso): {list(reversed(self.agregados))}")
+            else:
+                self._print(f"  → Agregando vecinos: {', '.join(self.agregados)}")
+        self._print()
+
+    def on_goal(self, nodo, costo, ruta, orden_visita):
+        camino = self.grafo.etiquetar(ruta)
+        self._print(f"\n  ✓ ¡OBJETIVO ENCONTRADO EN {self.etq[nodo]}!")
+        self._print("-"*70)
+        self._print("\nRESULTADO:")
+        self._print(f"  Orden de visita: {' → '.join(orden_visita)}")
+        if self.algoritmo == 'BPA':
+            self._print(f"  Ruta más corta: {' → '.join(camino)}")
+            self._print(f"  Número de pasos: {len(camino) - 1}")
+            self._print(f"  Costo total (unitario): {len(camino) - 1}")
+        elif self.algoritmo == 'BPP':
+            self._print(f"  Ruta encontrada: {' → '.join(camino)}")
+            self._print(f"  Número de pasos: {len(camino) - 1}")
+            self._print(f"  NOTA: Esta NO es necesariamente la ruta más corta")
+        else:
+            self._print(f"  Ruta de menor costo: {' → '.join(camino)}")
+            self._print(f"  Número de pasos: {len(camino) - 1}")
+            self._print(f"  Costo total óptimo: {costo}")
+
+            # Mostrar desglose de costos
+            self._print(f"\n  Desglose de costos:")
+            costo_parcial = 0
+            for i in range(len(ruta) - 1):
+                # Costo de la arista (búsqueda binaria en la fila CSR)
+                costo_arista = self.grafo.costo(ruta[i], ruta[i+1])
+                costo_parcial += costo_arista
+                self._print(f"    {camino[i]} → {camino[i+1]}: {costo_arista} (acumulado: {costo_parcial})")
+
+    def on_fail(self, orden_visita):
+        self._print("\n✗ No se encontró camino al objetivo")
+        self._print("-"*70)